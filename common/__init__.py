@@ -0,0 +1 @@
+"""플랫폼 공통 인프라 (YouTube / TikTok / Instagram 수집기가 함께 사용)"""
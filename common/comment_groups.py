@@ -0,0 +1,67 @@
+"""
+비디오(게시물)별 댓글 그룹 분할 (댓글 요약 입력용)
+
+댓글 요약은 그룹마다 댓글 전체를 to_dict('records')로 바꾼 뒤 파이썬에서 좋아요 순으로 정렬하고
+상위 100개만 사용했습니다. 10만 건 이상의 병합 데이터셋에서는 사용하지 않을 댓글까지 dict로 만드는 비용이 커집니다.
+
+iter_comment_groups()는 댓글 DataFrame을 한 번만 정렬(그룹 → 좋아요 내림차순)해서
+그룹 경계를 계산하고, 그룹마다 상위 max_comments개 행만 dict로 바꿔 순서대로 내보냅니다.
+
+사용법:
+    for video_id, total_comments, top_comments in iter_comment_groups(comments_df, 'video_id'):
+        summary = summarizer.summarize_comments_for_video(top_comments, total_comments=total_comments)
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def iter_comment_groups(comments_df, key='video_id', max_comments=100, like_column='like_count'):
+    """
+    key별 댓글 그룹을 (key 값, 전체 댓글 수, 좋아요 상위 댓글 dict 리스트)로 순서대로 생성
+
+    그룹 순서는 groupby(key)와 같고(key 오름차순), 좋아요 수가 같은 댓글은 원래 순서를 유지합니다.
+    key가 비어 있는 댓글은 제외합니다.
+
+    Args:
+        comments_df (pd.DataFrame): 댓글 DataFrame
+        key (str): 그룹 컬럼 (예: 'video_id', 'post_id')
+        max_comments (int): 그룹마다 넘길 최대 댓글 수 (None이면 전부)
+        like_column (str): 정렬 기준 컬럼 (없으면 원래 순서)
+
+    Yields:
+        tuple: (key 값, 전체 댓글 수, 상위 댓글 dict 리스트)
+    """
+    if comments_df is None or comments_df.empty:
+        return
+
+    codes, uniques = pd.factorize(comments_df[key], sort=True)
+    valid = codes >= 0
+    if like_column in comments_df:
+        likes = pd.to_numeric(comments_df[like_column], errors='coerce').fillna(0).to_numpy(dtype='float64')
+    else:
+        likes = np.zeros(len(comments_df))
+
+    # 그룹 코드 오름차순 → 좋아요 내림차순 (lexsort는 안정 정렬이므로 동점은 원래 순서 유지)
+    positions = np.flatnonzero(valid)
+    order = positions[np.lexsort((-likes[positions], codes[positions]))]
+    sorted_codes = codes[order]
+
+    group_sizes = np.bincount(sorted_codes, minlength=len(uniques))
+    group_starts = np.concatenate(([0], np.cumsum(group_sizes)[:-1]))
+
+    # 그룹 안 순위가 max_comments 미만인 행만 dict로 변환
+    if max_comments is not None:
+        rank_in_group = np.arange(len(order)) - group_starts[sorted_codes]
+        keep = rank_in_group < max_comments
+        order = order[keep]
+        kept_sizes = np.minimum(group_sizes, max_comments)
+    else:
+        kept_sizes = group_sizes
+
+    records = comments_df.iloc[order].to_dict('records')
+
+    start = 0
+    for group_value, total, kept in zip(uniques, group_sizes.tolist(), kept_sizes.tolist()):
+        yield group_value, total, records[start:start + kept]
+        start += kept
@@ -0,0 +1,137 @@
+"""
+PostgreSQL 연결 풀 (프로세스 전체 공유)
+
+DB 매니저(YouTube/TikTok/Instagram)와 KeywordManager가 connect()마다 새 연결을 만들고
+create_tables()로 DDL을 다시 보내면, 키워드 하나를 처리할 때마다 연결 수립(TCP + 인증)과
+CREATE TABLE IF NOT EXISTS 왕복이 여러 번 반복됩니다.
+
+- 같은 접속 정보에 대해 ThreadedConnectionPool 하나를 프로세스 안에서 공유하고
+  connect()/disconnect()는 풀에서 연결을 빌리고 돌려주기만 합니다.
+- 스키마 생성은 이름(예: 'youtube')별로 프로세스당 한 번만 실행합니다.
+- 프로세스 종료 시 모든 풀을 닫습니다.
+
+환경 변수:
+    POSTGRES_POOL_MIN_CONN  풀이 유지하는 최소 연결 수 (기본 1)
+    POSTGRES_POOL_MAX_CONN  풀의 최대 연결 수 (기본 10)
+
+사용법:
+    from common.db_pool import get_connection, release_connection
+    conn = get_connection(self.connection_params)
+    ...
+    release_connection(self.connection_params, conn)
+"""
+
+import os
+import atexit
+import threading
+
+DEFAULT_POOL_MIN_CONN = 1
+DEFAULT_POOL_MAX_CONN = 10
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+_created_schemas = set()
+_schema_lock = threading.Lock()
+
+
+def _pool_key(connection_params):
+    """접속 정보 → 풀 키"""
+    return tuple(sorted((name, str(value)) for name, value in connection_params.items()))
+
+
+def max_pool_connections():
+    """
+    풀 하나의 최대 연결 수 (POSTGRES_POOL_MAX_CONN)
+
+    최대 연결 수를 넘게 빌리면 getconn()이 PoolError를 발생시키므로,
+    연결을 동시에 여러 개 쓰는 실행(batch_collect.py --workers 등)은 시작할 때 이 값과 비교합니다.
+
+    Returns:
+        int: 최대 연결 수
+    """
+    return int(os.environ.get('POSTGRES_POOL_MAX_CONN', DEFAULT_POOL_MAX_CONN))
+
+
+def get_pool(connection_params):
+    """
+    접속 정보에 해당하는 공용 풀 (처음 호출 시 생성)
+
+    Args:
+        connection_params (dict): psycopg2.connect 인자 (host, port, user, password, dbname)
+
+    Returns:
+        psycopg2.pool.ThreadedConnectionPool
+    """
+    from psycopg2 import pool
+
+    key = _pool_key(connection_params)
+    with _pools_lock:
+        connection_pool = _pools.get(key)
+        if connection_pool is None or connection_pool.closed:
+            connection_pool = pool.ThreadedConnectionPool(
+                int(os.environ.get('POSTGRES_POOL_MIN_CONN', DEFAULT_POOL_MIN_CONN)),
+                max_pool_connections(),
+                **connection_params
+            )
+            _pools[key] = connection_pool
+        return connection_pool
+
+
+def get_connection(connection_params):
+    """
+    풀에서 연결 하나를 빌림 (끊어진 연결은 버리고 다시 받음)
+
+    Args:
+        connection_params (dict): psycopg2.connect 인자
+
+    Returns:
+        psycopg2 connection
+    """
+    connection_pool = get_pool(connection_params)
+    conn = connection_pool.getconn()
+    if conn.closed:
+        connection_pool.putconn(conn, close=True)
+        conn = connection_pool.getconn()
+    return conn
+
+
+def release_connection(connection_params, conn):
+    """
+    빌린 연결을 풀에 반환 (진행 중인 트랜잭션은 풀이 rollback)
+
+    Args:
+        connection_params (dict): get_connection()에 사용한 접속 정보
+        conn: get_connection()이 반환한 연결
+    """
+    with _pools_lock:
+        connection_pool = _pools.get(_pool_key(connection_params))
+
+    if connection_pool is None or connection_pool.closed:
+        conn.close()
+        return
+    connection_pool.putconn(conn, close=bool(conn.closed))
+
+
+def is_schema_created(name):
+    """이 프로세스에서 name 스키마 생성이 이미 끝났는지 여부"""
+    with _schema_lock:
+        return name in _created_schemas
+
+
+def mark_schema_created(name):
+    """name 스키마 생성 완료 표시 (이후 create_tables()는 DDL을 보내지 않음)"""
+    with _schema_lock:
+        _created_schemas.add(name)
+
+
+def close_all_pools():
+    """모든 풀의 연결 종료 (프로세스 종료 시 자동 호출)"""
+    with _pools_lock:
+        for connection_pool in _pools.values():
+            if not connection_pool.closed:
+                connection_pool.closeall()
+        _pools.clear()
+
+
+atexit.register(close_all_pools)
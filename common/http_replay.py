@@ -0,0 +1,292 @@
+"""
+HTTP 녹화/재생 전송 계층
+
+수집기 성능 측정은 실제 API를 호출해야 해서 할당량과 네트워크 지연에 묶여 있습니다.
+한 번 실제 호출을 JSONL 파일(요청 → 응답 한 줄)로 녹화해 두면,
+이후에는 같은 요청에 녹화된 응답을 돌려주어 네트워크 없이 전체 파이프라인을 반복 실행할 수 있습니다.
+
+- requests 기반 클라이언트(TikTok, Instagram): create_session()이 반환하는 Session 사용
+- googleapiclient(YouTube): create_google_http()가 반환하는 httplib2.Http 호환 객체를 build(http=...)에 전달
+
+환경 변수:
+    HTTP_REPLAY_MODE        off(기본) | record | replay
+    HTTP_REPLAY_FILE        JSONL 파일 경로 (기본: data/http_replay/recording.jsonl)
+    HTTP_REPLAY_LATENCY_MS  재생 시 응답마다 지연(ms) 또는 'recorded'(녹화 당시 소요 시간 재현)
+
+요청 키는 메서드 + URL + 정렬된 쿼리 파라미터(+ 본문)이며, API 키 파라미터(key, api_key 등)와
+요청 헤더는 저장하지 않습니다. 같은 요청이 여러 번 녹화되면 녹화 순서대로 재생하고,
+모두 소진되면 마지막 응답을 반복합니다.
+
+사용법:
+    HTTP_REPLAY_MODE=record python youtube_brand_analyzer/pipeline_youtube_analysis.py --keyword "Samsung TV" --max-videos 5
+    HTTP_REPLAY_MODE=replay HTTP_REPLAY_LATENCY_MS=recorded python youtube_brand_analyzer/pipeline_youtube_analysis.py --keyword "Samsung TV" --max-videos 5
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+MODE_OFF = 'off'
+MODE_RECORD = 'record'
+MODE_REPLAY = 'replay'
+
+DEFAULT_REPLAY_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'data', 'http_replay', 'recording.jsonl'
+)
+
+# 키에서 제외할 인증 관련 쿼리 파라미터 (소문자 비교)
+SECRET_PARAM_NAMES = {'key', 'api_key', 'apikey', 'access_token', 'token'}
+
+
+class ReplayMissError(Exception):
+    """재생 모드에서 녹화되지 않은 요청을 만난 경우"""
+    pass
+
+
+def get_replay_mode():
+    """HTTP_REPLAY_MODE 환경 변수 값 (off | record | replay)"""
+    mode = os.environ.get('HTTP_REPLAY_MODE', MODE_OFF).strip().lower() or MODE_OFF
+    if mode not in (MODE_OFF, MODE_RECORD, MODE_REPLAY):
+        raise ValueError(f"HTTP_REPLAY_MODE는 off, record, replay 중 하나여야 합니다: {mode}")
+    return mode
+
+
+def make_request_key(method, url, body=None):
+    """
+    녹화/재생 요청 키 생성
+
+    Args:
+        method (str): HTTP 메서드
+        url (str): 쿼리 문자열을 포함한 요청 URL
+        body (str|bytes): 요청 본문 (없으면 None)
+
+    Returns:
+        str: 정규화된 요청 키 (API 키 파라미터 제외, 파라미터 정렬)
+    """
+    parts = urlsplit(url)
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if name.lower() not in SECRET_PARAM_NAMES)
+    key = f"{method.upper()} {urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))}"
+
+    if body:
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        key += f" body:{hashlib.sha256(body).hexdigest()}"
+    return key
+
+
+class HttpRecording:
+    """JSONL 녹화 파일 (스레드 안전)"""
+
+    def __init__(self, path, mode, latency=None):
+        """
+        Args:
+            path (str): JSONL 파일 경로
+            mode (str): MODE_RECORD 또는 MODE_REPLAY
+            latency (str): 재생 지연 (ms 숫자 문자열, 'recorded', 또는 None)
+        """
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._entries = {}      # request key -> [entry, ...]
+        self._positions = {}    # request key -> 다음에 재생할 인덱스
+        self.recorded_count = 0
+        self.replayed_count = 0
+
+        if mode == MODE_REPLAY:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"HTTP 녹화 파일이 없습니다: {path}")
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries.setdefault(entry['key'], []).append(entry)
+            print(f"[HTTP REPLAY] 재생 모드: {sum(len(v) for v in self._entries.values())}개 응답 로드 ({path})")
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            print(f"[HTTP REPLAY] 녹화 모드: {path}")
+
+    def record(self, key, status, headers, content, elapsed):
+        """
+        응답 한 건 녹화
+
+        Args:
+            key (str): make_request_key()로 만든 요청 키
+            status (int): HTTP 상태 코드
+            headers (dict): 응답 헤더
+            content (bytes): 응답 본문
+            elapsed (float): 요청 소요 시간 (초)
+        """
+        entry = {
+            'key': key,
+            'status': status,
+            'headers': {k: v for k, v in headers.items() if k.lower() not in ('content-encoding', 'transfer-encoding')},
+            'body': content.decode('utf-8', errors='replace'),
+            'elapsed_ms': round(elapsed * 1000, 1),
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+            self.recorded_count += 1
+
+    def replay(self, key):
+        """
+        요청 키에 해당하는 녹화 응답 반환 (설정에 따라 지연 후)
+
+        Args:
+            key (str): make_request_key()로 만든 요청 키
+
+        Returns:
+            dict: {'status', 'headers', 'body', 'elapsed_ms'}
+
+        Raises:
+            ReplayMissError: 녹화되지 않은 요청인 경우
+        """
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise ReplayMissError(f"녹화되지 않은 요청입니다: {key}")
+            position = self._positions.get(key, 0)
+            entry = entries[min(position, len(entries) - 1)]
+            self._positions[key] = position + 1
+            self.replayed_count += 1
+
+        if self.latency == 'recorded':
+            time.sleep(entry.get('elapsed_ms', 0) / 1000)
+        elif self.latency:
+            time.sleep(float(self.latency) / 1000)
+        return entry
+
+
+_recording = None
+_recording_lock = threading.Lock()
+
+
+def get_recording():
+    """
+    환경 변수 설정에 따른 프로세스 공용 녹화 파일
+
+    Returns:
+        HttpRecording: 녹화/재생 모드일 때 (off이면 None)
+    """
+    global _recording
+
+    mode = get_replay_mode()
+    if mode == MODE_OFF:
+        return None
+
+    with _recording_lock:
+        if _recording is None:
+            _recording = HttpRecording(
+                os.environ.get('HTTP_REPLAY_FILE') or DEFAULT_REPLAY_FILE,
+                mode,
+                latency=os.environ.get('HTTP_REPLAY_LATENCY_MS') or None
+            )
+        return _recording
+
+
+# ---------------------------------------------------------------------------
+# requests 전송 계층 (TikTok, Instagram)
+# ---------------------------------------------------------------------------
+
+def create_session():
+    """
+    requests Session 생성 (녹화/재생 모드이면 해당 어댑터 장착)
+
+    Returns:
+        requests.Session: session.get(...)을 requests.get(...) 대신 사용
+    """
+    import requests
+    from requests.adapters import BaseAdapter, HTTPAdapter
+    from requests.structures import CaseInsensitiveDict
+
+    session = requests.Session()
+    recording = get_recording()
+    if recording is None:
+        return session
+
+    class RecordingAdapter(HTTPAdapter):
+        """실제 요청을 보내고 응답을 녹화"""
+
+        def send(self, request, **kwargs):
+            started = time.time()
+            response = super().send(request, **kwargs)
+            recording.record(make_request_key(request.method, request.url, request.body),
+                             response.status_code, dict(response.headers), response.content,
+                             time.time() - started)
+            return response
+
+    class ReplayAdapter(BaseAdapter):
+        """네트워크 없이 녹화된 응답 반환"""
+
+        def send(self, request, **kwargs):
+            entry = recording.replay(make_request_key(request.method, request.url, request.body))
+            response = requests.Response()
+            response.status_code = entry['status']
+            response.headers = CaseInsensitiveDict(entry['headers'])
+            response._content = entry['body'].encode('utf-8')
+            response.encoding = 'utf-8'
+            response.url = request.url
+            response.request = request
+            return response
+
+        def close(self):
+            pass
+
+    adapter = RecordingAdapter() if recording.mode == MODE_RECORD else ReplayAdapter()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# ---------------------------------------------------------------------------
+# httplib2 전송 계층 (googleapiclient)
+# ---------------------------------------------------------------------------
+
+def create_google_http():
+    """
+    googleapiclient용 httplib2.Http 호환 객체 생성
+
+    Returns:
+        녹화/재생 모드이면 build(http=...)에 넘길 객체, off이면 None (기본 전송 계층 사용)
+    """
+    recording = get_recording()
+    if recording is None:
+        return None
+
+    import httplib2
+
+    if recording.mode == MODE_RECORD:
+        class RecordingHttp(httplib2.Http):
+            """실제 요청을 보내고 응답을 녹화"""
+
+            def request(self, uri, method='GET', body=None, headers=None, *args, **kwargs):
+                started = time.time()
+                response, content = super().request(uri, method, body, headers, *args, **kwargs)
+                recording.record(make_request_key(method, uri, body), response.status,
+                                 {k: v for k, v in response.items()
+                                  if k not in ('status', '-content-encoding', 'content-location')},
+                                 content, time.time() - started)
+                return response, content
+
+        return RecordingHttp()
+
+    class ReplayHttp:
+        """네트워크 없이 녹화된 응답 반환"""
+
+        def request(self, uri, method='GET', body=None, headers=None, *args, **kwargs):
+            entry = recording.replay(make_request_key(method, uri, body))
+            response = httplib2.Response(dict(entry['headers'], status=str(entry['status'])))
+            return response, entry['body'].encode('utf-8')
+
+        def close(self):
+            pass
+
+    return ReplayHttp()
@@ -0,0 +1,320 @@
+"""
+LLM 응답 캐시 (내용 주소 기반 SQLite, 프로세스 공용)
+
+재실행/백필(update_existing_videos_content.py 등)은 같은 제목/설명, 다음 날 다시 수집된 같은 댓글에 대해
+OpenAI를 다시 호출해 토큰과 시간을 씁니다. create_chat_completion()이 요청마다
+
+    키 = sha256(model, prompt_version, 요청 인자 전체(messages, temperature, max_tokens, ...))
+
+로 응답 본문을 찾아, 같은 입력이면 API를 호출하지 않고 저장된 응답을 돌려줍니다.
+입력 텍스트나 프롬프트 문구가 바뀌면 messages가 달라지므로 자동으로 다른 키가 되고,
+분석기의 PROMPT_VERSION을 올리면 같은 프롬프트의 이전 응답도 버릴 수 있습니다.
+
+- 끝까지 생성된 응답(finish_reason='stop')만 저장합니다. 응답을 파싱하지 못한 호출자는
+  discard_cached_completion(response)로 그 항목을 지웁니다 (common/openai_limiter.py).
+- 보관 기간(LLM_CACHE_TTL_DAYS)이 지난 항목과, 최대 항목 수(LLM_CACHE_MAX_ENTRIES)를 넘는
+  오래 사용되지 않은 항목부터 삭제합니다 (시작 시 + 일정 횟수 저장마다).
+- 적중/미적중/절약한 토큰 수를 RunMetrics counter(cache_hits/cache_misses, cache='llm',
+  openai_tokens_saved)로 기록합니다.
+
+환경 변수:
+    LLM_CACHE_PATH         SQLite 파일 경로 (기본 data/cache/llm_responses.sqlite3)
+    LLM_CACHE_TTL_DAYS     보관 기간 (기본 30일, 0이면 캐시 사용 안 함)
+    LLM_CACHE_MAX_ENTRIES  최대 항목 수 (기본 200000)
+
+사용법:
+    from common.openai_limiter import create_chat_completion
+    response = create_chat_completion(self.client, prompt_version=self.PROMPT_VERSION, model=..., messages=[...])
+
+    from common.llm_cache import get_llm_cache
+    print(get_llm_cache().get_stats())
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from types import SimpleNamespace
+
+from common.run_metrics import get_run_metrics
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'data', 'cache', 'llm_responses.sqlite3'
+)
+DEFAULT_TTL_DAYS = 30
+DEFAULT_MAX_ENTRIES = 200000
+
+# put()이 이 횟수만큼 호출될 때마다 보관 기간/최대 항목 수 기준 정리
+EVICT_EVERY_PUTS = 500
+
+
+def cached_completion(content, model, finish_reason=None):
+    """
+    캐시된 본문을 ChatCompletion과 같은 모양(choices[0].message.content, usage)으로 감싼 객체
+
+    캐시 적중은 토큰을 쓰지 않으므로 usage는 모두 0입니다.
+    """
+    return SimpleNamespace(
+        id=None,
+        model=model,
+        cached=True,
+        choices=[SimpleNamespace(
+            index=0,
+            finish_reason=finish_reason,
+            message=SimpleNamespace(role='assistant', content=content),
+        )],
+        usage=SimpleNamespace(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+    )
+
+
+class LLMResponseCache:
+    """(model, prompt_version, 요청 인자) 해시 기준 LLM 응답 캐시"""
+
+    def __init__(self, db_path=DEFAULT_CACHE_PATH, ttl_days=DEFAULT_TTL_DAYS, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        캐시 초기화
+
+        Args:
+            db_path (str): SQLite 파일 경로
+            ttl_days (float): 보관 기간 (0이면 캐시 사용 안 함)
+            max_entries (int): 최대 항목 수 (초과분은 마지막 사용 시각이 오래된 것부터 삭제)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+        self.conn = None
+
+        if not self.enabled:
+            return
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # 여러 수집 프로세스가 같은 파일을 공유할 수 있도록 WAL + 잠금 대기
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT,
+                prompt_version TEXT,
+                content BLOB NOT NULL,
+                finish_reason TEXT,
+                prompt_tokens INTEGER NOT NULL DEFAULT 0,
+                completion_tokens INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL,
+                hit_count INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses(last_used_at)"
+        )
+        self.conn.commit()
+        self.evict()
+
+    @property
+    def enabled(self):
+        """캐시 사용 여부"""
+        return self.ttl_seconds > 0
+
+    @staticmethod
+    def make_key(model, prompt_version, request):
+        """
+        요청으로 캐시 키 생성
+
+        Args:
+            model (str): 모델 이름
+            prompt_version (str): 프롬프트 템플릿 버전 (예: 'comment_summary/1')
+            request (dict): chat.completions.create 인자 (model 제외)
+
+        Returns:
+            str: 캐시 키 (sha256)
+        """
+        raw = json.dumps(
+            {'model': model, 'prompt_version': prompt_version, 'request': request},
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, cache_key, prompt_version=None):
+        """
+        캐시된 응답 조회
+
+        Args:
+            cache_key (str): make_key() 결과
+            prompt_version (str): 메트릭 라벨
+
+        Returns:
+            SimpleNamespace: cached_completion() 객체 (없거나 보관 기간이 지났으면 None)
+        """
+        if not self.enabled:
+            return None
+
+        metrics = get_run_metrics()
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT model, content, finish_reason, prompt_tokens, completion_tokens FROM llm_responses "
+                "WHERE cache_key = ? AND created_at >= ?",
+                (cache_key, now - self.ttl_seconds)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                metrics.increment('cache_misses', cache='llm', prompt=prompt_version)
+                return None
+
+            self.conn.execute(
+                "UPDATE llm_responses SET last_used_at = ?, hit_count = hit_count + 1 WHERE cache_key = ?",
+                (now, cache_key)
+            )
+            self.conn.commit()
+
+            model, content, finish_reason, prompt_tokens, completion_tokens = row
+            self.hits += 1
+            self.tokens_saved += prompt_tokens + completion_tokens
+
+        metrics.increment('cache_hits', cache='llm', prompt=prompt_version)
+        metrics.increment('openai_tokens_saved', prompt_tokens + completion_tokens, model=model)
+        return cached_completion(zlib.decompress(content).decode('utf-8'), model, finish_reason)
+
+    def put(self, cache_key, response, model=None, prompt_version=None):
+        """
+        API 응답 저장 (본문이 없거나 끝까지 생성되지 않은 응답은 저장하지 않음)
+
+        max_tokens에서 잘렸거나(length) 필터된(content_filter) 응답을 저장하면
+        같은 요청이 보관 기간 동안 계속 잘린 응답을 받게 됩니다.
+
+        Args:
+            cache_key (str): make_key() 결과
+            response (ChatCompletion): chat.completions.create 응답
+            model (str): 모델 이름
+            prompt_version (str): 프롬프트 템플릿 버전
+        """
+        if not self.enabled or not getattr(response, 'choices', None):
+            return
+
+        choice = response.choices[0]
+        content = getattr(choice.message, 'content', None)
+        if content is None or getattr(choice, 'finish_reason', None) != 'stop':
+            return
+
+        usage = getattr(response, 'usage', None)
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(cache_key, model, prompt_version, content, finish_reason, prompt_tokens, completion_tokens, "
+                " created_at, last_used_at, hit_count) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                (cache_key, model, prompt_version, zlib.compress(content.encode('utf-8')),
+                 getattr(choice, 'finish_reason', None),
+                 getattr(usage, 'prompt_tokens', 0) or 0, getattr(usage, 'completion_tokens', 0) or 0,
+                 now, now)
+            )
+            self.conn.commit()
+            self._puts += 1
+            evict = self._puts % EVICT_EVERY_PUTS == 0
+
+        if evict:
+            self.evict()
+
+    def discard(self, cache_key):
+        """
+        캐시 항목 삭제 (호출자가 응답을 파싱하지 못한 경우)
+
+        Args:
+            cache_key (str): make_key() 결과
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self.conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (cache_key,))
+            self.conn.commit()
+        get_run_metrics().increment('cache_discards', cache='llm')
+
+    def evict(self):
+        """
+        보관 기간이 지난 항목 삭제 후, 최대 항목 수를 넘으면 마지막 사용 시각이 오래된 것부터 삭제
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+        if not self.enabled:
+            return 0
+
+        with self._lock:
+            expired = self.conn.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            ).rowcount
+
+            overflow = self.conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0] - self.max_entries
+            evicted = 0
+            if overflow > 0:
+                evicted = self.conn.execute(
+                    "DELETE FROM llm_responses WHERE cache_key IN ("
+                    "SELECT cache_key FROM llm_responses ORDER BY last_used_at LIMIT ?)",
+                    (overflow,)
+                ).rowcount
+            self.conn.commit()
+
+        get_run_metrics().increment('cache_evictions', expired + evicted, cache='llm')
+        return expired + evicted
+
+    def get_stats(self):
+        """
+        캐시 적중 통계 (이 프로세스 기준) + 저장된 항목 수
+
+        Returns:
+            dict: {'hits', 'misses', 'hit_rate', 'tokens_saved', 'entries'}
+        """
+        entries = 0
+        if self.enabled:
+            with self._lock:
+                entries = self.conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total * 100, 1) if total else 0.0,
+            'tokens_saved': self.tokens_saved,
+            'entries': entries,
+        }
+
+    def close(self):
+        """SQLite 연결 종료"""
+        with self._lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache():
+    """
+    프로세스 공용 LLM 응답 캐시 (처음 호출 시 환경 변수 값으로 생성)
+
+    Returns:
+        LLMResponseCache
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache(
+                db_path=os.environ.get('LLM_CACHE_PATH', DEFAULT_CACHE_PATH),
+                ttl_days=float(os.environ.get('LLM_CACHE_TTL_DAYS', DEFAULT_TTL_DAYS)),
+                max_entries=int(os.environ.get('LLM_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES)),
+            )
+        return _cache
@@ -0,0 +1,326 @@
+"""
+OpenAI 호출 공용 속도 제한기 (프로세스 전체 공유 token bucket)
+
+분석기마다 고정 sleep(2초, 10개마다 10초)으로 속도를 맞추면 실제 계정 한도와 무관하게
+초당 0.3회 정도로 묶이고, 여러 스레드/분석기가 동시에 호출하면 반대로 한도를 넘길 수 있습니다.
+모든 OpenAI 호출을 create_chat_completion()으로 보내면 하나의 limiter가
+
+- 분당 요청 수(RPM)와 분당 토큰 수(TPM) 두 개의 token bucket으로 호출 전에 대기하고
+- 응답 헤더(x-ratelimit-limit-*, x-ratelimit-remaining-*)로 한도와 남은 양을 갱신하며
+- 429(RateLimitError)를 받으면 모든 호출자를 함께 지수 백오프시킵니다.
+
+같은 요청은 공용 LLM 응답 캐시(common/llm_cache.py)에서 먼저 찾으므로 limiter를 거치지 않습니다.
+
+환경 변수 (응답 헤더를 받기 전 초기값):
+    OPENAI_RPM_LIMIT  분당 요청 수 (기본 500)
+    OPENAI_TPM_LIMIT  분당 토큰 수 (기본 200000)
+
+사용법:
+    from common.openai_limiter import create_chat_completion, discard_cached_completion
+    response = create_chat_completion(self.client, model=self.model, messages=[...], max_tokens=200)
+    try:
+        result = json.loads(response.choices[0].message.content)
+    except ValueError:
+        discard_cached_completion(response)  # 파싱할 수 없는 응답은 다시 쓰지 않음
+        raise
+"""
+
+import os
+import re
+import time
+import threading
+
+from common.run_metrics import get_run_metrics
+from common.llm_cache import get_llm_cache
+
+DEFAULT_RPM_LIMIT = 500
+DEFAULT_TPM_LIMIT = 200000
+
+# 429 재시도 설정
+MAX_RATE_LIMIT_RETRIES = 5
+INITIAL_BACKOFF_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 60.0
+
+
+def _parse_reset(value):
+    """x-ratelimit-reset-* 값('1s', '6m0s', '20ms')을 초로 변환"""
+    if not value:
+        return None
+    total = 0.0
+    for amount, unit in re.findall(r'([\d.]+)(ms|h|m|s)', value):
+        total += float(amount) * {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}[unit]
+    return total
+
+
+def _retry_after(headers):
+    """429 응답 헤더에서 대기 시간(초) 추출 (retry-after → 소진된 bucket의 reset 값)"""
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        pass
+    if headers.get('x-ratelimit-remaining-requests') == '0':
+        return _parse_reset(headers.get('x-ratelimit-reset-requests'))
+    return _parse_reset(headers.get('x-ratelimit-reset-tokens'))
+
+
+def estimate_tokens(messages, max_tokens=None):
+    """
+    요청 토큰 수 추정 (문자 4개 ≈ 1토큰 + 응답 최대 토큰)
+
+    Args:
+        messages (list): chat messages
+        max_tokens (int): 응답 최대 토큰
+
+    Returns:
+        int: 추정 토큰 수
+    """
+    chars = sum(len(str(message.get('content', ''))) for message in messages or [])
+    return chars // 4 + (max_tokens or 256)
+
+
+class OpenAIRateLimiter:
+    """RPM/TPM token bucket + 응답 헤더 기반 보정 + 429 백오프"""
+
+    def __init__(self, requests_per_minute=DEFAULT_RPM_LIMIT, tokens_per_minute=DEFAULT_TPM_LIMIT):
+        """
+        Args:
+            requests_per_minute (int): 분당 요청 수 한도 (헤더를 받으면 갱신)
+            tokens_per_minute (int): 분당 토큰 수 한도 (헤더를 받으면 갱신)
+        """
+        self._lock = threading.Lock()
+        self.requests_per_minute = float(requests_per_minute)
+        self.tokens_per_minute = float(tokens_per_minute)
+        self._request_level = self.requests_per_minute
+        self._token_level = self.tokens_per_minute
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._backoff = INITIAL_BACKOFF_SECONDS
+
+        self.total_requests = 0
+        self.total_tokens = 0
+        self.total_wait_seconds = 0.0
+        self.rate_limit_hits = 0
+
+    def _refill(self, now):
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._request_level = min(self.requests_per_minute,
+                                  self._request_level + elapsed * self.requests_per_minute / 60)
+        self._token_level = min(self.tokens_per_minute,
+                                self._token_level + elapsed * self.tokens_per_minute / 60)
+
+    def acquire(self, estimated_tokens):
+        """
+        요청 하나와 estimated_tokens만큼의 용량이 생길 때까지 대기 후 차감
+
+        Args:
+            estimated_tokens (int): 이 요청의 추정 토큰 수
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                # 한 요청이 분당 한도보다 크면 가득 찬 bucket 하나로 취급
+                tokens_needed = min(estimated_tokens, self.tokens_per_minute)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    request_wait = (1 - self._request_level) * 60 / self.requests_per_minute
+                    token_wait = (tokens_needed - self._token_level) * 60 / self.tokens_per_minute
+                    wait = max(request_wait, token_wait, 0)
+
+                if wait <= 0:
+                    self._request_level -= 1
+                    self._token_level -= tokens_needed
+                    self.total_requests += 1
+                    self.total_wait_seconds += waited
+                    return
+
+            time.sleep(wait)
+            waited += wait
+
+    def record_usage(self, estimated_tokens, actual_tokens):
+        """
+        응답의 실제 사용 토큰으로 추정치 보정
+
+        Args:
+            estimated_tokens (int): acquire()에 사용한 추정치
+            actual_tokens (int): response.usage.total_tokens
+        """
+        with self._lock:
+            self._token_level += estimated_tokens - actual_tokens
+            self.total_tokens += actual_tokens
+            # 성공하면 백오프 초기화
+            self._backoff = INITIAL_BACKOFF_SECONDS
+
+    def update_from_headers(self, headers):
+        """
+        x-ratelimit-* 응답 헤더로 한도와 남은 용량 갱신
+
+        Args:
+            headers (Mapping): 응답 헤더
+        """
+        def header_number(name):
+            try:
+                return float(headers.get(name))
+            except (TypeError, ValueError):
+                return None
+
+        limit_requests = header_number('x-ratelimit-limit-requests')
+        limit_tokens = header_number('x-ratelimit-limit-tokens')
+        remaining_requests = header_number('x-ratelimit-remaining-requests')
+        remaining_tokens = header_number('x-ratelimit-remaining-tokens')
+
+        with self._lock:
+            self._refill(time.monotonic())
+            if limit_requests:
+                self.requests_per_minute = limit_requests
+            if limit_tokens:
+                self.tokens_per_minute = limit_tokens
+            # 다른 프로세스도 같은 계정을 쓰므로 서버가 알려준 남은 양이 더 적으면 따름
+            if remaining_requests is not None:
+                self._request_level = min(self._request_level, remaining_requests)
+            if remaining_tokens is not None:
+                self._token_level = min(self._token_level, remaining_tokens)
+
+    def back_off(self, retry_after=None):
+        """
+        429 응답 후 모든 호출자를 함께 대기시킴 (지수 백오프)
+
+        Args:
+            retry_after (float): 서버가 알려준 대기 시간 (초, 없으면 백오프 값 사용)
+
+        Returns:
+            float: 대기 시간 (초)
+        """
+        with self._lock:
+            delay = retry_after if retry_after else self._backoff
+            self._backoff = min(self._backoff * 2, MAX_BACKOFF_SECONDS)
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            self._request_level = min(self._request_level, 0)
+            self.rate_limit_hits += 1
+        return delay
+
+    def get_stats(self):
+        """
+        누적 통계
+
+        Returns:
+            dict: {'requests', 'tokens', 'wait_seconds', 'rate_limit_hits', 'rpm_limit', 'tpm_limit'}
+        """
+        with self._lock:
+            return {
+                'requests': self.total_requests,
+                'tokens': self.total_tokens,
+                'wait_seconds': round(self.total_wait_seconds, 1),
+                'rate_limit_hits': self.rate_limit_hits,
+                'rpm_limit': int(self.requests_per_minute),
+                'tpm_limit': int(self.tokens_per_minute),
+            }
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_openai_limiter():
+    """
+    프로세스 공용 limiter (처음 호출 시 환경 변수 값으로 생성)
+
+    Returns:
+        OpenAIRateLimiter
+    """
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = OpenAIRateLimiter(
+                requests_per_minute=int(os.environ.get('OPENAI_RPM_LIMIT', DEFAULT_RPM_LIMIT)),
+                tokens_per_minute=int(os.environ.get('OPENAI_TPM_LIMIT', DEFAULT_TPM_LIMIT)),
+            )
+        return _limiter
+
+
+def create_chat_completion(client, limiter=None, prompt_version=None, use_cache=True, **kwargs):
+    """
+    limiter를 거쳐 client.chat.completions.create(**kwargs) 호출
+
+    같은 (model, prompt_version, 요청 인자)의 응답이 LLM 캐시에 있으면 API를 호출하지 않고 돌려줍니다.
+    429를 받으면 limiter 전체를 백오프시키고 MAX_RATE_LIMIT_RETRIES번까지 재시도합니다.
+    그 밖의 예외는 그대로 전달합니다.
+
+    Args:
+        client (openai.OpenAI): OpenAI 클라이언트
+        limiter (OpenAIRateLimiter): 사용할 limiter (None이면 프로세스 공용)
+        prompt_version (str): 프롬프트 템플릿 버전 (캐시 키 + 메트릭 라벨, 올리면 이전 응답을 재사용하지 않음)
+        use_cache (bool): LLM 응답 캐시 사용 여부
+        **kwargs: chat.completions.create 인자
+
+    Returns:
+        ChatCompletion: 응답 (캐시 적중 시 choices/usage가 같은 모양인 객체, usage는 0).
+                        캐시를 사용하면 cache_key 속성에 캐시 키가 있습니다.
+    """
+    import openai
+
+    model = kwargs.get('model')
+    cache = get_llm_cache() if use_cache else None
+    cache_key = None
+    if cache is not None and cache.enabled:
+        cache_key = cache.make_key(model, prompt_version, {k: v for k, v in kwargs.items() if k != 'model'})
+        cached = cache.get(cache_key, prompt_version=prompt_version)
+        if cached is not None:
+            cached.cache_key = cache_key
+            return cached
+
+    limiter = limiter or get_openai_limiter()
+    metrics = get_run_metrics()
+    # SDK 자체 재시도(기본 2회)는 429를 limiter 모르게 흡수하므로 끄고, 재시도는 여기서만 함
+    client = client.with_options(max_retries=0)
+    estimated_tokens = estimate_tokens(kwargs.get('messages'), kwargs.get('max_tokens'))
+
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        with metrics.span('openai.limiter_wait', model=model):
+            limiter.acquire(estimated_tokens)
+        metrics.increment('api_calls', platform='openai', endpoint='chat.completions', model=model)
+        try:
+            with metrics.span('api.openai', model=model):
+                raw_response = client.chat.completions.with_raw_response.create(**kwargs)
+        except openai.RateLimitError as e:
+            metrics.increment('api_errors', platform='openai', endpoint='chat.completions', status=429)
+            if attempt == MAX_RATE_LIMIT_RETRIES:
+                raise
+            retry_after = None
+            response = getattr(e, 'response', None)
+            if response is not None:
+                limiter.update_from_headers(response.headers)
+                retry_after = _retry_after(response.headers)
+            delay = limiter.back_off(retry_after)
+            print(f"  [OPENAI LIMIT] 429 rate limit, {delay:.1f}s 후 재시도 ({attempt + 1}/{MAX_RATE_LIMIT_RETRIES})")
+            continue
+
+        limiter.update_from_headers(raw_response.headers)
+        response = raw_response.parse()
+        usage = getattr(response, 'usage', None)
+        limiter.record_usage(estimated_tokens, getattr(usage, 'total_tokens', None) or estimated_tokens)
+        if usage is not None:
+            metrics.increment('openai_tokens', getattr(usage, 'prompt_tokens', 0) or 0, model=model, kind='prompt')
+            metrics.increment('openai_tokens', getattr(usage, 'completion_tokens', 0) or 0,
+                              model=model, kind='completion')
+        if cache_key is not None:
+            cache.put(cache_key, response, model=model, prompt_version=prompt_version)
+            response.cache_key = cache_key
+        return response
+
+
+def discard_cached_completion(response):
+    """
+    create_chat_completion() 응답을 LLM 캐시에서 삭제 (응답을 파싱하지 못했을 때)
+
+    다음 같은 요청은 캐시 대신 API를 다시 호출합니다.
+
+    Args:
+        response: create_chat_completion() 반환값
+    """
+    cache_key = getattr(response, 'cache_key', None)
+    if cache_key is not None:
+        get_llm_cache().discard(cache_key)
@@ -0,0 +1,249 @@
+"""
+실행 단위 메트릭 (단계별 시간 + 카운터 → JSON 실행 리포트)
+
+성능은 지금까지 print 로그로만 드러나서 parse_batch_log.py가 두 언어의 문구를 정규식으로 긁어야 했습니다.
+수집기/분석기/DB 매니저가 같은 프로세스 공용 RunMetrics에 기록하면, 실행이 끝날 때
+기계가 읽을 수 있는 JSON 리포트와 (선택) 요약 표로 병목과 회귀를 바로 확인할 수 있습니다.
+
+- span: 이름 + 라벨(keyword, stage 등)별 실행 횟수, 누적/최대 시간
+- counter: 이름 + 라벨(endpoint, table, cache 등)별 누적 값
+  (api_calls, quota_units, openai_tokens, db_rows_written, cache_hits, cache_misses ...)
+
+사용법:
+    from common.run_metrics import get_run_metrics
+
+    metrics = get_run_metrics()
+    with metrics.span('pipeline.keyword', keyword=keyword):
+        ...
+    metrics.increment('api_calls', platform='youtube', endpoint='search.list')
+    metrics.write_report('data/run_reports/run.json')
+    metrics.print_summary()
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+
+def _label_key(labels):
+    """라벨 dict → 정렬된 tuple (집계 키)"""
+    return tuple(sorted((name, str(value)) for name, value in labels.items() if value is not None))
+
+
+def _format_labels(label_key):
+    """('keyword', 'Samsung TV'), ... → 'keyword=Samsung TV, ...'"""
+    return ', '.join(f"{name}={value}" for name, value in label_key)
+
+
+class RunMetrics:
+    """스레드 안전한 span/counter 집계기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """모든 기록 삭제 (새 실행 시작)"""
+        with self._lock:
+            self.started_at = datetime.now()
+            self._started = time.time()
+            self._spans = {}     # (name, label_key) -> {'count', 'total_seconds', 'max_seconds', 'errors'}
+            self._counters = {}  # (name, label_key) -> value
+
+    @contextmanager
+    def span(self, name, **labels):
+        """
+        with 블록 실행 시간을 name/labels span으로 기록 (예외가 나도 기록)
+
+        Args:
+            name (str): span 이름 (예: 'stage.comments', 'pipeline.keyword')
+            **labels: 구분 라벨 (예: keyword='Samsung TV')
+        """
+        started = time.time()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.record_span(name, time.time() - started, failed=failed, **labels)
+
+    def record_span(self, name, seconds, failed=False, **labels):
+        """
+        이미 측정한 시간을 span으로 기록
+
+        Args:
+            name (str): span 이름
+            seconds (float): 소요 시간 (초)
+            failed (bool): 실패한 실행 여부
+            **labels: 구분 라벨
+        """
+        key = (name, _label_key(labels))
+        with self._lock:
+            entry = self._spans.setdefault(
+                key, {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0, 'errors': 0}
+            )
+            entry['count'] += 1
+            entry['total_seconds'] += seconds
+            entry['max_seconds'] = max(entry['max_seconds'], seconds)
+            if failed:
+                entry['errors'] += 1
+
+    def increment(self, name, amount=1, **labels):
+        """
+        counter 증가
+
+        Args:
+            name (str): counter 이름 (예: 'api_calls', 'db_rows_written')
+            amount (int|float): 증가량
+            **labels: 구분 라벨
+        """
+        if not amount:
+            return
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def get_counter(self, name, **labels):
+        """
+        counter 합계 (labels를 주면 해당 라벨을 모두 가진 항목만 합산)
+
+        Returns:
+            int|float: 합계
+        """
+        wanted = set(_label_key(labels))
+        with self._lock:
+            return sum(value for (counter_name, label_key), value in self._counters.items()
+                       if counter_name == name and wanted <= set(label_key))
+
+    def to_dict(self):
+        """
+        실행 리포트
+
+        Returns:
+            dict: {'started_at', 'finished_at', 'wall_seconds', 'spans': [...], 'counters': [...]}
+        """
+        with self._lock:
+            spans = [
+                {
+                    'name': name,
+                    'labels': dict(label_key),
+                    'count': entry['count'],
+                    'errors': entry['errors'],
+                    'total_seconds': round(entry['total_seconds'], 3),
+                    'avg_seconds': round(entry['total_seconds'] / entry['count'], 3),
+                    'max_seconds': round(entry['max_seconds'], 3),
+                }
+                for (name, label_key), entry in sorted(self._spans.items())
+            ]
+            counters = [
+                {'name': name, 'labels': dict(label_key), 'value': value}
+                for (name, label_key), value in sorted(self._counters.items())
+            ]
+            return {
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'finished_at': datetime.now().isoformat(timespec='seconds'),
+                'wall_seconds': round(time.time() - self._started, 3),
+                'spans': spans,
+                'counters': counters,
+            }
+
+    def write_report(self, path, extra=None):
+        """
+        JSON 실행 리포트 저장
+
+        Args:
+            path (str): 저장 경로 (디렉토리가 없으면 생성)
+            extra (dict): 리포트에 함께 넣을 실행 정보 (예: {'keywords': 12, 'failed_keywords': [...]})
+
+        Returns:
+            str: 저장한 경로
+        """
+        report = self.to_dict()
+        if extra:
+            report['run'] = extra
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+        return path
+
+    def print_summary(self, top=20):
+        """
+        span(누적 시간 순)과 counter 요약 표 출력
+
+        Args:
+            top (int): 출력할 최대 span 수
+        """
+        report = self.to_dict()
+
+        print(f"Run metrics ({report['wall_seconds']:.1f}s wall time)")
+        print(f"  {'span':<40} {'labels':<30} {'count':>7} {'total s':>9} {'avg s':>8} {'max s':>8} {'err':>4}")
+        spans = sorted(report['spans'], key=lambda span: span['total_seconds'], reverse=True)
+        for span in spans[:top]:
+            labels = _format_labels(_label_key(span['labels']))
+            print(f"  {span['name'][:40]:<40} {labels[:30]:<30} {span['count']:>7} "
+                  f"{span['total_seconds']:>9.1f} {span['avg_seconds']:>8.2f} {span['max_seconds']:>8.2f} "
+                  f"{span['errors']:>4}")
+        if len(spans) > top:
+            print(f"  ... {len(spans) - top} more spans in the JSON report")
+
+        print(f"  {'counter':<40} {'labels':<30} {'value':>12}")
+        for counter in report['counters']:
+            labels = _format_labels(_label_key(counter['labels']))
+            print(f"  {counter['name'][:40]:<40} {labels[:30]:<30} {counter['value']:>12,}")
+
+
+_metrics = RunMetrics()
+
+
+def get_run_metrics():
+    """
+    프로세스 공용 RunMetrics
+
+    Returns:
+        RunMetrics
+    """
+    return _metrics
+
+
+def attach_http_metrics(session, platform):
+    """
+    requests Session 응답마다 api_calls/api_errors counter와 api.<platform> span 기록
+
+    Args:
+        session (requests.Session): 플랫폼 클라이언트의 세션
+        platform (str): 라벨로 사용할 플랫폼 이름 (예: 'tiktok')
+    """
+    from urllib.parse import urlparse
+
+    def record_response(response, *args, **kwargs):
+        endpoint = urlparse(response.url).path or '/'
+        _metrics.increment('api_calls', platform=platform, endpoint=endpoint)
+        if response.status_code >= 400:
+            _metrics.increment('api_errors', platform=platform, endpoint=endpoint, status=response.status_code)
+        _metrics.record_span(f"api.{platform}", response.elapsed.total_seconds(), endpoint=endpoint)
+        return response
+
+    session.hooks['response'].append(record_response)
+
+
+def default_report_path(base_dir, prefix='run'):
+    """
+    타임스탬프가 붙은 기본 리포트 경로 (base_dir/data/run_reports/<prefix>_YYYYmmdd_HHMMSS.json)
+
+    Args:
+        base_dir (str): 플랫폼 디렉토리 (예: youtube_brand_analyzer)
+        prefix (str): 파일 이름 접두어
+
+    Returns:
+        str: 리포트 경로
+    """
+    return os.path.join(base_dir, 'data', 'run_reports',
+                        f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
@@ -0,0 +1,180 @@
+"""
+단계 파이프라인 실행기 (bounded queue + 단계별 워커 스레드)
+
+수집 파이프라인의 단계(콘텐츠 분석, 댓글 수집, 요약, DB 저장)는 서로 다른 외부 서비스를 기다립니다.
+단계를 순서대로 실행하면 한 단계가 일하는 동안 나머지는 놀게 되므로,
+항목(비디오) 단위로 단계 사이를 크기가 제한된 큐로 연결해 여러 항목이 서로 다른 단계를 동시에 지나가게 합니다.
+
+- 단계마다 워커 수를 따로 설정 (예: OpenAI 단계 1개, 댓글 수집 8개, DB 저장 1개)
+- 큐가 가득 차면 앞 단계가 기다리므로(backpressure) 느린 단계 앞에 항목이 무한히 쌓이지 않음
+- 한 항목의 단계 오류는 그 항목만 제외하고 기록 (다른 항목은 계속 진행)
+- 결과는 입력(source) 순서대로 반환
+- 단계별 처리 시간은 실행 메트릭(common.run_metrics)에 stage.<name> span으로도 기록
+
+사용법:
+    pipeline = StagePipeline([
+        Stage('analyze', analyze_video, workers=2),
+        Stage('comments', fetch_comments, workers=8),
+        Stage('save', save_video, workers=1),
+    ], queue_size=10)
+    results = pipeline.run(videos)
+    pipeline.print_summary()
+"""
+
+import time
+import queue
+import threading
+
+from common.run_metrics import get_run_metrics
+
+# 큐 종료 표시
+_DONE = object()
+
+
+class Stage:
+    """파이프라인 단계 하나"""
+
+    def __init__(self, name, func, workers=1):
+        """
+        Args:
+            name (str): 단계 이름 (요약 출력용)
+            func (callable): item -> item (None을 반환하면 해당 항목은 이후 단계로 넘기지 않음)
+            workers (int): 이 단계를 동시에 실행할 워커 스레드 수
+        """
+        self.name = name
+        self.func = func
+        self.workers = max(1, int(workers))
+
+
+class StagePipeline:
+    """Stage 목록을 bounded queue로 연결해 항목 단위로 동시에 실행"""
+
+    def __init__(self, stages, queue_size=10, metric_labels=None):
+        """
+        Args:
+            stages (list): Stage 리스트 (실행 순서대로)
+            queue_size (int): 단계 사이 큐의 최대 항목 수 (backpressure 기준)
+            metric_labels (dict): stage span에 붙일 라벨 (예: {'keyword': 'Samsung TV'})
+        """
+        self.stages = stages
+        self.queue_size = max(1, int(queue_size))
+        self.metric_labels = metric_labels or {}
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.stats = {
+            stage.name: {'processed': 0, 'dropped': 0, 'failed': 0, 'busy_seconds': 0.0}
+            for stage in self.stages
+        }
+        self.errors = []  # [(stage_name, sequence, exception), ...]
+        self.elapsed_seconds = 0.0
+
+    def run(self, source):
+        """
+        source의 항목을 모든 단계에 통과시킴
+
+        source는 제너레이터여도 되며, 첫 단계 큐가 가득 차면 다음 항목을 꺼내지 않습니다.
+        source 자체에서 발생한 예외는 진행 중인 항목을 마무리한 뒤 다시 발생시킵니다.
+
+        Args:
+            source (iterable): 입력 항목
+
+        Returns:
+            list: 모든 단계를 통과한 항목 (source 순서)
+        """
+        self._reset_stats()
+        started = time.time()
+
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        results = {}
+        remaining_workers = [stage.workers for stage in self.stages]
+        source_error = []
+        metrics = get_run_metrics()
+
+        def feed():
+            try:
+                for sequence, item in enumerate(source):
+                    queues[0].put((sequence, item))
+            except BaseException as e:
+                source_error.append(e)
+            finally:
+                for _ in range(self.stages[0].workers):
+                    queues[0].put(_DONE)
+
+        def work(index):
+            stage = self.stages[index]
+            in_queue = queues[index]
+            out_queue = queues[index + 1] if index + 1 < len(self.stages) else None
+
+            while True:
+                entry = in_queue.get()
+                if entry is _DONE:
+                    break
+
+                sequence, item = entry
+                stage_started = time.time()
+                try:
+                    output = stage.func(item)
+                except Exception as e:
+                    busy_seconds = time.time() - stage_started
+                    with self._lock:
+                        self.stats[stage.name]['failed'] += 1
+                        self.stats[stage.name]['busy_seconds'] += busy_seconds
+                        self.errors.append((stage.name, sequence, e))
+                    metrics.record_span(f"stage.{stage.name}", busy_seconds, failed=True, **self.metric_labels)
+                    print(f"  [STAGE ERROR] {stage.name} #{sequence + 1}: {e}")
+                    continue
+
+                busy_seconds = time.time() - stage_started
+                metrics.record_span(f"stage.{stage.name}", busy_seconds, **self.metric_labels)
+                with self._lock:
+                    self.stats[stage.name]['busy_seconds'] += busy_seconds
+                    if output is None:
+                        self.stats[stage.name]['dropped'] += 1
+                    else:
+                        self.stats[stage.name]['processed'] += 1
+
+                if output is None:
+                    continue
+                if out_queue is None:
+                    with self._lock:
+                        results[sequence] = output
+                else:
+                    out_queue.put((sequence, output))
+
+            # 이 단계의 마지막 워커가 다음 단계에 종료를 알림
+            with self._lock:
+                remaining_workers[index] -= 1
+                last_worker = remaining_workers[index] == 0
+            if last_worker and out_queue is not None:
+                for _ in range(self.stages[index + 1].workers):
+                    out_queue.put(_DONE)
+
+        threads = [threading.Thread(target=feed, name='stage-source', daemon=True)]
+        for index, stage in enumerate(self.stages):
+            threads += [
+                threading.Thread(target=work, args=(index,), name=f"stage-{stage.name}-{n}", daemon=True)
+                for n in range(stage.workers)
+            ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.elapsed_seconds = time.time() - started
+
+        if source_error:
+            raise source_error[0]
+
+        return [results[sequence] for sequence in sorted(results)]
+
+    def print_summary(self):
+        """단계별 처리 수와 작업 시간 출력"""
+        print(f"  Stage summary ({self.elapsed_seconds:.1f}s wall time):")
+        for stage in self.stages:
+            stats = self.stats[stage.name]
+            print(f"    - {stage.name} (workers={stage.workers}): "
+                  f"{stats['processed']} ok, {stats['failed']} failed, {stats['dropped']} dropped, "
+                  f"{stats['busy_seconds']:.1f}s busy")
@@ -8,6 +8,9 @@ import psycopg2
 from psycopg2 import sql, extras
 import pandas as pd
 from typing import Dict, List, Optional
+from common.db_pool import get_connection, release_connection, is_schema_created, mark_schema_created
+from common.run_metrics import get_run_metrics
+from collectors.quality_filter import compute_engagement_rates
 from .secrets import (
     POSTGRES_HOST,
     POSTGRES_PORT,
@@ -16,6 +19,15 @@ from .secrets import (
     POSTGRES_DB
 )
 
+# Columns stored in youtube_videos_raw (callers can build raw DataFrames with only these)
+RAW_VIDEO_COLUMNS = [
+    'video_id', 'keyword', 'title', 'description', 'published_at',
+    'category_id', 'category', 'channel_id', 'channel_title', 'channel_country',
+    'channel_custom_url', 'channel_subscriber_count', 'channel_video_count',
+    'channel_total_view_count', 'view_count', 'like_count', 'comment_count',
+    'engagement_rate', 'quality_filter_passed', 'filter_fail_reason', 'created_at'
+]
+
 
 class YouTubeDBManager:
     """PostgreSQL Database Manager for YouTube data"""
@@ -35,7 +47,7 @@ class YouTubeDBManager:
     def connect(self):
         """Connect to PostgreSQL database"""
         try:
-            self.conn = psycopg2.connect(**self.connection_params)
+            self.conn = get_connection(self.connection_params)
             self.cursor = self.conn.cursor()
             print(f"Connected to PostgreSQL database: {POSTGRES_DB}")
             return True
@@ -44,15 +56,21 @@ class YouTubeDBManager:
             return False
 
     def disconnect(self):
-        """Disconnect from database"""
+        """Return the connection to the shared pool"""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.conn:
-            self.conn.close()
+            release_connection(self.connection_params, self.conn)
+            self.conn = None
             print("Disconnected from database")
 
     def create_tables(self):
         """Create videos, comments, and raw data tables if they don't exist"""
+        # Schema is created once per process; later calls skip the DDL round-trips
+        if is_schema_created('youtube'):
+            return True
+
         try:
             # Create videos table
             create_videos_table = """
@@ -137,6 +155,7 @@ class YouTubeDBManager:
             self.cursor.execute(create_raw_videos_table)
             self.cursor.execute(create_indexes)
             self.conn.commit()
+            mark_schema_created('youtube')
 
             print("Tables created successfully (including youtube_videos_raw)")
             return True
@@ -161,17 +180,8 @@ class YouTubeDBManager:
             # Add keyword to dataframe
             raw_videos_df['keyword'] = keyword
 
-            # Select required columns for raw table
-            required_columns = [
-                'video_id', 'keyword', 'title', 'description', 'published_at',
-                'category_id', 'category', 'channel_id', 'channel_title', 'channel_country',
-                'channel_custom_url', 'channel_subscriber_count', 'channel_video_count',
-                'channel_total_view_count', 'view_count', 'like_count', 'comment_count',
-                'engagement_rate', 'quality_filter_passed', 'filter_fail_reason', 'created_at'
-            ]
-
             # Filter to only existing columns
-            available_columns = [col for col in required_columns if col in raw_videos_df.columns]
+            available_columns = [col for col in RAW_VIDEO_COLUMNS if col in raw_videos_df.columns]
             df_to_insert = raw_videos_df[available_columns].copy()
 
             # Replace NaN with None
@@ -195,6 +205,7 @@ class YouTubeDBManager:
             # Execute batch insert
             extras.execute_batch(self.cursor, insert_query, records)
             self.conn.commit()
+            get_run_metrics().increment('db_rows_written', len(records), table='youtube_videos_raw')
 
             print(f"Inserted/Updated {len(records)} raw videos")
             return len(records)
@@ -255,6 +266,7 @@ class YouTubeDBManager:
             # Execute batch insert
             extras.execute_batch(self.cursor, insert_query, records)
             self.conn.commit()
+            get_run_metrics().increment('db_rows_written', len(records), table='youtube_videos')
 
             print(f"Inserted/Updated {len(records)} videos")
             return len(records)
@@ -310,6 +322,7 @@ class YouTubeDBManager:
             # Execute batch insert
             extras.execute_batch(self.cursor, insert_query, records)
             self.conn.commit()
+            get_run_metrics().increment('db_rows_written', len(records), table='youtube_comments')
 
             print(f"Inserted/Updated {len(records)} comments")
             return len(records)
@@ -319,6 +332,236 @@ class YouTubeDBManager:
             self.conn.rollback()
             return 0
 
+    def get_video_ids(self, keyword: str) -> List[str]:
+        """
+        Get IDs of videos already stored for a keyword
+
+        Args:
+            keyword (str): Search keyword
+
+        Returns:
+            List[str]: Video IDs in youtube_videos for this keyword
+        """
+        try:
+            self.cursor.execute("SELECT video_id FROM youtube_videos WHERE keyword = %s", (keyword,))
+            return [row[0] for row in self.cursor.fetchall()]
+        except Exception as e:
+            print(f"Error getting video IDs: {e}")
+            self.conn.rollback()
+            return []
+
+    def update_video_statistics(self, statistics: List[Dict]) -> int:
+        """
+        Refresh view/like/comment counts and engagement rate of stored videos
+
+        Args:
+            statistics (List[Dict]): Rows from YouTubeAnalyzer.get_video_statistics()
+
+        Returns:
+            int: Number of statistics rows applied
+        """
+        try:
+            stats_df = pd.DataFrame(statistics, columns=['video_id', 'view_count', 'like_count', 'comment_count'])
+            stats_df[['view_count', 'like_count', 'comment_count']] = (
+                stats_df[['view_count', 'like_count', 'comment_count']].fillna(0).astype('int64')
+            )
+            stats_df['engagement_rate'] = compute_engagement_rates(stats_df)
+            records = [
+                (int(row.view_count), int(row.like_count), int(row.comment_count), float(row.engagement_rate),
+                 row.video_id)
+                for row in stats_df.itertuples(index=False)
+            ]
+
+            update_query = """
+            UPDATE youtube_videos
+            SET view_count = %s, like_count = %s, comment_count = %s, engagement_rate = %s
+            WHERE video_id = %s
+            """
+
+            extras.execute_batch(self.cursor, update_query, records)
+            self.conn.commit()
+            get_run_metrics().increment('db_rows_written', len(records), table='youtube_videos')
+
+            print(f"Updated statistics for {len(records)} videos")
+            return len(records)
+
+        except Exception as e:
+            print(f"Error updating video statistics: {e}")
+            self.conn.rollback()
+            return 0
+
+    def get_snapshot_targets(self, keyword: Optional[str] = None, max_age_days: Optional[int] = None,
+                             limit: Optional[int] = None) -> List[Dict]:
+        """
+        Get stored videos whose statistics should be snapshotted
+
+        A video stored under several keywords is returned once, with its most recently stored row.
+
+        Args:
+            keyword (str): Only videos of this keyword (None for all keywords)
+            max_age_days (int): Only videos published within this many days (None for all)
+            limit (int): Maximum number of videos, most recently published first (None for all)
+
+        Returns:
+            List[Dict]: Stored video metadata (video_id, keyword, title, published_at, category_id, channel_*)
+        """
+        try:
+            conditions = []
+            params = []
+            if keyword:
+                conditions.append("keyword = %s")
+                params.append(keyword)
+            if max_age_days:
+                conditions.append("published_at >= NOW() - (%s * INTERVAL '1 day')")
+                params.append(max_age_days)
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+            query = f"""
+            SELECT * FROM (
+                SELECT DISTINCT ON (video_id)
+                    video_id, keyword, title, published_at, category_id, channel_country,
+                    channel_custom_url, channel_subscriber_count, channel_video_count
+                FROM youtube_videos
+                {where_clause}
+                ORDER BY video_id, created_at DESC
+            ) latest
+            ORDER BY published_at DESC NULLS LAST
+            """
+            if limit:
+                query += " LIMIT %s"
+                params.append(limit)
+
+            dict_cursor = self.conn.cursor(cursor_factory=extras.RealDictCursor)
+            dict_cursor.execute(query, params)
+            rows = [dict(row) for row in dict_cursor.fetchall()]
+            dict_cursor.close()
+            return rows
+
+        except Exception as e:
+            print(f"Error getting snapshot targets: {e}")
+            self.conn.rollback()
+            return []
+
+    def insert_video_snapshots(self, snapshots: List[Dict]) -> int:
+        """
+        Append statistics snapshots to youtube_videos_raw (one row per video per snapshot time)
+
+        Args:
+            snapshots (List[Dict]): Rows with RAW_VIDEO_COLUMNS keys (video_id and created_at required)
+
+        Returns:
+            int: Number of rows inserted
+        """
+        if not snapshots:
+            return 0
+
+        try:
+            columns = [col for col in RAW_VIDEO_COLUMNS if col in snapshots[0]]
+            records = [tuple(row.get(col) for col in columns) for row in snapshots]
+
+            insert_query = f"""
+            INSERT INTO youtube_videos_raw ({', '.join(columns)})
+            VALUES ({', '.join(['%s'] * len(columns))})
+            ON CONFLICT (video_id, created_at) DO NOTHING
+            """
+
+            extras.execute_batch(self.cursor, insert_query, records, page_size=500)
+            self.conn.commit()
+            get_run_metrics().increment('db_rows_written', len(records), table='youtube_videos_raw')
+
+            print(f"Appended {len(records)} statistics snapshots to youtube_videos_raw")
+            return len(records)
+
+        except Exception as e:
+            print(f"Error inserting video snapshots: {e}")
+            self.conn.rollback()
+            return 0
+
+    def get_raw_videos(self, keyword: Optional[str] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get youtube_videos_raw rows with the columns the quality filter needs
+
+        Args:
+            keyword (str): Only rows of this keyword (None for all keywords)
+            limit (int): Maximum number of rows, most recently stored first (None for all)
+
+        Returns:
+            pd.DataFrame: Raw rows keyed by (video_id, created_at)
+        """
+        try:
+            params = []
+            where_clause = ""
+            if keyword:
+                where_clause = "WHERE keyword = %s"
+                params.append(keyword)
+
+            query = f"""
+            SELECT video_id, created_at, keyword, category_id, channel_country,
+                   channel_subscriber_count, channel_total_view_count,
+                   view_count, like_count, comment_count,
+                   engagement_rate, quality_filter_passed, filter_fail_reason
+            FROM youtube_videos_raw
+            {where_clause}
+            ORDER BY created_at DESC
+            """
+            if limit:
+                query += " LIMIT %s"
+                params.append(limit)
+
+            self.cursor.execute(query, params)
+            columns = [column[0] for column in self.cursor.description]
+            raw_df = pd.DataFrame(self.cursor.fetchall(), columns=columns)
+            if not raw_df.empty:
+                # DECIMAL columns come back as Decimal objects
+                raw_df['engagement_rate'] = pd.to_numeric(raw_df['engagement_rate'], errors='coerce')
+            return raw_df
+
+        except Exception as e:
+            print(f"Error getting raw videos: {e}")
+            self.conn.rollback()
+            return pd.DataFrame()
+
+    def update_raw_filter_results(self, raw_df: pd.DataFrame) -> int:
+        """
+        Write re-evaluated engagement_rate / quality filter results back to youtube_videos_raw
+
+        Args:
+            raw_df (pd.DataFrame): Rows with video_id, created_at, engagement_rate,
+                                   quality_filter_passed and filter_fail_reason
+
+        Returns:
+            int: Number of rows updated
+        """
+        if raw_df.empty:
+            return 0
+
+        try:
+            records = list(zip(
+                raw_df['engagement_rate'].astype(float).tolist(),
+                raw_df['quality_filter_passed'].astype(bool).tolist(),
+                raw_df['filter_fail_reason'].where(raw_df['filter_fail_reason'].notna(), None).tolist(),
+                raw_df['video_id'].tolist(),
+                raw_df['created_at'].tolist(),
+            ))
+
+            update_query = """
+            UPDATE youtube_videos_raw
+            SET engagement_rate = %s, quality_filter_passed = %s, filter_fail_reason = %s
+            WHERE video_id = %s AND created_at = %s
+            """
+
+            extras.execute_batch(self.cursor, update_query, records, page_size=500)
+            self.conn.commit()
+            get_run_metrics().increment('db_rows_written', len(records), table='youtube_videos_raw')
+
+            print(f"Updated quality filter results for {len(records)} raw rows")
+            return len(records)
+
+        except Exception as e:
+            print(f"Error updating raw filter results: {e}")
+            self.conn.rollback()
+            return 0
+
     def get_video_count(self) -> int:
         """Get total number of videos in database"""
         try:
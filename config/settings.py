@@ -23,6 +23,8 @@ except ImportError:
 # YouTube API 설정
 YOUTUBE_API_SERVICE_NAME = "youtube"
 YOUTUBE_API_VERSION = "v3"
+YOUTUBE_HTTP_TIMEOUT = 30  # YouTube API 요청 타임아웃 (초)
+YOUTUBE_DAILY_QUOTA_PER_KEY = 10000  # 키당 일일 할당량 (units, 태평양 시간 자정에 초기화)
 
 # TikTok API URL 설정
 TIKTOK_API_BASE_URL = "https://open.tiktokapis.com/v2"
@@ -32,6 +34,35 @@ TIKTOK_RAPIDAPI_BASE_URL = "https://tiktok-scraper2.p.rapidapi.com"
 # 데이터 수집 설정
 MAX_RESULTS_PER_SEARCH = 50  # 검색당 최대 결과 수
 MAX_COMMENTS_PER_VIDEO = 100  # 비디오당 최대 댓글 수
+COMMENT_FETCH_WORKERS = 8  # 댓글을 동시에 수집할 최대 비디오 수
+EXPAND_COMMENT_REPLIES = False  # True면 포함된 답글보다 답글이 많은 스레드를 comments().list로 전부 수집
+MAX_EXPANDED_REPLIES_PER_VIDEO = 200  # 답글 확장으로 비디오당 추가 수집할 최대 답글 수
+REPLY_FETCH_WORKERS = 4  # 답글 확장을 동시에 수행할 최대 스레드 수
+CHANNEL_CACHE_TTL_HOURS = 24  # 채널 정보(구독자/조회수) 캐시 유효 시간
+VIDEO_CACHE_MAX_MEMORY_ITEMS = 5000  # 배치 실행 중 메모리에 보관할 비디오 상세 정보 수 (초과분은 디스크로)
+SEARCH_CACHE_TTL_HOURS = 6  # 검색 결과 페이지 캐시 유효 시간 (0이면 사용 안 함)
+INCREMENTAL_OVERLAP_HOURS = 6  # batch_collect.py --incremental: 지난 수집 시작 시각보다 이만큼 앞부터 다시 검색 (검색 색인 지연 대비)
+
+# 품질 필터 기준 (collectors/quality_filter.py - 수집 시 필터와 youtube_videos_raw 재필터에 공통 사용)
+QUALITY_FILTER_THRESHOLDS = {
+    'target_category': '28',                 # 카테고리 ID (28 = Science & Technology)
+    'target_channel_country': 'US',          # 채널 국가
+    'min_subscriber_count': 10000,           # 최소 구독자 수
+    'min_channel_total_views': 100000000,    # 최소 채널 총 조회수 (구독자 조건과 OR, 100M)
+    'min_engagement_rate': 2.0,              # 최소 참여율 (%)
+}
+
+# 파이프라인 단계별 동시 실행 워커 수 (비디오 단위 단계 파이프라인, DB 저장 단계는 항상 1개)
+PIPELINE_STAGE_WORKERS = {
+    'content_analysis': 4,  # OpenAI - 브랜드/시리즈 추출 및 감성 분석 (속도는 공용 OpenAI limiter가 조절)
+    'comments': 4,          # YouTube commentThreads().list
+    'comment_analysis': 4,  # OpenAI - 댓글 감정 분석 및 요약
+}
+PIPELINE_QUEUE_SIZE = 10  # 단계 사이 대기열 최대 비디오 수 (가득 차면 앞 단계가 대기)
+BATCH_KEYWORD_WORKERS = 1  # batch_collect.py에서 동시에 처리할 키워드 수 (--workers로 변경, 워커 수 + 1(--queue면 + 3)이 POSTGRES_POOL_MAX_CONN 이하여야 시작됨)
+KEYWORD_JOB_LEASE_SECONDS = 600  # batch_collect.py --queue: 하트비트 없이 작업을 점유하는 시간 (지나면 다른 워커가 회수)
+KEYWORD_JOB_MAX_ATTEMPTS = 3  # 키워드 작업당 최대 시도 횟수 (실패/워커 종료 시 재시도)
+KEYWORD_JOB_RETRY_DELAY_SECONDS = 300  # 실패한 작업을 같은 워커가 다시 가져오기 전 대기 시간
 
 # 검색 지역 설정 (쉽게 변경 가능)
 SEARCH_REGIONS = ["US"]  # 미국만 검색
@@ -26,10 +26,18 @@ except ImportError:
     else:
         OPENAI_API_KEY = ""
 
+# 저장소 루트의 공통 모듈 (OpenAI 공용 limiter)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+from common.openai_limiter import create_chat_completion, discard_cached_completion
+from common.comment_groups import iter_comment_groups
+
 
 class CommentSummarizer:
     """OpenAI API를 사용하여 YouTube 댓글을 요약하는 클래스"""
 
+    PROMPT_VERSION = "instagram_comment_summary/1"  # LLM 응답 캐시 키 (common/llm_cache.py)
+
     def __init__(self, api_key=OPENAI_API_KEY, model="gpt-4o-mini"):
         """
         CommentSummarizer 초기화
@@ -41,13 +49,15 @@ class CommentSummarizer:
         self.client = OpenAI(api_key=api_key)
         self.model = model
 
-    def summarize_comments_for_video(self, comments: List[Dict], max_comments=100) -> Dict:
+    def summarize_comments_for_video(self, comments: List[Dict], max_comments=100,
+                                     total_comments: int = None) -> Dict:
         """
         단일 비디오의 댓글들을 요약
 
         Args:
             comments (List[Dict]): 댓글 리스트
             max_comments (int): 요약에 사용할 최대 댓글 수
+            total_comments (int): 전체 댓글 수 (comments에 상위 댓글만 넘긴 경우, None이면 len(comments))
 
         Returns:
             Dict: 요약 결과
@@ -60,6 +70,9 @@ class CommentSummarizer:
                 'total_comments': 0
             }
 
+        if total_comments is None:
+            total_comments = len(comments)
+
         # 좋아요 순으로 정렬하여 상위 댓글만 사용
         sorted_comments = sorted(comments, key=lambda x: x.get('like_count', 0), reverse=True)
         top_comments = sorted_comments[:max_comments]
@@ -77,13 +90,13 @@ class CommentSummarizer:
                 'summary': 'No valid comment text available',
                 'key_themes': [],
                 'sentiment_summary': 'N/A',
-                'total_comments': len(comments)
+                'total_comments': total_comments
             }
 
         # OpenAI API로 요약 요청
         try:
             summary_result = self._call_openai_api(comment_texts)
-            summary_result['total_comments'] = len(comments)
+            summary_result['total_comments'] = total_comments
             summary_result['analyzed_comments'] = len(comment_texts)
             return summary_result
 
@@ -129,7 +142,9 @@ class CommentSummarizer:
 응답은 반드시 유효한 JSON 형식이어야 합니다."""
 
         try:
-            response = self.client.chat.completions.create(
+            response = create_chat_completion(
+                self.client,
+                prompt_version=self.PROMPT_VERSION,
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "당신은 YouTube 댓글을 분석하는 전문가입니다. 댓글의 주요 내용, 감성, 테마를 파악하고 구조화된 JSON 형식으로 요약합니다."},
@@ -155,7 +170,8 @@ class CommentSummarizer:
                 return result
 
             except json.JSONDecodeError:
-                # JSON 파싱 실패 시 텍스트 그대로 반환
+                # JSON 파싱 실패 시 텍스트 그대로 반환 (캐시에는 남기지 않음)
+                discard_cached_completion(response)
                 return {
                     'summary': result_text,
                     'key_themes': [],
@@ -181,33 +197,25 @@ class CommentSummarizer:
         Returns:
             pd.DataFrame: 요약 결과 데이터프레임
         """
-        # 댓글 데이터 로드
+        # 댓글 데이터 로드 (요약에 쓰는 컬럼만)
         print(f"Loading comments from {csv_path}...")
-        comments_df = pd.read_csv(csv_path, encoding='utf-8-sig')
+        summary_columns = {'video_id', 'like_count', 'comment_text_display', 'comment_text_original', 'comment_text'}
+        comments_df = pd.read_csv(csv_path, encoding='utf-8-sig', usecols=lambda column: column in summary_columns)
 
-        # 비디오별로 그룹화
-        video_groups = comments_df.groupby('video_id')
+        print(f"Found {comments_df['video_id'].nunique()} videos with comments")
 
-        print(f"Found {len(video_groups)} videos with comments")
-
-        # 각 비디오별로 요약
+        # 비디오별 좋아요 상위 댓글만 한 번의 정렬로 분할해서 요약
         summaries = []
-        for video_id, group in video_groups:
-            print(f"Summarizing comments for video: {video_id} ({len(group)} comments)")
-
-            # 댓글을 딕셔너리 리스트로 변환
-            comments_list = group.to_dict('records')
+        for video_id, total_comments, comments_list in iter_comment_groups(comments_df, 'video_id'):
+            print(f"Summarizing comments for video: {video_id} ({total_comments} comments)")
 
             # 요약 생성
-            summary = self.summarize_comments_for_video(comments_list)
+            summary = self.summarize_comments_for_video(comments_list, total_comments=total_comments)
 
             # 결과에 video_id 추가
             summary['video_id'] = video_id
             summaries.append(summary)
 
-            # API Rate Limit 방지를 위한 지연
-            time.sleep(1)
-
         # 데이터프레임으로 변환
         summaries_df = pd.DataFrame(summaries)
 
@@ -43,6 +43,11 @@ except Exception as e:
         "rapidapi": {"delay_between_requests": 2}
     }
 
+# 저장소 루트의 공통 모듈 (HTTP 녹화/재생, 실행 메트릭)
+sys.path.append(os.path.dirname(instagram_root))
+from common.http_replay import create_session
+from common.run_metrics import attach_http_metrics
+
 class InstagramAPI:
     def __init__(self, api_key=None):
         """Instagram RapidAPI 클라이언트 초기화"""
@@ -55,6 +60,10 @@ class InstagramAPI:
         self.request_count = 0
         self.rate_limit_delay = API_RATE_LIMITS.get("rapidapi", {}).get("delay_between_requests", 2)
 
+        # HTTP 세션 (HTTP_REPLAY_MODE가 설정되면 녹화/재생 어댑터 사용)
+        self.session = create_session()
+        attach_http_metrics(self.session, 'instagram')
+
         # API 상태 확인
         if not self.api_key or self.api_key == "":
             raise ValueError("Instagram RapidAPI 키가 설정되지 않았습니다. config/secrets.py에 INSTAGRAM_RAPIDAPI_KEY를 추가하세요.")
@@ -119,7 +128,7 @@ class InstagramAPI:
             print(f"  Request: {url}")
             print(f"  Params: {params}")
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=30)
             self.request_count += 1
 
             print(f"  Response status: {response.status_code}")
@@ -315,7 +324,7 @@ class InstagramAPI:
             url = f"{self.base_url}/v1/media/comments"
             params = {'id': post_pk, 'amount': min(max_comments, 50)}
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=30)
             self.request_count += 1
 
             if response.status_code != 200:
@@ -17,6 +17,8 @@ import psycopg2
 from psycopg2 import sql, extras
 import pandas as pd
 from typing import Dict, List, Optional
+from common.db_pool import get_connection, release_connection, is_schema_created, mark_schema_created
+from common.run_metrics import get_run_metrics
 
 # Import from parent config directory
 try:
@@ -70,7 +72,7 @@ class InstagramDBManager:
     def connect(self):
         """Connect to PostgreSQL database"""
         try:
-            self.conn = psycopg2.connect(**self.connection_params)
+            self.conn = get_connection(self.connection_params)
             self.cursor = self.conn.cursor()
             print(f"Connected to PostgreSQL database: {POSTGRES_DB}")
             return True
@@ -79,15 +81,21 @@ class InstagramDBManager:
             return False
 
     def disconnect(self):
-        """Disconnect from database"""
+        """Return the connection to the shared pool"""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.conn:
-            self.conn.close()
+            release_connection(self.connection_params, self.conn)
+            self.conn = None
             print("Disconnected from database")
 
     def create_tables(self):
         """Create posts, comments, and keywords tables if they don't exist"""
+        # Schema is created once per process; later calls skip the DDL round-trips
+        if is_schema_created('instagram'):
+            return True
+
         try:
             # Create keywords management table
             create_keywords_table = """
@@ -165,6 +173,7 @@ class InstagramDBManager:
             self.cursor.execute(create_comments_table)
             self.cursor.execute(create_indexes)
             self.conn.commit()
+            mark_schema_created('instagram')
 
             print("Tables created successfully")
             return True
@@ -225,6 +234,7 @@ class InstagramDBManager:
             # Execute batch insert
             extras.execute_batch(self.cursor, insert_query, records)
             self.conn.commit()
+            get_run_metrics().increment('db_rows_written', len(records), table='instagram_posts')
 
             print(f"Inserted/Updated {len(records)} posts")
             return len(records)
@@ -287,6 +297,7 @@ class InstagramDBManager:
             # Execute batch insert
             extras.execute_batch(self.cursor, insert_query, records)
             self.conn.commit()
+            get_run_metrics().increment('db_rows_written', len(records), table='instagram_comments')
 
             print(f"Inserted/Updated {len(records)} comments")
             return len(records)
@@ -7,7 +7,6 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from config.db_manager import InstagramDBManager
 from analyzers.comment_summarizer import CommentSummarizer
-import time
 
 def main():
     db = InstagramDBManager()
@@ -82,14 +81,6 @@ def main():
             summary_preview = summary["summary"][:80].encode('ascii', 'ignore').decode('ascii')
             print(f'  [OK] Summary saved: {summary_preview}...')
 
-            # Rate limiting
-            time.sleep(2)
-
-            # Extra delay every 10 posts
-            if idx % 10 == 0:
-                print(f'\n  >>> Processed {idx} posts, waiting 10 seconds...')
-                time.sleep(10)
-
         except Exception as e:
             error_count += 1
             error_msg = str(e)[:100].encode('ascii', 'ignore').decode('ascii')
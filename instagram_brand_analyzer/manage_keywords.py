@@ -58,6 +58,10 @@ except ImportError:
         POSTGRES_PASSWORD = ""
         POSTGRES_DB = "samsung_analysis"
 
+# 저장소 루트의 공통 모듈 (PostgreSQL 연결 풀)
+sys.path.append(os.path.dirname(parent_dir))
+from common.db_pool import get_connection, release_connection
+
 
 class KeywordManager:
     """Manage keywords for Instagram data collection"""
@@ -77,7 +81,7 @@ class KeywordManager:
     def connect(self):
         """Connect to database"""
         try:
-            self.conn = psycopg2.connect(**self.connection_params)
+            self.conn = get_connection(self.connection_params)
             self.cursor = self.conn.cursor()
             return True
         except Exception as e:
@@ -85,11 +89,13 @@ class KeywordManager:
             return False
 
     def disconnect(self):
-        """Disconnect from database"""
+        """Return the connection to the shared pool"""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.conn:
-            self.conn.close()
+            release_connection(self.connection_params, self.conn)
+            self.conn = None
 
     def add_keyword(self, keyword, max_posts=30, max_comments_per_post=50):
         """Add a new keyword"""
@@ -34,6 +34,7 @@ if local_config_path not in sys.path:
     sys.path.insert(0, local_config_path)
 
 from db_manager import InstagramDBManager
+from common.comment_groups import iter_comment_groups
 
 
 class InstagramPipeline:
@@ -169,27 +170,19 @@ class InstagramPipeline:
             print()
             print("[Step 3.5/5] Summarizing comments using OpenAI...")
 
-            # 게시물별로 댓글 그룹화
-            post_groups = comments_df.groupby('post_id')
+            # 게시물별 댓글을 한 번에 분할 (게시물마다 좋아요 상위 댓글만)
             comment_summaries = []
 
-            for post_id, post_comments in post_groups:
-                print(f"  Summarizing {len(post_comments)} comments for post {post_id[:10]}...")
-
-                # 댓글을 딕셔너리 리스트로 변환
-                comments_list = post_comments.to_dict('records')
+            for post_id, total_comments, comments_list in iter_comment_groups(comments_df, 'post_id'):
+                print(f"  Summarizing {total_comments} comments for post {post_id[:10]}...")
 
                 # 요약 생성
-                summary = self.comment_summarizer.summarize_comments_for_video(comments_list)
+                summary = self.comment_summarizer.summarize_comments_for_video(
+                    comments_list, total_comments=total_comments
+                )
                 summary['post_id'] = post_id
 
                 comment_summaries.append(summary)
-                time.sleep(2)  # OpenAI API rate limit
-
-                # 10개마다 추가 대기
-                if len(comment_summaries) % 10 == 0:
-                    print(f"  >>> Processed {len(comment_summaries)} posts, waiting 10 seconds...")
-                    time.sleep(10)
 
             # 댓글 요약 데이터프레임
             comment_summaries_df = pd.DataFrame(comment_summaries)
@@ -2,8 +2,15 @@
 Samsung DX 브랜드 감성 분석 통합 파이프라인
 YouTube, Instagram, TikTok 3개 플랫폼 데이터 수집 및 분석
 
+활성화된 플랫폼 파이프라인을 하위 프로세스로 동시에 실행합니다 (최대 --parallel개).
+각 프로세스의 출력은 메모리에 모으지 않고 줄 단위로 플랫폼별 로그 파일(logs/<platform>.log,
+크기 기준 회전)에 기록하며, 플랫폼마다 설정된 제한 시간을 넘기면 해당 프로세스만 종료합니다.
+
 실행 방법:
     python sentiment_main.py
+    python sentiment_main.py --parallel 1           # 플랫폼 순차 실행
+    python sentiment_main.py --platforms youtube    # 특정 플랫폼만 실행
+    python sentiment_main.py --echo                 # 하위 프로세스 출력을 콘솔에도 표시
 
 스케줄러 등록 예시 (Windows Task Scheduler):
     프로그램: python
@@ -13,13 +20,33 @@ YouTube, Instagram, TikTok 3개 플랫폼 데이터 수집 및 분석
 
 import sys
 import os
+import argparse
+import logging
 import subprocess
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from logging.handlers import RotatingFileHandler
 
 # 프로젝트 루트 디렉토리
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 
+# 동시에 실행할 최대 플랫폼 수 (--parallel로 변경)
+MAX_PARALLEL_PLATFORMS = 3
+
+# 플랫폼별 로그 파일 (크기 기준 회전)
+LOG_DIR = os.path.join(PROJECT_ROOT, "logs")
+LOG_MAX_BYTES = 10 * 1024 * 1024  # 파일당 10MB
+LOG_BACKUP_COUNT = 5  # 보관할 이전 로그 파일 수
+
+# 실패 시 콘솔에 보여줄 마지막 출력 줄 수
+TAIL_LINES = 50
+
+# 플랫폼 제한 시간 기본값 (초)
+DEFAULT_TIMEOUT = 7200
+
 # 각 플랫폼 설정
 PLATFORMS = {
     "youtube": {
@@ -27,22 +54,29 @@ PLATFORMS = {
         "directory": os.path.join(PROJECT_ROOT, "youtube_brand_analyzer"),
         "pipeline": "pipeline_youtube_analysis.py",
         "enabled": True,
+        "timeout": 7200,  # 2시간
     },
     # 'instagram': {
     #     'name': 'Instagram',
     #     'directory': os.path.join(PROJECT_ROOT, 'instagram_brand_analyzer'),
     #     'pipeline': 'pipeline_instagram_analysis.py',
-    #     'enabled': True
+    #     'enabled': True,
+    #     'timeout': 3600  # 1시간
     # },
     # 'tiktok': {
     #     'name': 'TikTok',
     #     'directory': os.path.join(PROJECT_ROOT, 'tiktok_brand_analyzer'),
     #     'pipeline': 'pipeline_tiktok_analysis.py',
-    #     'enabled': True
+    #     'enabled': True,
+    #     'timeout': 3600  # 1시간
     # }
 }
 
 
+# 여러 플랫폼 스레드가 콘솔에 동시에 출력할 때 줄이 섞이지 않도록 보호
+_print_lock = threading.Lock()
+
+
 def print_header(text):
     """헤더 출력"""
     print()
@@ -52,6 +86,13 @@ def print_header(text):
     print()
 
 
+def print_locked(*lines):
+    """여러 줄을 다른 플랫폼 출력과 섞이지 않게 한 번에 출력"""
+    with _print_lock:
+        for line in lines:
+            print(line, flush=True)
+
+
 def print_separator():
     """구분선 출력"""
     print("-" * 80)
@@ -71,90 +112,197 @@ def format_duration(seconds):
         return f"{secs}초"
 
 
-def run_platform_pipeline(platform_key, platform_info):
-    """플랫폼 파이프라인 실행"""
+def create_platform_logger(platform_key, log_dir=LOG_DIR):
+    """
+    플랫폼별 회전 로그 파일 logger 생성
+
+    Args:
+        platform_key (str): 플랫폼 키 (예: 'youtube')
+        log_dir (str): 로그 디렉토리
+
+    Returns:
+        tuple: (logging.Logger, 로그 파일 경로)
+    """
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, f"{platform_key}.log")
+
+    logger = logging.getLogger(f"sentiment_main.{platform_key}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+    handler = RotatingFileHandler(
+        log_path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s", "%Y-%m-%d %H:%M:%S"))
+    logger.addHandler(handler)
+    return logger, log_path
+
+
+def stop_process(process):
+    """하위 프로세스 종료 (terminate 후 10초 안에 끝나지 않으면 kill)"""
+    if process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def run_platform_pipeline(platform_key, platform_info, log_dir=LOG_DIR, echo=False):
+    """
+    플랫폼 파이프라인 실행
+
+    하위 프로세스의 stdout/stderr를 줄 단위로 읽어 플랫폼 로그 파일에 바로 기록하고,
+    마지막 TAIL_LINES줄만 메모리에 유지합니다 (실패 시 콘솔 출력용).
+    제한 시간(platform_info['timeout'])을 넘기면 프로세스를 종료합니다.
+
+    Args:
+        platform_key (str): 플랫폼 키
+        platform_info (dict): PLATFORMS 항목
+        log_dir (str): 로그 디렉토리
+        echo (bool): 출력 줄을 콘솔에도 '[플랫폼]' 접두어와 함께 표시
+
+    Returns:
+        tuple: (성공 여부, 소요 시간(초))
+    """
 
     platform_name = platform_info["name"]
     directory = platform_info["directory"]
     pipeline_file = platform_info["pipeline"]
     pipeline_path = os.path.join(directory, pipeline_file)
-
-    print_header(f"{platform_name} 데이터 수집 및 분석 시작")
+    timeout = platform_info.get("timeout", DEFAULT_TIMEOUT)
 
     # 파일 존재 확인
     if not os.path.exists(pipeline_path):
-        print(f"[ERROR] 파이프라인 파일을 찾을 수 없습니다: {pipeline_path}")
+        print_locked(f"[ERROR] {platform_name} 파이프라인 파일을 찾을 수 없습니다: {pipeline_path}")
         return False, 0
 
-    print(f"실행 파일: {pipeline_file}")
-    print(f"작업 디렉토리: {directory}")
-    print()
+    logger, log_path = create_platform_logger(platform_key, log_dir)
+    print_locked(
+        f"[START] {platform_name}: {pipeline_file} (작업 디렉토리: {directory})",
+        f"        제한 시간: {format_duration(timeout)}, 로그: {log_path}",
+    )
 
     start_time = time.time()
+    tail = deque(maxlen=TAIL_LINES)
+    timed_out = threading.Event()
 
     try:
-        # 파이프라인 실행
-        result = subprocess.run(
+        # 하위 프로세스 출력이 버퍼에 쌓이지 않고 줄 단위로 바로 전달되도록 설정
+        env = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8")
+        process = subprocess.Popen(
             [sys.executable, pipeline_file],
             cwd=directory,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=7200,  # 2시간 타임아웃
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            env=env,
         )
+        logger.info(f"===== {platform_name} 시작 (pid {process.pid}) =====")
+
+        # 플랫폼별 제한 시간이 지나면 프로세스 종료 (출력이 없어도 동작)
+        def on_deadline():
+            timed_out.set()
+            stop_process(process)
+
+        deadline = threading.Timer(timeout, on_deadline)
+        deadline.daemon = True
+        deadline.start()
+
+        try:
+            for line in process.stdout:
+                line = line.rstrip("\n")
+                logger.info(line)
+                tail.append(line)
+                if echo:
+                    print_locked(f"[{platform_name}] {line}")
+            returncode = process.wait()
+        finally:
+            deadline.cancel()
+            process.stdout.close()
+            if process.poll() is None:
+                stop_process(process)
+
+        duration = time.time() - start_time
+
+        if timed_out.is_set():
+            logger.info(f"===== {platform_name} 제한 시간 초과 ({format_duration(timeout)}) =====")
+            print_locked(
+                f"[ERROR] {platform_name} 파이프라인 타임아웃 ({format_duration(timeout)} 초과)",
+                f"     소요 시간: {format_duration(duration)}, 로그: {log_path}",
+            )
+            return False, duration
 
-        end_time = time.time()
-        duration = end_time - start_time
-
-        # 결과 출력
-        print_separator()
-        print("실행 결과:")
-        print_separator()
-
-        if result.stdout:
-            # stdout을 라인별로 출력 (너무 길면 마지막 50줄만)
-            stdout_lines = result.stdout.split("\n")
-            if len(stdout_lines) > 50:
-                print("[출력 일부 생략...]")
-                print("\n".join(stdout_lines[-50:]))
-            else:
-                print(result.stdout)
-
-        if result.stderr:
-            print("\n[STDERR]:")
-            print(result.stderr)
-
-        print_separator()
+        logger.info(f"===== {platform_name} 종료 (exit code: {returncode}) =====")
 
-        if result.returncode == 0:
-            print(f"[OK] {platform_name} 파이프라인 완료")
-            print(f"     소요 시간: {format_duration(duration)}")
-            return True, duration
-        else:
-            print(
-                f"[ERROR] {platform_name} 파이프라인 실패 (exit code: {result.returncode})"
+        if returncode == 0:
+            print_locked(
+                f"[OK] {platform_name} 파이프라인 완료",
+                f"     소요 시간: {format_duration(duration)}, 로그: {log_path}",
             )
-            print(f"     소요 시간: {format_duration(duration)}")
-            return False, duration
+            return True, duration
 
-    except subprocess.TimeoutExpired:
-        end_time = time.time()
-        duration = end_time - start_time
-        print(f"[ERROR] {platform_name} 파이프라인 타임아웃 (2시간 초과)")
-        print(f"     소요 시간: {format_duration(duration)}")
+        print_locked(
+            "-" * 80,
+            f"[ERROR] {platform_name} 파이프라인 실패 (exit code: {returncode})",
+            f"     소요 시간: {format_duration(duration)}, 로그: {log_path}",
+            f"마지막 출력 {len(tail)}줄:",
+            *tail,
+            "-" * 80,
+        )
         return False, duration
 
     except Exception as e:
-        end_time = time.time()
-        duration = end_time - start_time
-        print(f"[ERROR] {platform_name} 파이프라인 실행 중 오류:")
-        print(f"     {str(e)}")
-        print(f"     소요 시간: {format_duration(duration)}")
+        duration = time.time() - start_time
+        logger.info(f"===== {platform_name} 실행 중 오류: {e} =====")
+        print_locked(
+            f"[ERROR] {platform_name} 파이프라인 실행 중 오류:",
+            f"     {str(e)}",
+            f"     소요 시간: {format_duration(duration)}",
+        )
         return False, duration
 
+    finally:
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="Samsung DX 브랜드 감성 분석 통합 파이프라인")
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=MAX_PARALLEL_PLATFORMS,
+        help=f"동시에 실행할 최대 플랫폼 수 (기본: {MAX_PARALLEL_PLATFORMS}, 1이면 순차 실행)",
+    )
+    parser.add_argument(
+        "--platforms",
+        nargs="+",
+        choices=sorted(PLATFORMS),
+        default=None,
+        help="실행할 플랫폼 (기본: enabled=True인 모든 플랫폼)",
+    )
+    parser.add_argument("--log-dir", default=LOG_DIR, help=f"플랫폼별 로그 디렉토리 (기본: {LOG_DIR})")
+    parser.add_argument("--echo", action="store_true", help="하위 프로세스 출력을 콘솔에도 표시")
+    args = parser.parse_args()
+    if args.parallel < 1:
+        parser.error("--parallel must be at least 1")
+    return args
+
 
 def main():
     """메인 함수"""
 
+    args = parse_args()
     overall_start_time = time.time()
     start_datetime = datetime.now()
 
@@ -163,21 +311,31 @@ def main():
     print()
 
     # 활성화된 플랫폼 확인
-    enabled_platforms = [(k, v) for k, v in PLATFORMS.items() if v["enabled"]]
+    if args.platforms:
+        enabled_platforms = [(k, v) for k, v in PLATFORMS.items() if k in args.platforms]
+    else:
+        enabled_platforms = [(k, v) for k, v in PLATFORMS.items() if v["enabled"]]
     print(f"실행할 플랫폼: {', '.join([p[1]['name'] for p in enabled_platforms])}")
+    print(f"동시 실행: 최대 {args.parallel}개")
+    print(f"로그 디렉토리: {args.log_dir}")
     print()
 
     results = {}
 
-    # 각 플랫폼 순차 실행
-    for platform_key, platform_info in enabled_platforms:
-        success, duration = run_platform_pipeline(platform_key, platform_info)
-        results[platform_key] = {
-            "success": success,
-            "duration": duration,
-            "name": platform_info["name"],
-        }
-        print()
+    # 플랫폼 동시 실행 (전체 소요 시간 = 가장 느린 플랫폼), 결과는 PLATFORMS 순서로 정리
+    with ThreadPoolExecutor(max_workers=args.parallel, thread_name_prefix="platform") as executor:
+        futures = [
+            (platform_key, platform_info,
+             executor.submit(run_platform_pipeline, platform_key, platform_info, args.log_dir, args.echo))
+            for platform_key, platform_info in enabled_platforms
+        ]
+        for platform_key, platform_info, future in futures:
+            success, duration = future.result()
+            results[platform_key] = {
+                "success": success,
+                "duration": duration,
+                "name": platform_info["name"],
+            }
 
     # 전체 결과 요약
     overall_end_time = time.time()
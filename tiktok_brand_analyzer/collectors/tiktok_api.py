@@ -20,6 +20,11 @@ from config.settings import (
     BRAND_KEYWORDS, TIKTOK_HASHTAG_KEYWORDS
 )
 
+# 저장소 루트의 공통 모듈 (HTTP 녹화/재생, 실행 메트릭)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.http_replay import create_session
+from common.run_metrics import attach_http_metrics
+
 class TikTokAPI:
     def __init__(self, rapidapi_key=None):
         """실제 작동하는 TikTok API23 클라이언트"""
@@ -43,6 +48,10 @@ class TikTokAPI:
         
         # 요청 제한
         self.request_delay = 1
+
+        # HTTP 세션 (HTTP_REPLAY_MODE가 설정되면 녹화/재생 어댑터 사용)
+        self.session = create_session()
+        attach_http_metrics(self.session, 'tiktok')
     
     def get_comprehensive_video_data(self, keyword: str, region_code: str = "US", 
                                    max_results: int = 50, published_after=None, 
@@ -140,7 +149,7 @@ class TikTokAPI:
                 'count': str(min(max_results, 20))
             }
 
-            response = requests.get(
+            response = self.session.get(
                 self.endpoints['search_video'],
                 headers=self.headers,
                 params=params,
@@ -176,7 +185,7 @@ class TikTokAPI:
                 'count': str(min(max_results, 20))
             }
             
-            response = requests.get(
+            response = self.session.get(
                 self.endpoints['challenge_info'],
                 headers=self.headers,
                 params=params,
@@ -217,7 +226,7 @@ class TikTokAPI:
                 'cursor': '0'
             }
             
-            response = requests.get(
+            response = self.session.get(
                 self.endpoints['user_posts'],
                 headers=self.headers,
                 params=params,
@@ -447,7 +456,7 @@ class TikTokAPI:
                 'cursor': '0'
             }
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=10)
             self.request_count += 1
 
             if response.status_code != 200:
@@ -609,7 +618,7 @@ class TikTokAPI:
             url = f"{self.base_url}/api/user/info"
             params = {'uniqueId': unique_id}
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=10)
             self.request_count += 1
 
             if response.status_code != 200:
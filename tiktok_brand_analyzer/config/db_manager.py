@@ -17,6 +17,8 @@ import psycopg2
 from psycopg2 import sql, extras
 import pandas as pd
 from typing import Dict, List, Optional
+from common.db_pool import get_connection, release_connection, is_schema_created, mark_schema_created
+from common.run_metrics import get_run_metrics
 
 # Import from parent config directory
 try:
@@ -70,7 +72,7 @@ class TikTokDBManager:
     def connect(self):
         """Connect to PostgreSQL database"""
         try:
-            self.conn = psycopg2.connect(**self.connection_params)
+            self.conn = get_connection(self.connection_params)
             self.cursor = self.conn.cursor()
             print(f"Connected to PostgreSQL database: {POSTGRES_DB}")
             return True
@@ -79,15 +81,21 @@ class TikTokDBManager:
             return False
 
     def disconnect(self):
-        """Disconnect from database"""
+        """Return the connection to the shared pool"""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.conn:
-            self.conn.close()
+            release_connection(self.connection_params, self.conn)
+            self.conn = None
             print("Disconnected from database")
 
     def create_tables(self):
         """Create videos, comments, and keywords tables if they don't exist"""
+        # Schema is created once per process; later calls skip the DDL round-trips
+        if is_schema_created('tiktok'):
+            return True
+
         try:
             # Create keywords management table
             create_keywords_table = """
@@ -233,6 +241,7 @@ class TikTokDBManager:
             self.cursor.execute(create_comments_table)
             self.cursor.execute(create_indexes)
             self.conn.commit()
+            mark_schema_created('tiktok')
 
             print("TikTok tables created successfully")
             return True
@@ -302,6 +311,7 @@ class TikTokDBManager:
                     continue
 
             self.conn.commit()
+            get_run_metrics().increment('db_rows_written', inserted, table='tiktok_videos')
             print(f"Inserted/updated {inserted} videos")
             return inserted
 
@@ -369,6 +379,7 @@ class TikTokDBManager:
                     continue
 
             self.conn.commit()
+            get_run_metrics().increment('db_rows_written', inserted, table='tiktok_comments')
             print(f"Inserted/updated {inserted} comments")
             return inserted
 
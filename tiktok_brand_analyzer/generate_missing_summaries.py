@@ -8,7 +8,6 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 sys.path.insert(0, os.path.join(current_dir, '..'))
 
-import time
 import pandas as pd
 
 # Import comment summarizer
@@ -31,6 +30,7 @@ for analyzer_path in [youtube_analyzer_path, instagram_analyzer_path]:
 try:
     from openai import OpenAI
     from config.secrets import OPENAI_API_KEY
+    from common.openai_limiter import create_chat_completion
     client = OpenAI(api_key=OPENAI_API_KEY)
     print(f"[OK] Loaded OpenAI client")
 except Exception as e:
@@ -54,7 +54,8 @@ def generate_video_summary(title, description):
 
 요약 (한글 2-3문장):"""
 
-        response = client.chat.completions.create(
+        response = create_chat_completion(
+            client,
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "당신은 TikTok 비디오 내용을 요약하는 전문가입니다. 제목과 설명을 바탕으로 비디오의 핵심 내용을 간결하게 요약합니다."},
@@ -158,12 +159,6 @@ def generate_missing_summaries():
             except Exception as e:
                 print(f"  [ERROR] {e}")
 
-            time.sleep(2)  # OpenAI rate limit
-
-            if i % 10 == 0:
-                print(f"  >>> {i}개 완료, 10초 대기...")
-                time.sleep(10)
-
     # 2. Video Summary 생성 (모든 비디오)
     print()
     print("[2/2] Video Summary 생성 중...")
@@ -206,12 +201,6 @@ def generate_missing_summaries():
             except Exception as e:
                 print(f"  [ERROR] {e}")
 
-            time.sleep(2)  # OpenAI rate limit
-
-            if i % 10 == 0:
-                print(f"  >>> {i}개 완료, 10초 대기...")
-                time.sleep(10)
-
     # 최종 통계
     print()
     print("="*80)
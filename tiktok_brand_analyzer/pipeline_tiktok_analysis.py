@@ -41,12 +41,12 @@ if CommentSummarizer is None:
     # Fallback: create a dummy summarizer
     print("[ERROR] CommentSummarizer not found, using fallback")
     class CommentSummarizer:
-        def summarize_comments_for_video(self, comments):
+        def summarize_comments_for_video(self, comments, total_comments=None):
             return {
                 'summary': 'Comment summarization not available',
                 'key_themes': [],
                 'sentiment_summary': 'N/A',
-                'total_comments': len(comments)
+                'total_comments': len(comments) if total_comments is None else total_comments
             }
 
 # Import local config
@@ -56,6 +56,7 @@ if local_config_path not in sys.path:
     sys.path.insert(0, local_config_path)
 
 from db_manager import TikTokDBManager
+from common.comment_groups import iter_comment_groups
 
 
 class TikTokPipeline:
@@ -227,27 +228,19 @@ class TikTokPipeline:
             print()
             print("[Step 4/5] Summarizing comments using OpenAI...")
 
-            # Group comments by video_id
-            video_groups = comments_df.groupby('video_id')
+            # Partition comments by video_id once (top comments by likes per video)
             comment_summaries = []
 
-            for video_id, video_comments in video_groups:
-                print(f"  Summarizing {len(video_comments)} comments for video {video_id[:10]}...")
-
-                # Convert comments to dict list
-                comments_list = video_comments.to_dict('records')
+            for video_id, total_comments, comments_list in iter_comment_groups(comments_df, 'video_id'):
+                print(f"  Summarizing {total_comments} comments for video {video_id[:10]}...")
 
                 # Generate summary
-                summary = self.comment_summarizer.summarize_comments_for_video(comments_list)
+                summary = self.comment_summarizer.summarize_comments_for_video(
+                    comments_list, total_comments=total_comments
+                )
                 summary['video_id'] = video_id
 
                 comment_summaries.append(summary)
-                time.sleep(2)  # OpenAI API rate limit
-
-                # Wait every 10 posts
-                if len(comment_summaries) % 10 == 0:
-                    print(f"  >>> Processed {len(comment_summaries)} videos, waiting 10 seconds...")
-                    time.sleep(10)
 
             # Create comment summaries DataFrame
             comment_summaries_df = pd.DataFrame(comment_summaries)
@@ -26,11 +26,14 @@ import json
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.settings import OPENAI_API_KEY
+from common.openai_limiter import create_chat_completion, discard_cached_completion
 
 
 class CommentSentimentAnalyzer:
     """OpenAI API를 사용하여 YouTube 댓글 감정을 분석하는 클래스"""
 
+    PROMPT_VERSION = "youtube_comment_sentiment/1"  # LLM 응답 캐시 키 (common/llm_cache.py)
+
     def __init__(self, api_key=OPENAI_API_KEY, model="gpt-4o-mini"):
         """
         CommentSentimentAnalyzer 초기화
@@ -61,7 +64,9 @@ class CommentSentimentAnalyzer:
             return 0.0  # 빈 댓글은 중립
 
         try:
-            response = self.client.chat.completions.create(
+            response = create_chat_completion(
+                self.client,
+                prompt_version=self.PROMPT_VERSION,
                 model=self.model,
                 messages=[
                     {
@@ -89,7 +94,11 @@ Return ONLY the number, no explanation."""
 
             # 결과 파싱
             sentiment_str = response.choices[0].message.content.strip()
-            sentiment_score = float(sentiment_str)
+            try:
+                sentiment_score = float(sentiment_str)
+            except ValueError:
+                discard_cached_completion(response)
+                raise
 
             # 범위 제한 (-1.0 ~ +1.0)
             sentiment_score = max(-1.0, min(1.0, sentiment_score))
@@ -102,14 +111,14 @@ Return ONLY the number, no explanation."""
 
     def analyze_comments_batch(self, comments: List[Dict],
                                text_field='comment_text_display',
-                               rate_limit_delay=0.5) -> List[Dict]:
+                               rate_limit_delay=0.0) -> List[Dict]:
         """
         여러 댓글의 감정을 배치로 분석
 
         Args:
             comments (List[Dict]): 댓글 리스트
             text_field (str): 댓글 텍스트 필드명
-            rate_limit_delay (float): API 호출 간 대기 시간 (초)
+            rate_limit_delay (float): API 호출 간 추가 대기 시간 (초, 호출 속도는 공용 limiter가 조절)
 
         Returns:
             List[Dict]: 각 댓글에 sentiment_score가 추가된 리스트
@@ -138,8 +147,8 @@ Return ONLY the number, no explanation."""
             if idx % 10 == 0:
                 print(f"  Progress: {idx}/{total} comments analyzed")
 
-            # Rate limit 방지
-            time.sleep(rate_limit_delay)
+            if rate_limit_delay:
+                time.sleep(rate_limit_delay)
 
         print(f"Sentiment analysis completed: {len(results)}/{total} comments")
         return results
@@ -147,7 +156,7 @@ Return ONLY the number, no explanation."""
     def analyze_comments_batch_optimized(self, comments: List[Dict],
                                         text_field='comment_text_display',
                                         batch_size=10,
-                                        rate_limit_delay=2.0) -> List[Dict]:
+                                        rate_limit_delay=0.0) -> List[Dict]:
         """
         여러 댓글을 배치로 묶어서 효율적으로 분석 (비용 절감)
 
@@ -155,7 +164,7 @@ Return ONLY the number, no explanation."""
             comments (List[Dict]): 댓글 리스트
             text_field (str): 댓글 텍스트 필드명
             batch_size (int): 한 번에 분석할 댓글 수
-            rate_limit_delay (float): 배치 간 대기 시간 (초)
+            rate_limit_delay (float): 배치 간 추가 대기 시간 (초, 호출 속도는 공용 limiter가 조절)
 
         Returns:
             List[Dict]: 각 댓글에 sentiment_score가 추가된 리스트
@@ -181,7 +190,9 @@ Return ONLY the number, no explanation."""
                     for idx, text in enumerate(batch_texts)
                 ])
 
-                response = self.client.chat.completions.create(
+                response = create_chat_completion(
+                    self.client,
+                    prompt_version=self.PROMPT_VERSION,
                     model=self.model,
                     messages=[
                         {
@@ -210,12 +221,16 @@ Return ONLY the JSON, no explanation."""
 
                 # 결과 파싱
                 result_str = response.choices[0].message.content.strip()
-                sentiment_dict = json.loads(result_str)
+                try:
+                    sentiment_dict = json.loads(result_str)
+                    scores = [float(sentiment_dict.get(str(idx), 0.0)) for idx in range(1, len(batch) + 1)]
+                except (ValueError, TypeError, AttributeError):
+                    discard_cached_completion(response)
+                    raise
 
                 # 결과 매칭
-                for idx, comment in enumerate(batch, 1):
-                    score = sentiment_dict.get(str(idx), 0.0)
-                    score = max(-1.0, min(1.0, float(score)))
+                for comment, score in zip(batch, scores):
+                    score = max(-1.0, min(1.0, score))
 
                     result = comment.copy()
                     result['sentiment_score'] = round(score, 4)
@@ -224,8 +239,8 @@ Return ONLY the JSON, no explanation."""
                 # 진행 상황 출력
                 print(f"  Progress: {len(results)}/{total} comments analyzed")
 
-                # Rate limit 방지
-                time.sleep(rate_limit_delay)
+                if rate_limit_delay:
+                    time.sleep(rate_limit_delay)
 
             except Exception as e:
                 print(f"Error analyzing batch: {e}")
@@ -235,7 +250,6 @@ Return ONLY the JSON, no explanation."""
                     result = comment.copy()
                     result['sentiment_score'] = sentiment_score
                     results.append(result)
-                    time.sleep(0.5)
 
         print(f"Sentiment analysis completed: {len(results)}/{total} comments")
         return results
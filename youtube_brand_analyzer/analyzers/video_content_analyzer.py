@@ -14,11 +14,14 @@ from typing import Dict, List, Tuple
 import json
 
 from config.settings import OPENAI_API_KEY
+from common.openai_limiter import create_chat_completion, discard_cached_completion
 
 
 class VideoContentAnalyzer:
     """YouTube 비디오 콘텐츠 분석 클래스"""
 
+    PROMPT_VERSION = "youtube_video_content/1"  # LLM 응답 캐시 키 (common/llm_cache.py)
+
     def __init__(self, api_key=OPENAI_API_KEY, model="gpt-4o-mini"):
         """
         초기화
@@ -212,7 +215,9 @@ Example output 2 (no full item number):
             system_msg = "You are an expert at analyzing product review videos and extracting product information."
 
         try:
-            response = self.client.chat.completions.create(
+            response = create_chat_completion(
+                self.client,
+                prompt_version=self.PROMPT_VERSION,
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_msg},
@@ -222,7 +227,11 @@ Example output 2 (no full item number):
                 response_format={"type": "json_object"}
             )
 
-            result = json.loads(response.choices[0].message.content)
+            try:
+                result = json.loads(response.choices[0].message.content)
+            except ValueError:
+                discard_cached_completion(response)
+                raise
 
             # OpenAI로부터 추출된 정보
             extracted_brand = result.get('reviewed_brand')
@@ -319,7 +328,9 @@ Example output:
 """
 
         try:
-            response = self.client.chat.completions.create(
+            response = create_chat_completion(
+                self.client,
+                prompt_version=self.PROMPT_VERSION,
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert at analyzing sentiment towards specific TV products in review videos."},
@@ -329,11 +340,15 @@ Example output:
                 response_format={"type": "json_object"}
             )
 
-            result = json.loads(response.choices[0].message.content)
-            score = result.get('sentiment_score', 0)
+            try:
+                result = json.loads(response.choices[0].message.content)
+                score = float(result.get('sentiment_score', 0))
+            except (ValueError, TypeError, AttributeError):
+                discard_cached_completion(response)
+                raise
 
             # 범위 제한
-            return max(-5.0, min(5.0, float(score)))
+            return max(-5.0, min(5.0, score))
 
         except Exception as e:
             print(f"[ERROR] 감성 점수 분석 실패: {e}")
@@ -380,7 +395,9 @@ Provide a concise summary in English (2-3 sentences).
 """
 
         try:
-            response = self.client.chat.completions.create(
+            response = create_chat_completion(
+                self.client,
+                prompt_version=self.PROMPT_VERSION,
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert at summarizing YouTube comments concisely."},
@@ -10,11 +10,14 @@ import json
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.settings import OPENAI_API_KEY
+from common.openai_limiter import create_chat_completion, discard_cached_completion
 
 
 class VideoSummarizer:
     """YouTube 비디오 자막을 추출하고 OpenAI로 요약하는 클래스"""
 
+    PROMPT_VERSION = "youtube_video_summary/1"  # LLM 응답 캐시 키 (common/llm_cache.py)
+
     def __init__(self, api_key=OPENAI_API_KEY, model="gpt-4o-mini"):
         """
         VideoSummarizer 초기화
@@ -174,7 +177,9 @@ class VideoSummarizer:
 """
 
         try:
-            response = self.client.chat.completions.create(
+            response = create_chat_completion(
+                self.client,
+                prompt_version=self.PROMPT_VERSION,
                 model=self.model,
                 messages=[
                     {
@@ -213,6 +218,7 @@ class VideoSummarizer:
                 return result
 
             except json.JSONDecodeError:
+                discard_cached_completion(response)
                 return {
                     'summary': result_text,
                     'key_topics': [],
@@ -268,7 +274,9 @@ class VideoSummarizer:
 """
 
         try:
-            response = self.client.chat.completions.create(
+            response = create_chat_completion(
+                self.client,
+                prompt_version=self.PROMPT_VERSION,
                 model=self.model,
                 messages=[
                     {
@@ -307,6 +315,7 @@ class VideoSummarizer:
                 return result
 
             except json.JSONDecodeError:
+                discard_cached_completion(response)
                 return {
                     'summary': result_text,
                     'key_topics': [],
@@ -360,9 +369,6 @@ class VideoSummarizer:
 
             summaries.append(summary)
 
-            # API Rate Limit 방지
-            time.sleep(1)
-
         # 데이터프레임으로 변환
         summaries_df = pd.DataFrame(summaries)
 
@@ -6,6 +6,11 @@ Automatically collects data for all active keywords in the database.
 Usage:
     python batch_collect.py
     python batch_collect.py --dry-run  # Show what would be collected without actually running
+    python batch_collect.py --resume   # Continue an interrupted run from its last checkpoint
+    python batch_collect.py --incremental  # Search only videos published since each keyword's last run
+    python batch_collect.py --metrics-summary  # Print the run metrics table (a JSON report is always written)
+    python batch_collect.py --workers 4  # Run up to 4 keyword pipelines at once
+    python batch_collect.py --queue      # Claim keywords from the shared job queue (run on any number of hosts)
 """
 
 import os
@@ -13,28 +18,384 @@ import sys
 sys.path.insert(0, os.path.dirname(__file__))
 sys.path.insert(1, os.path.join(os.path.dirname(__file__), '..'))
 
-import argparse
 import time
-from datetime import datetime
+import argparse
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timedelta, timezone
 from manage_keywords import KeywordManager
+from keyword_queue import KeywordJobQueue
 from pipeline_youtube_analysis import YouTubePipeline
+from collectors.video_cache import VideoDetailCache
+from collectors.checkpoint import CollectionCheckpoint
+from collectors.youtube_api import QuotaExhaustedError
+from common.run_metrics import get_run_metrics, default_report_path
+from common.llm_cache import get_llm_cache
+from common.db_pool import max_pool_connections
+from config.settings import BATCH_KEYWORD_WORKERS, KEYWORD_JOB_RETRY_DELAY_SECONDS, INCREMENTAL_OVERLAP_HOURS
 
 
 class BatchCollector:
     """Batch collector for all active keywords"""
 
-    def __init__(self, dry_run=False, filter_country=None):
+    def __init__(self, dry_run=False, filter_country=None, spill_video_cache=False, resume=False,
+                 incremental=False, report_path=None, metrics_summary=False, workers=BATCH_KEYWORD_WORKERS,
+                 job_queue=None):
         """
         Initialize batch collector
 
         Args:
             dry_run (bool): If True, only show what would be collected
             filter_country (str): Filter videos by channel country (e.g., 'US', 'JP')
+            spill_video_cache (bool): Spill the shared video detail cache to disk when it grows large
+            resume (bool): Continue the previous run from its checkpoint instead of starting over
+            incremental (bool): Search only since each keyword's last_collected_at and refresh known videos
+            report_path (str): Where to write the JSON run report (default: data/run_reports/batch_<timestamp>.json)
+            metrics_summary (bool): Also print the run metrics summary table
+            workers (int): Number of keywords collected at once (each worker runs its own pipeline)
+            job_queue (KeywordJobQueue): Claim keywords from this shared job queue instead of
+                                         processing the active keyword list in this process only
         """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if resume and job_queue:
+            raise ValueError("resume cannot be combined with a job queue (the queue tracks keyword progress)")
+        needed = self.required_db_connections(workers, job_queue is not None)
+        if needed > max_pool_connections():
+            raise ValueError(f"{workers} workers need {needed} PostgreSQL connections, "
+                             f"but POSTGRES_POOL_MAX_CONN is {max_pool_connections()}")
+
         self.dry_run = dry_run
         self.filter_country = filter_country
+        self.incremental = incremental
         self.keyword_manager = KeywordManager()
-        self.pipeline = YouTubePipeline(output_dir='data', use_database=True, save_raw_data=False, save_csv=False)
+        self.report_path = report_path or default_report_path(
+            os.path.dirname(os.path.abspath(__file__)), prefix='batch'
+        )
+        self.metrics_summary = metrics_summary
+        self.metrics = get_run_metrics()
+        self.workers = workers
+        self.job_queue = job_queue
+        self._retry_after = {}  # queue mode: job id -> time.monotonic() until which it is not claimed again
+
+        # One video detail cache for the whole run, shared by every keyword
+        spill_path = None
+        if spill_video_cache:
+            spill_path = os.path.join(
+                os.path.dirname(os.path.abspath(__file__)), 'data', 'cache',
+                f"video_detail_spill_{datetime.now().strftime('%Y%m%d_%H%M%S')}.sqlite3"
+            )
+        self.video_cache = VideoDetailCache(spill_path=spill_path)
+
+        # Search progress and per-keyword completion, saved after every batch.
+        # Queue workers skip the local checkpoint: progress lives in the job queue, and clearing a
+        # checkpoint file shared by several worker processes would discard the others' progress.
+        self.resume = resume
+        self.checkpoint = None if job_queue else CollectionCheckpoint()
+
+        # One pipeline per worker (each holds its own DB connection while running a keyword).
+        # All pipelines share the API key pool, the channel/search/video caches and the checkpoint;
+        # the OpenAI rate limiter and the PostgreSQL pool are already shared process-wide.
+        first_pipeline = self._create_pipeline()
+        youtube_api = first_pipeline.youtube_api
+        self.key_pool = youtube_api.key_pool
+        self._pipelines = queue.Queue()
+        self._pipelines.put(first_pipeline)
+        for _ in range(workers - 1):
+            self._pipelines.put(self._create_pipeline(
+                key_pool=youtube_api.key_pool,
+                channel_cache=youtube_api.channel_cache,
+                search_cache=youtube_api.search_cache
+            ))
+
+    @staticmethod
+    def required_db_connections(workers, use_queue=False):
+        """
+        Pooled PostgreSQL connections a run holds at the same time
+
+        Each worker pipeline holds one while running a keyword, the keyword manager holds one for
+        the whole run, and in queue mode the job queue and its heartbeat thread hold one each.
+        """
+        return workers + 1 + (2 if use_queue else 0)
+
+    def _create_pipeline(self, **shared):
+        """Create a keyword pipeline using the run-wide video cache and checkpoint"""
+        return YouTubePipeline(output_dir='data', use_database=True, save_raw_data=False, save_csv=False,
+                               video_cache=self.video_cache, checkpoint=self.checkpoint, **shared)
+
+    def _collect_keyword(self, keyword, max_videos, max_comments, region, category, since):
+        """
+        Run one keyword on a free pipeline (called from a worker thread)
+
+        Returns:
+            tuple: (videos_df, comments_df) as returned by YouTubePipeline.run
+        """
+        pipeline = self._pipelines.get()
+        try:
+            with self.metrics.span('keyword', keyword=keyword):
+                return pipeline.run(
+                    keyword=keyword,
+                    max_videos=max_videos,
+                    max_comments_per_video=max_comments,
+                    region_code=region,
+                    category=category,
+                    summarize_comments=True,
+                    since=since
+                )
+        finally:
+            self._pipelines.put(pipeline)
+
+    def _record_keyword(self, keyword, since, started_at, videos_df, comments_df):
+        """
+        Apply the country filter and store keyword/video stats for a finished keyword (main thread)
+
+        started_at (when the keyword was scheduled, before its search) becomes last_collected_at,
+        so videos published while the keyword was being collected fall into the next window.
+
+        Returns:
+            tuple: (failure reason or None on success, video count, comment count)
+        """
+        if videos_df is not None and comments_df is not None:
+            # Filter by channel_country if specified
+            if self.filter_country:
+                original_video_count = len(videos_df)
+                videos_df = videos_df[videos_df['channel_country'] == self.filter_country]
+
+                if len(videos_df) == 0:
+                    print(f"  [INFO] No videos from country '{self.filter_country}' (filtered out {original_video_count} videos)")
+                    print(f"\n[WARN] '{keyword}' returned no videos after country filtering")
+                    return f"No videos from {self.filter_country}", 0, 0
+
+                # Filter comments to match filtered videos
+                video_ids_filtered = videos_df['video_id'].tolist()
+                comments_df = comments_df[comments_df['video_id'].isin(video_ids_filtered)]
+
+                print(f"  [INFO] Country filter: {original_video_count} → {len(videos_df)} videos ({self.filter_country} only)")
+
+            video_count = len(videos_df)
+            comment_count = len(comments_df)
+
+            # Update keyword column for collected videos
+            video_ids = videos_df['video_id'].tolist()
+            if video_ids:
+                cursor = self.keyword_manager.cursor
+                for video_id in video_ids:
+                    cursor.execute(
+                        "UPDATE youtube_videos SET keyword = %s WHERE video_id = %s",
+                        (keyword, video_id)
+                    )
+                self.keyword_manager.conn.commit()
+                print(f"  Updated keyword for {len(video_ids)} videos")
+
+            # Update statistics
+            self.keyword_manager.update_collection_stats(
+                keyword=keyword,
+                videos_count=video_count,
+                comments_count=comment_count,
+                collected_at=started_at
+            )
+
+            print(f"\n[OK] '{keyword}' completed: {video_count} videos, {comment_count} comments")
+            return None, video_count, comment_count
+
+        if since:
+            # Nothing new since the last run is expected; known videos were still refreshed
+            self.keyword_manager.update_collection_stats(keyword=keyword, videos_count=0, comments_count=0,
+                                                         collected_at=started_at)
+            print(f"\n[OK] '{keyword}' has no new videos since {since}")
+            return None, 0, 0
+
+        print(f"\n[WARN] '{keyword}' returned no data")
+        return "No data returned", 0, 0
+
+    def _get_since(self, keyword):
+        """
+        Start of the incremental search window for a keyword (None outside incremental mode)
+
+        The window reaches INCREMENTAL_OVERLAP_HOURS before the last collection start, because
+        search results can lag behind publication; overlapping videos are upserted again.
+        """
+        if not self.incremental:
+            return None
+        since = self.keyword_manager.get_last_collected_at(keyword)
+        if since:
+            since -= timedelta(hours=INCREMENTAL_OVERLAP_HOURS)
+        print(f"  '{keyword}' incremental window: "
+              f"{'since ' + str(since) if since else 'first collection (last 90 days)'}")
+        return since
+
+    def _run_keywords(self, active_keywords):
+        """
+        Collect the active keyword list in this process on the worker pool
+
+        Keywords run concurrently; results are recorded in keyword order, so the log summary,
+        keyword stats and report are the same for any number of workers.
+        A failing keyword only affects its own result.
+
+        Returns:
+            list: (keyword, failure reason or None, video count, comment count) per keyword
+        """
+        outcomes = []
+        scheduled = []
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='keyword') as executor:
+            for idx, (keyword, max_videos, max_comments, region, category) in enumerate(active_keywords, 1):
+                if self.checkpoint.is_keyword_completed(keyword):
+                    print(f"\n[RESUME] Skipping '{keyword}' (completed in the previous run)")
+                    outcomes.append((keyword, None, 0, 0))
+                    continue
+
+                started_at = datetime.now(timezone.utc)
+                try:
+                    # Incremental mode: only search the window since the last collection
+                    since = self._get_since(keyword)
+                    future = executor.submit(self._collect_keyword, keyword, max_videos, max_comments,
+                                             region, category, since)
+                except Exception as e:
+                    since = None
+                    future = Future()
+                    future.set_exception(e)
+
+                scheduled.append((idx, keyword, category, since, started_at, future))
+
+            for idx, keyword, category, since, started_at, future in scheduled:
+                try:
+                    videos_df, comments_df = future.result()
+
+                    print("\n" + "="*80)
+                    print(f"Recording keyword {idx}/{len(active_keywords)}: '{keyword}' (category: {category})")
+                    print("="*80)
+
+                    reason, video_count, comment_count = self._record_keyword(
+                        keyword, since, started_at, videos_df, comments_df
+                    )
+                    if reason is None:
+                        self.checkpoint.mark_keyword_completed(keyword)
+                    outcomes.append((keyword, reason, video_count, comment_count))
+
+                except Exception as e:
+                    print(f"\n[ERROR] Failed to process '{keyword}': {e}")
+                    outcomes.append((keyword, str(e), 0, 0))
+
+        return outcomes
+
+    def _run_queue(self):
+        """
+        Claim keyword jobs from the shared job queue until no job is left
+
+        Every worker process first enqueues the run's active keywords (idempotent), then keeps up to
+        `workers` jobs claimed at a time. The queue's heartbeat thread renews the leases, so another
+        worker only reclaims a job if this process dies or stalls. Failed jobs go back to the queue
+        until their attempts run out; this worker waits KEYWORD_JOB_RETRY_DELAY_SECONDS before
+        claiming a job it just failed again. Once the API quota of every key is used up, the worker
+        stops claiming and hands its jobs back without using up their attempts.
+
+        Returns:
+            list: (keyword, failure reason or None, video count, comment count) per finished job
+        """
+        if not self.job_queue.connect():
+            raise RuntimeError("Failed to connect the job queue to the database")
+
+        outcomes = []
+        running = {}  # future -> (job, since, started_at)
+        self._retry_after = {}
+        quota_exhausted = False
+        try:
+            self.job_queue.create_tables()
+            enqueued = self.job_queue.enqueue_active_keywords()
+            print(f"\n[QUEUE] Run '{self.job_queue.run_id}': enqueued {enqueued} new jobs "
+                  f"(worker {self.job_queue.worker_id})")
+            self.job_queue.start_heartbeat()
+
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='keyword') as executor:
+                while True:
+                    # Keep every worker busy while the queue has jobs
+                    while not quota_exhausted and len(running) < self.workers:
+                        if self.key_pool.available_key_count() == 0:
+                            print("\n[QUEUE] No API key has quota left; not claiming more jobs")
+                            quota_exhausted = True
+                            break
+
+                        now = time.monotonic()
+                        self._retry_after = {job_id: until for job_id, until in self._retry_after.items()
+                                             if until > now}
+                        job = self.job_queue.claim(exclude_ids=list(self._retry_after))
+                        if job is None:
+                            break
+                        keyword = job['keyword']
+                        print(f"\n[QUEUE] Claimed '{keyword}' "
+                              f"(attempt {job['attempts']}/{job['max_attempts']}, category: {job['category']})")
+                        started_at = datetime.now(timezone.utc)
+                        try:
+                            since = self._get_since(keyword)
+                            future = executor.submit(self._collect_keyword, keyword, job['max_videos'],
+                                                     job['max_comments_per_video'], job['region_code'],
+                                                     job['category'], since)
+                        except Exception as e:
+                            since = None
+                            future = Future()
+                            future.set_exception(e)
+                        running[future] = (job, since, started_at)
+
+                    if not running:
+                        if quota_exhausted or not self._retry_after:
+                            break
+                        # Only jobs this worker just failed are left; retry them after the delay
+                        delay = min(self._retry_after.values()) - time.monotonic()
+                        print(f"\n[QUEUE] Waiting {max(delay, 0):.0f}s before retrying failed jobs")
+                        time.sleep(max(delay, 0))
+                        continue
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        job, since, started_at = running.pop(future)
+                        outcomes.append(self._finish_job(job, since, started_at, future))
+                        if isinstance(future.exception(), QuotaExhaustedError):
+                            quota_exhausted = True
+        finally:
+            self.job_queue.disconnect()
+
+        return outcomes
+
+    def _finish_job(self, job, since, started_at, future):
+        """
+        Record a finished queue job and report its result back to the queue
+
+        Returns:
+            tuple: (keyword, failure reason or None, video count, comment count)
+        """
+        keyword = job['keyword']
+        print("\n" + "="*80)
+        print(f"Recording queued keyword: '{keyword}' (job {job['id']})")
+        print("="*80)
+
+        if self.job_queue.is_lease_lost(job['id']):
+            print(f"  [WARN] Lost the lease of '{keyword}'; another worker may have collected it as well")
+
+        try:
+            videos_df, comments_df = future.result()
+            reason, video_count, comment_count = self._record_keyword(
+                keyword, since, started_at, videos_df, comments_df
+            )
+        except QuotaExhaustedError as e:
+            # Not the keyword's fault: hand it back without using up an attempt
+            print(f"\n[ERROR] API quota exhausted while processing '{keyword}': {e}")
+            self.job_queue.release(job['id'], str(e))
+            print(f"  [QUEUE] '{keyword}' released for a worker with quota left")
+            return keyword, f"{e} (released)", 0, 0
+        except Exception as e:
+            print(f"\n[ERROR] Failed to process '{keyword}': {e}")
+            if self.job_queue.fail(job['id'], str(e)) == 'pending':
+                self._retry_after[job['id']] = time.monotonic() + KEYWORD_JOB_RETRY_DELAY_SECONDS
+                print(f"  [QUEUE] '{keyword}' returned to the queue for another attempt")
+                return keyword, f"{e} (requeued)", 0, 0
+            return keyword, str(e), 0, 0
+
+        if reason is None:
+            self.job_queue.complete(job['id'], video_count, comment_count)
+        else:
+            # An empty result is not retried; another attempt would spend the same search quota
+            self.job_queue.fail(job['id'], reason, retry=False)
+        return keyword, reason, video_count, comment_count
 
     def run(self):
         """Run batch collection for all active keywords"""
@@ -43,6 +404,10 @@ class BatchCollector:
         print("="*80)
         print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Dry run: {self.dry_run}")
+        print(f"Resume: {self.resume}")
+        print(f"Incremental: {self.incremental}")
+        print(f"Workers: {self.workers}")
+        print(f"Job queue: {'run ' + self.job_queue.run_id if self.job_queue else 'off'}")
         print("="*80)
         print()
 
@@ -72,93 +437,25 @@ class BatchCollector:
             self.keyword_manager.disconnect()
             return
 
-        # Process each keyword
-        total_videos = 0
-        total_comments = 0
-        successful_keywords = 0
-        failed_keywords = []
-
-        for idx, (keyword, max_videos, max_comments, region, category) in enumerate(active_keywords, 1):
-            print("\n" + "="*80)
-            print(f"Processing keyword {idx}/{len(active_keywords)}: '{keyword}' (category: {category})")
-            print("="*80)
-
-            try:
-                # Run pipeline for this keyword
-                videos_df, comments_df = self.pipeline.run(
-                    keyword=keyword,
-                    max_videos=max_videos,
-                    max_comments_per_video=max_comments,
-                    region_code=region,
-                    category=category,
-                    summarize_comments=True
-                )
-
-                if videos_df is not None and comments_df is not None:
-                    # Filter by channel_country if specified
-                    if self.filter_country:
-                        original_video_count = len(videos_df)
-                        videos_df = videos_df[videos_df['channel_country'] == self.filter_country]
-
-                        if len(videos_df) == 0:
-                            print(f"  [INFO] No videos from country '{self.filter_country}' (filtered out {original_video_count} videos)")
-                            print(f"\n[WARN] '{keyword}' returned no videos after country filtering")
-                            failed_keywords.append((keyword, f"No videos from {self.filter_country}"))
-                            continue
-
-                        # Filter comments to match filtered videos
-                        video_ids_filtered = videos_df['video_id'].tolist()
-                        comments_df = comments_df[comments_df['video_id'].isin(video_ids_filtered)]
-
-                        print(f"  [INFO] Country filter: {original_video_count} → {len(videos_df)} videos ({self.filter_country} only)")
-
-                    video_count = len(videos_df)
-                    comment_count = len(comments_df)
-
-                    # Update keyword column for collected videos
-                    video_ids = videos_df['video_id'].tolist()
-                    if video_ids:
-                        cursor = self.keyword_manager.cursor
-                        for video_id in video_ids:
-                            cursor.execute(
-                                "UPDATE youtube_videos SET keyword = %s WHERE video_id = %s",
-                                (keyword, video_id)
-                            )
-                        self.keyword_manager.conn.commit()
-                        print(f"  Updated keyword for {len(video_ids)} videos")
-
-                    # Update statistics
-                    self.keyword_manager.update_collection_stats(
-                        keyword=keyword,
-                        videos_count=video_count,
-                        comments_count=comment_count
-                    )
-
-                    total_videos += video_count
-                    total_comments += comment_count
-                    successful_keywords += 1
-
-                    print(f"\n[OK] '{keyword}' completed: {video_count} videos, {comment_count} comments")
-                else:
-                    print(f"\n[WARN] '{keyword}' returned no data")
-                    failed_keywords.append((keyword, "No data returned"))
+        if self.job_queue:
+            outcomes = self._run_queue()
+        else:
+            # A fresh run discards the previous run's progress
+            if not self.resume:
+                self.checkpoint.clear()
+            outcomes = self._run_keywords(active_keywords)
 
-            except Exception as e:
-                print(f"\n[ERROR] Failed to process '{keyword}': {e}")
-                failed_keywords.append((keyword, str(e)))
-
-            # Wait between keywords to avoid rate limits
-            if idx < len(active_keywords):
-                wait_time = 30
-                print(f"\nWaiting {wait_time} seconds before next keyword...")
-                time.sleep(wait_time)
+        successful_keywords = sum(1 for _, reason, _, _ in outcomes if reason is None)
+        failed_keywords = [(keyword, reason) for keyword, reason, _, _ in outcomes if reason is not None]
+        total_videos = sum(video_count for _, _, video_count, _ in outcomes)
+        total_comments = sum(comment_count for _, _, _, comment_count in outcomes)
 
         # Summary
         print("\n" + "="*80)
         print("Batch Collection Summary")
         print("="*80)
         print(f"Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"\nKeywords processed: {successful_keywords}/{len(active_keywords)}")
+        print(f"\nKeywords processed: {successful_keywords}/{len(outcomes)}")
         print(f"Total videos collected: {total_videos}")
         print(f"Total comments collected: {total_comments}")
 
@@ -167,8 +464,41 @@ class BatchCollector:
             for keyword, reason in failed_keywords:
                 print(f"  - '{keyword}': {reason}")
 
+        cache_stats = self.video_cache.get_stats()
+        print(f"\nShared video cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+              f"({cache_stats['hit_rate']}% hit rate)")
+        print(f"  Saved {cache_stats['calls_saved']} videos.list calls, "
+              f"{cache_stats['bytes_saved'] / 1024 / 1024:.1f} MB of payload")
+
+        llm_stats = get_llm_cache().get_stats()
+        print(f"LLM response cache: {llm_stats['hits']} hits / {llm_stats['misses']} misses "
+              f"({llm_stats['hit_rate']}% hit rate), {llm_stats['tokens_saved']:,} tokens saved, "
+              f"{llm_stats['entries']:,} entries stored")
+
+        # Machine-readable run report (spans per stage/keyword, API calls, quota, tokens, rows, cache hits)
+        self.metrics.write_report(self.report_path, extra={
+            'keywords': len(outcomes),
+            'run_id': self.job_queue.run_id if self.job_queue else None,
+            'workers': self.workers,
+            'successful_keywords': successful_keywords,
+            'failed_keywords': [{'keyword': keyword, 'reason': reason} for keyword, reason in failed_keywords],
+            'total_videos': total_videos,
+            'total_comments': total_comments,
+        })
+        print(f"\nRun report saved: {self.report_path}")
+        if self.metrics_summary:
+            print()
+            self.metrics.print_summary()
+
         print("\n" + "="*80)
 
+        # A fully successful run leaves nothing to resume
+        if self.checkpoint and not failed_keywords:
+            self.checkpoint.clear()
+
+        self.video_cache.close()
+        if self.checkpoint:
+            self.checkpoint.close()
         self.keyword_manager.disconnect()
 
 
@@ -185,10 +515,16 @@ Examples:
   # Dry run (show what would be collected)
   python batch_collect.py --dry-run
 
+  # Continue an interrupted run without re-spending search quota
+  python batch_collect.py --resume
+
+  # Daily run: search only new videos, refresh stats of known ones
+  python batch_collect.py --incremental
+
 Notes:
   - This will process ALL active keywords in the database
   - Each keyword will use its own settings (max_videos, max_comments, region)
-  - There will be a 30-second wait between keywords to avoid rate limits
+  - Keywords run back to back (or --workers at a time); API quota is shared through the key pool
   - Data is automatically saved to PostgreSQL database
         """
     )
@@ -206,12 +542,77 @@ Notes:
         help='Filter videos by channel country (e.g., US, JP, KR)'
     )
 
+    parser.add_argument(
+        '--spill-video-cache',
+        action='store_true',
+        help='Spill the shared video detail cache to disk (data/cache) for very large batches'
+    )
+
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Continue the previous run from its checkpoint (skips completed keywords and paid search pages)'
+    )
+
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help="Search only videos published since each keyword's last_collected_at and refresh known videos' stats"
+    )
+
+    parser.add_argument(
+        '--report',
+        type=str,
+        default=None,
+        help='Path of the JSON run report (default: data/run_reports/batch_<timestamp>.json)'
+    )
+
+    parser.add_argument(
+        '--metrics-summary',
+        action='store_true',
+        help='Print the run metrics table (stage timings, API calls, quota, tokens, rows written, cache hits)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=BATCH_KEYWORD_WORKERS,
+        help=f'Number of keywords to collect at once (default: {BATCH_KEYWORD_WORKERS})'
+    )
+
+    parser.add_argument(
+        '--queue',
+        action='store_true',
+        help='Claim keywords from the shared PostgreSQL job queue (start on as many hosts as needed)'
+    )
+
+    parser.add_argument(
+        '--run-id',
+        type=str,
+        default=None,
+        help="Job queue run id shared by all workers (default: today's date in Pacific time)"
+    )
+
     args = parser.parse_args()
 
+    if args.resume and args.queue:
+        parser.error('--resume cannot be combined with --queue (the queue tracks keyword progress)')
+    needed = BatchCollector.required_db_connections(args.workers, args.queue)
+    if needed > max_pool_connections():
+        parser.error(f'--workers {args.workers} needs {needed} PostgreSQL connections but the pool allows '
+                     f'{max_pool_connections()}; lower --workers or raise POSTGRES_POOL_MAX_CONN')
+
     # Run batch collection
     collector = BatchCollector(
         dry_run=args.dry_run,
-        filter_country=args.filter_country
+        filter_country=args.filter_country,
+        spill_video_cache=args.spill_video_cache,
+        resume=args.resume,
+        incremental=args.incremental,
+        report_path=args.report,
+        metrics_summary=args.metrics_summary,
+        workers=args.workers,
+        job_queue=KeywordJobQueue(run_id=args.run_id) if args.queue else None
     )
     collector.run()
 
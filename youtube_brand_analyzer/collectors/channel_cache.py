@@ -0,0 +1,154 @@
+"""
+YouTube 채널 정보 영구 캐시 (SQLite)
+
+같은 테크 채널이 여러 키워드 검색에 반복해서 등장하므로 channels().list 결과를
+channel_id 기준으로 로컬 SQLite에 저장하고, TTL 안의 항목은 API를 다시 호출하지 않습니다.
+
+사용법:
+    cache = ChannelCache(ttl_hours=24)
+    hits, misses = cache.get_many(channel_ids)  # misses만 API 호출
+    cache.put_many(fetched_channels)
+    print(cache.get_stats())
+"""
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import threading
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import CHANNEL_CACHE_TTL_HOURS
+from common.run_metrics import get_run_metrics
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'data', 'cache', 'youtube_channels.sqlite3'
+)
+
+
+class ChannelCache:
+    """channel_id 기준 채널 정보 TTL 캐시"""
+
+    def __init__(self, db_path=DEFAULT_CACHE_PATH, ttl_hours=CHANNEL_CACHE_TTL_HOURS):
+        """
+        캐시 초기화
+
+        Args:
+            db_path (str): SQLite 파일 경로
+            ttl_hours (float): 캐시 유효 시간 (구독자/조회수가 이 시간보다 오래되면 다시 조회)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_hours * 3600
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # 같은 호스트의 여러 수집 프로세스(batch_collect.py --queue)가 같은 파일을 공유하므로 WAL + 잠금 대기
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS channels (
+                channel_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+        self.purge_expired()
+
+    def get_many(self, channel_ids):
+        """
+        캐시에서 채널 정보 조회
+
+        Args:
+            channel_ids (list): 채널 ID 리스트
+
+        Returns:
+            tuple: (hits, misses)
+                hits (dict): {channel_id: 채널 정보} - TTL 안의 캐시 항목
+                misses (list): API로 조회해야 하는 채널 ID 리스트
+        """
+        unique_ids = list(dict.fromkeys(channel_ids))
+        if not unique_ids:
+            return {}, []
+
+        min_fetched_at = time.time() - self.ttl_seconds
+        hits = {}
+
+        with self._lock:
+            # SQLite 파라미터 제한을 피하기 위해 나눠서 조회
+            for i in range(0, len(unique_ids), 500):
+                chunk = unique_ids[i:i+500]
+                placeholders = ','.join(['?'] * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT channel_id, data FROM channels WHERE channel_id IN ({placeholders}) AND fetched_at >= ?",
+                    (*chunk, min_fetched_at)
+                ).fetchall()
+                for channel_id, data in rows:
+                    hits[channel_id] = json.loads(data)
+
+            misses = [channel_id for channel_id in unique_ids if channel_id not in hits]
+            self.hits += len(hits)
+            self.misses += len(misses)
+
+        metrics = get_run_metrics()
+        metrics.increment('cache_hits', len(hits), cache='channel')
+        metrics.increment('cache_misses', len(misses), cache='channel')
+        return hits, misses
+
+    def put_many(self, channels):
+        """
+        API로 조회한 채널 정보 저장
+
+        Args:
+            channels (list): get_channel_info 형식의 채널 정보 리스트
+        """
+        if not channels:
+            return
+
+        now = time.time()
+        rows = [(ch['channel_id'], json.dumps(ch, ensure_ascii=False), now) for ch in channels]
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO channels (channel_id, data, fetched_at) VALUES (?, ?, ?)",
+                rows
+            )
+            self.conn.commit()
+
+    def purge_expired(self):
+        """
+        TTL이 지난 항목 삭제
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+        with self._lock:
+            cursor = self.conn.execute(
+                "DELETE FROM channels WHERE fetched_at < ?",
+                (time.time() - self.ttl_seconds,)
+            )
+            self.conn.commit()
+            return cursor.rowcount
+
+    def get_stats(self):
+        """
+        캐시 적중 통계
+
+        Returns:
+            dict: {'hits', 'misses', 'hit_rate'}
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total * 100, 1) if total else 0.0,
+        }
+
+    def close(self):
+        """SQLite 연결 종료"""
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,191 @@
+"""
+YouTube 수집 체크포인트 저장소 (SQLite)
+
+실행이 중간에 끊기면(할당량 소진, 타임아웃, 네트워크 오류) 이미 비용을 낸 검색 페이지가 모두 사라집니다.
+배치(50개)가 끝날 때마다 검색 진행 상태(next_page_token, publishedAfter, 수집/통과 비디오)와
+키워드별 완료 여부를 저장하여, --resume 실행이 검색 할당량을 다시 쓰지 않고 이어서 진행하도록 합니다.
+
+사용법:
+    checkpoint = CollectionCheckpoint()
+    analyzer = YouTubeAnalyzer(checkpoint=checkpoint)
+    ...
+    checkpoint.mark_keyword_completed(keyword)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+
+DEFAULT_CHECKPOINT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'data', 'cache', 'youtube_collection_checkpoint.sqlite3'
+)
+
+
+class CollectionCheckpoint:
+    """검색 진행 상태 및 키워드 완료 여부 저장소"""
+
+    def __init__(self, db_path=DEFAULT_CHECKPOINT_PATH):
+        """
+        체크포인트 저장소 초기화
+
+        Args:
+            db_path (str): SQLite 파일 경로
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS search_progress (
+                search_key TEXT PRIMARY KEY,
+                next_page_token TEXT,
+                published_after TEXT NOT NULL,
+                batch_number INTEGER NOT NULL,
+                consecutive_empty_batches INTEGER NOT NULL,
+                done INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS search_videos (
+                search_key TEXT NOT NULL,
+                video_id TEXT NOT NULL,
+                record TEXT,  -- 품질 필터 통과 비디오만 레코드 저장
+                PRIMARY KEY (search_key, video_id)
+            );
+            CREATE TABLE IF NOT EXISTS keyword_progress (
+                keyword TEXT PRIMARY KEY,
+                completed_at REAL NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def make_search_key(keyword, region_code, order):
+        """검색 진행 상태 키"""
+        return f"{keyword}|{region_code}|{order}"
+
+    def load_search(self, keyword, region_code, order):
+        """
+        저장된 검색 진행 상태 조회
+
+        Args:
+            keyword (str): 검색 키워드
+            region_code (str): 지역 코드
+            order (str): 정렬 순서
+
+        Returns:
+            dict: {'next_page_token', 'published_after', 'batch_number', 'consecutive_empty_batches',
+                   'done', 'collected_video_ids', 'passed_records'} (저장된 상태가 없으면 None)
+        """
+        search_key = self.make_search_key(keyword, region_code, order)
+
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT next_page_token, published_after, batch_number, consecutive_empty_batches, done "
+                "FROM search_progress WHERE search_key = ?",
+                (search_key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            video_rows = self.conn.execute(
+                "SELECT video_id, record FROM search_videos WHERE search_key = ? ORDER BY rowid",
+                (search_key,)
+            ).fetchall()
+
+        return {
+            'next_page_token': row[0],
+            'published_after': row[1],
+            'batch_number': row[2],
+            'consecutive_empty_batches': row[3],
+            'done': bool(row[4]),
+            'collected_video_ids': [video_id for video_id, _ in video_rows],
+            'passed_records': [json.loads(record) for _, record in video_rows if record is not None],
+        }
+
+    def save_search_batch(self, keyword, region_code, order, next_page_token, published_after,
+                          batch_number, consecutive_empty_batches, collected_video_ids, passed_records):
+        """
+        배치 하나가 끝난 뒤 검색 진행 상태 저장
+
+        Args:
+            keyword (str): 검색 키워드
+            region_code (str): 지역 코드
+            order (str): 정렬 순서
+            next_page_token (str): 다음 검색 페이지 토큰
+            published_after (str): 검색에 사용한 publishedAfter 값 (페이지 토큰과 함께 유지)
+            batch_number (int): 완료된 배치 번호
+            consecutive_empty_batches (int): 연속 빈 배치 수
+            collected_video_ids (list): 이번 배치에서 수집한 비디오 ID
+            passed_records (list): 이번 배치에서 품질 필터를 통과한 비디오 레코드
+        """
+        search_key = self.make_search_key(keyword, region_code, order)
+        passed_by_id = {record['video_id']: json.dumps(record, ensure_ascii=False, default=str)
+                        for record in passed_records}
+
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO search_progress "
+                "(search_key, next_page_token, published_after, batch_number, consecutive_empty_batches, done, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, 0, ?)",
+                (search_key, next_page_token, published_after, batch_number, consecutive_empty_batches, time.time())
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO search_videos (search_key, video_id, record) VALUES (?, ?, NULL)",
+                [(search_key, video_id) for video_id in collected_video_ids]
+            )
+            self.conn.executemany(
+                "UPDATE search_videos SET record = ? WHERE search_key = ? AND video_id = ?",
+                [(record, search_key, video_id) for video_id, record in passed_by_id.items()]
+            )
+            self.conn.commit()
+
+    def finish_search(self, keyword, region_code, order):
+        """검색 완료 표시 (목표 달성 또는 더 이상 결과 없음)"""
+        with self._lock:
+            self.conn.execute(
+                "UPDATE search_progress SET done = 1, updated_at = ? WHERE search_key = ?",
+                (time.time(), self.make_search_key(keyword, region_code, order))
+            )
+            self.conn.commit()
+
+    def is_keyword_completed(self, keyword):
+        """키워드 전체 처리(수집, 댓글, DB 저장) 완료 여부"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM keyword_progress WHERE keyword = ?", (keyword,)
+            ).fetchone()
+        return row is not None
+
+    def mark_keyword_completed(self, keyword):
+        """키워드 전체 처리 완료 표시"""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO keyword_progress (keyword, completed_at) VALUES (?, ?)",
+                (keyword, time.time())
+            )
+            self.conn.commit()
+
+    def get_completed_keywords(self):
+        """완료된 키워드 리스트"""
+        with self._lock:
+            rows = self.conn.execute("SELECT keyword FROM keyword_progress ORDER BY completed_at").fetchall()
+        return [row[0] for row in rows]
+
+    def clear(self):
+        """모든 진행 상태 삭제 (새 실행 시작)"""
+        with self._lock:
+            self.conn.executescript("""
+                DELETE FROM search_progress;
+                DELETE FROM search_videos;
+                DELETE FROM keyword_progress;
+            """)
+            self.conn.commit()
+
+    def close(self):
+        """SQLite 연결 종료"""
+        with self._lock:
+            self.conn.close()
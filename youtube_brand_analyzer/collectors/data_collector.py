@@ -69,7 +69,9 @@ class YouTubeBrandCollector:
         self._print_comprehensive_summary(keyword)
         
         print(f"\n✅ 브랜드 분석 완료: '{keyword}'")
-        print(f"API 사용량: {self.youtube_analyzer.get_quota_usage()} 요청")
+        quota_usage = self.youtube_analyzer.get_quota_usage()
+        print(f"API 사용량: {self.youtube_analyzer.request_count} 요청 "
+              f"(오늘 누적 {sum(u['used_units'] for u in quota_usage.values()):,} units)")
         
         return self.collected_data
     
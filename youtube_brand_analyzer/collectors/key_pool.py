@@ -0,0 +1,311 @@
+"""
+YouTube API 키 풀 + 일일 할당량 장부
+
+키별로 오늘(태평양 시간 기준) 사용한 unit을 디스크(SQLite)에 기록하고,
+매 호출 전에 남은 할당량이 가장 많은 키를 골라 부하를 고르게 분산합니다.
+
+호출마다 디스크에 쓰지 않고 메모리에 모은 증분을 일정 units/시간마다(그리고 종료 시) 한 번에
+`used = used + ?`로 더하므로, 여러 스레드와 여러 프로세스가 같은 장부를 써도 사용량이 유실되지 않습니다.
+
+사용법:
+    pool = YouTubeKeyPool(["key1", "key2"])
+    api_key = pool.acquire(QUOTA_COSTS['search.list'])  # 100 units 예약
+    ...
+    pool.mark_exhausted(api_key)  # quotaExceeded 응답을 받은 경우
+    print(pool.get_usage())
+"""
+
+import os
+import sys
+import time
+import atexit
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import YOUTUBE_DAILY_QUOTA_PER_KEY
+
+# YouTube Data API v3 엔드포인트별 할당량 비용 (units)
+QUOTA_COSTS = {
+    'search.list': 100,
+    'videos.list': 1,
+    'channels.list': 1,
+    'commentThreads.list': 1,
+    'comments.list': 1,
+}
+
+# 할당량은 태평양 시간 자정에 초기화됨
+QUOTA_TIMEZONE = ZoneInfo('America/Los_Angeles')
+
+DEFAULT_LEDGER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'data', 'cache', 'youtube_quota_ledger.sqlite3'
+)
+
+# 미반영 사용량을 장부에 반영하는 주기 (예약한 units 또는 경과 시간 중 먼저 도달한 쪽)
+FLUSH_EVERY_UNITS = 100
+FLUSH_INTERVAL_SECONDS = 5
+
+
+class YouTubeKeyPool:
+    """여러 API 키의 일일 사용량을 추적하고 여유가 가장 많은 키를 선택하는 키 풀"""
+
+    def __init__(self, api_keys, daily_quota=YOUTUBE_DAILY_QUOTA_PER_KEY, ledger_path=DEFAULT_LEDGER_PATH):
+        """
+        키 풀 초기화
+
+        Args:
+            api_keys (list): API 키 리스트
+            daily_quota (int): 키당 일일 할당량 (units)
+            ledger_path (str): 사용량 장부 SQLite 파일 경로
+        """
+        self.api_keys = list(api_keys)
+        self.daily_quota = daily_quota
+        self.ledger_path = ledger_path
+        self._lock = threading.Lock()        # 메모리 사용량
+        self._flush_lock = threading.Lock()  # 장부 쓰기 (한 번에 하나의 flush)
+
+        # 장부에는 키 원문 대신 해시 지문을 저장
+        self._fingerprints = {key: self._fingerprint(key) for key in self.api_keys}
+
+        self._date = self._quota_date()
+        self._usage = {}         # fingerprint -> {'used': int, 'exhausted': bool, 'calls': {endpoint: int}}
+        self._pending = {}       # 마지막 저장 이후 이 프로세스에서 추가된 사용량
+        self._pending_units = 0
+        self._last_flush = time.monotonic()
+
+        os.makedirs(os.path.dirname(ledger_path), exist_ok=True)
+        # 여러 수집 프로세스가 같은 장부를 공유할 수 있도록 WAL + 잠금 대기
+        self.conn = sqlite3.connect(ledger_path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS key_usage (
+                quota_date TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                used INTEGER NOT NULL DEFAULT 0,
+                exhausted INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (quota_date, fingerprint)
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS key_calls (
+                quota_date TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                endpoint TEXT NOT NULL,
+                calls INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (quota_date, fingerprint, endpoint)
+            )
+        """)
+        self.conn.commit()
+        self._load()
+
+        # 종료 시 남은 증분 반영
+        atexit.register(self.flush)
+
+    @staticmethod
+    def _fingerprint(api_key):
+        """장부 저장용 키 지문"""
+        return hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def _quota_date():
+        """현재 할당량 기준 날짜 (태평양 시간)"""
+        return datetime.now(QUOTA_TIMEZONE).date().isoformat()
+
+    @staticmethod
+    def _empty_entry():
+        return {'used': 0, 'exhausted': False, 'calls': {}}
+
+    def _read_ledger(self, date):
+        """디스크 장부의 해당 날짜 사용량 읽기 (호출자가 _flush_lock 보유)"""
+        ledger = {}
+        for fingerprint, used, exhausted in self.conn.execute(
+            "SELECT fingerprint, used, exhausted FROM key_usage WHERE quota_date = ?", (date,)
+        ):
+            ledger[fingerprint] = {'used': used, 'exhausted': bool(exhausted), 'calls': {}}
+
+        for fingerprint, endpoint, calls in self.conn.execute(
+            "SELECT fingerprint, endpoint, calls FROM key_calls WHERE quota_date = ?", (date,)
+        ):
+            ledger.setdefault(fingerprint, self._empty_entry())['calls'][endpoint] = calls
+        return ledger
+
+    def _load(self):
+        """장부 로드 및 현재 키 목록에 맞게 초기화"""
+        with self._flush_lock:
+            disk_usage = self._read_ledger(self._date)
+        with self._lock:
+            self._apply_ledger(disk_usage)
+
+    def _apply_ledger(self, disk_usage):
+        """디스크 사용량 + 아직 반영하지 않은 증분으로 메모리 사용량 갱신 (호출자가 _lock 보유)"""
+        self._usage = {}
+        for fingerprint in self._fingerprints.values():
+            entry = self._empty_entry()
+            disk_entry = disk_usage.get(fingerprint)
+            if disk_entry:
+                entry['used'] = disk_entry['used']
+                entry['exhausted'] = disk_entry['exhausted']
+                entry['calls'] = dict(disk_entry['calls'])
+            self._usage[fingerprint] = entry
+
+        for fingerprint, delta in self._pending.items():
+            self._add_delta(self._usage.setdefault(fingerprint, self._empty_entry()), delta)
+
+    def _roll_over_if_needed(self):
+        """태평양 시간 자정이 지났으면 사용량 초기화"""
+        today = self._quota_date()
+        if today != self._date:
+            print(f"[QUOTA] 할당량 초기화 (태평양 시간 {today})")
+            self._date = today
+            self._pending = {}
+            self._pending_units = 0
+            self._usage = {fp: self._empty_entry() for fp in self._fingerprints.values()}
+
+    def flush(self):
+        """
+        이 프로세스의 미반영 사용량을 디스크 장부에 더하고, 다른 프로세스의 사용량까지 반영
+
+        증분은 한 트랜잭션 안에서 `used = used + ?`로 더하므로 다른 프로세스가
+        같은 장부에 동시에 써도 사용량이 덮어써지지 않습니다.
+        """
+        with self._flush_lock:
+            with self._lock:
+                date, pending = self._date, self._pending
+                self._pending = {}
+                self._pending_units = 0
+                self._last_flush = time.monotonic()
+
+            try:
+                with self.conn:
+                    for fingerprint, delta in pending.items():
+                        self.conn.execute(
+                            "INSERT INTO key_usage (quota_date, fingerprint, used, exhausted) VALUES (?, ?, ?, ?) "
+                            "ON CONFLICT (quota_date, fingerprint) DO UPDATE SET "
+                            "used = used + excluded.used, exhausted = MAX(exhausted, excluded.exhausted)",
+                            (date, fingerprint, delta['used'], int(delta['exhausted']))
+                        )
+                        self.conn.executemany(
+                            "INSERT INTO key_calls (quota_date, fingerprint, endpoint, calls) VALUES (?, ?, ?, ?) "
+                            "ON CONFLICT (quota_date, fingerprint, endpoint) DO UPDATE SET calls = calls + excluded.calls",
+                            [(date, fingerprint, endpoint, count) for endpoint, count in delta['calls'].items()]
+                        )
+                    # 지난 날짜 사용량은 더 이상 필요 없음
+                    self.conn.execute("DELETE FROM key_usage WHERE quota_date < ?", (date,))
+                    self.conn.execute("DELETE FROM key_calls WHERE quota_date < ?", (date,))
+                disk_usage = self._read_ledger(date)
+            except sqlite3.Error as e:
+                print(f"[WARNING] 할당량 장부 저장 실패: {e}")
+                # 반영하지 못한 증분은 다음 flush에서 다시 시도
+                with self._lock:
+                    if self._date == date:
+                        for fingerprint, delta in pending.items():
+                            self._add_delta(self._pending.setdefault(fingerprint, self._empty_entry()), delta)
+                return
+
+            with self._lock:
+                if self._date == date:
+                    self._apply_ledger(disk_usage)
+
+    @staticmethod
+    def _add_delta(entry, delta):
+        """사용량 항목에 증분 더하기"""
+        entry['used'] += delta['used']
+        entry['exhausted'] = entry['exhausted'] or delta['exhausted']
+        for endpoint, count in delta['calls'].items():
+            entry['calls'][endpoint] = entry['calls'].get(endpoint, 0) + count
+
+    def _record(self, fingerprint, units=0, endpoint=None, exhausted=False):
+        """메모리 사용량과 미반영 증분에 동시에 기록"""
+        delta = {'used': units, 'exhausted': exhausted, 'calls': {endpoint: 1} if endpoint else {}}
+        for target in (self._usage, self._pending):
+            self._add_delta(target.setdefault(fingerprint, self._empty_entry()), delta)
+        self._pending_units += units
+
+    def _headroom(self, fingerprint):
+        """키의 남은 할당량"""
+        entry = self._usage[fingerprint]
+        if entry['exhausted']:
+            return 0
+        return self.daily_quota - entry['used']
+
+    def acquire(self, units, endpoint=None):
+        """
+        남은 할당량이 가장 많은 키를 선택하고 units만큼 예약
+
+        Args:
+            units (int): 이번 호출의 할당량 비용
+            endpoint (str): 엔드포인트 이름 (예: 'search.list', 통계용)
+
+        Returns:
+            str: 선택된 API 키 (사용 가능한 키가 없으면 None)
+        """
+        with self._lock:
+            self._roll_over_if_needed()
+
+            best_key = None
+            best_headroom = units - 1
+            for key in self.api_keys:
+                headroom = self._headroom(self._fingerprints[key])
+                if headroom > best_headroom:
+                    best_key = key
+                    best_headroom = headroom
+
+            if best_key is None:
+                return None
+
+            self._record(self._fingerprints[best_key], units=units, endpoint=endpoint)
+            flush = (self._pending_units >= FLUSH_EVERY_UNITS
+                     or time.monotonic() - self._last_flush >= FLUSH_INTERVAL_SECONDS)
+
+        if flush:
+            self.flush()
+        return best_key
+
+    def mark_exhausted(self, api_key):
+        """
+        quotaExceeded 응답을 받은 키를 오늘 하루 사용 불가로 표시
+
+        Args:
+            api_key (str): 소진된 API 키
+        """
+        with self._lock:
+            self._roll_over_if_needed()
+            fingerprint = self._fingerprints[api_key]
+            if not self._usage[fingerprint]['exhausted']:
+                index = self.api_keys.index(api_key) + 1
+                print(f"\n[KEY POOL] API 키 #{index} 할당량 소진 (장부 사용량: {self._usage[fingerprint]['used']:,} units)")
+            self._record(fingerprint, exhausted=True)
+
+        # 소진 표시는 다른 프로세스도 바로 알 수 있도록 즉시 반영
+        self.flush()
+
+    def available_key_count(self):
+        """오늘 아직 사용 가능한 키 수"""
+        with self._lock:
+            self._roll_over_if_needed()
+            return sum(1 for key in self.api_keys if self._headroom(self._fingerprints[key]) > 0)
+
+    def get_usage(self):
+        """
+        키별 오늘 사용량 반환
+
+        Returns:
+            dict: {'#1 (...abcd)': {'used_units', 'remaining_units', 'exhausted', 'calls'}, ...}
+        """
+        with self._lock:
+            self._roll_over_if_needed()
+            usage = {}
+            for index, key in enumerate(self.api_keys, 1):
+                entry = self._usage[self._fingerprints[key]]
+                usage[f"#{index} (...{key[-4:]})"] = {
+                    'used_units': entry['used'],
+                    'remaining_units': max(0, self._headroom(self._fingerprints[key])),
+                    'exhausted': entry['exhausted'],
+                    'calls': dict(entry['calls']),
+                }
+            return usage
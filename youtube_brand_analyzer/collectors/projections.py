@@ -0,0 +1,181 @@
+"""
+YouTube API 부분 응답(part=, fields=) 프로젝션
+
+수집기는 기본적으로 모든 part와 필드를 요청하지만, 파이프라인은 일부 컬럼만 저장합니다.
+소비자(파이프라인, raw 아카이브, 통계 갱신)가 필요한 컬럼을 선언하면
+컬럼 → API 필드 경로 매핑으로 최소한의 part 목록과 fields 마스크를 만듭니다.
+
+사용법:
+    projection = VideoProjection(['video_id', 'title', 'view_count'])
+    params = {'part': projection.part, 'fields': projection.fields, 'id': ids_string}
+"""
+
+# videos().list 레코드 컬럼 → API 필드 경로 (part/field/...)
+VIDEO_COLUMN_FIELDS = {
+    'video_id': ['id'],
+    'title': ['snippet/title'],
+    'description': ['snippet/description'],
+    'channel_id': ['snippet/channelId'],
+    'channel_title': ['snippet/channelTitle'],
+    'published_at': ['snippet/publishedAt'],
+    'category_id': ['snippet/categoryId'],
+    'default_language': ['snippet/defaultLanguage'],
+    'default_audio_language': ['snippet/defaultAudioLanguage'],
+    'live_broadcast_content': ['snippet/liveBroadcastContent'],
+    'tags': ['snippet/tags'],
+    'thumbnail_default': ['snippet/thumbnails/default/url'],
+    'thumbnail_medium': ['snippet/thumbnails/medium/url'],
+    'thumbnail_high': ['snippet/thumbnails/high/url'],
+    'thumbnail_standard': ['snippet/thumbnails/standard/url'],
+    'thumbnail_maxres': ['snippet/thumbnails/maxres/url'],
+    'view_count': ['statistics/viewCount'],
+    'like_count': ['statistics/likeCount'],
+    'dislike_count': ['statistics/dislikeCount'],
+    'favorite_count': ['statistics/favoriteCount'],
+    'comment_count': ['statistics/commentCount'],
+    'engagement_rate': ['statistics/viewCount', 'statistics/likeCount', 'statistics/commentCount'],
+    'duration_seconds': ['contentDetails/duration'],
+    'duration_iso': ['contentDetails/duration'],
+    'dimension': ['contentDetails/dimension'],
+    'definition': ['contentDetails/definition'],
+    'caption': ['contentDetails/caption'],
+    'licensed_content': ['contentDetails/licensedContent'],
+    'content_rating': ['contentDetails/contentRating'],
+    'projection': ['contentDetails/projection'],
+    'has_custom_thumbnail': ['contentDetails/hasCustomThumbnail'],
+    'upload_status': ['status/uploadStatus'],
+    'privacy_status': ['status/privacyStatus'],
+    'license': ['status/license'],
+    'embeddable': ['status/embeddable'],
+    'public_stats_viewable': ['status/publicStatsViewable'],
+    'made_for_kids': ['status/madeForKids'],
+    'self_declared_made_for_kids': ['status/selfDeclaredMadeForKids'],
+    'topic_ids': ['topicDetails/topicIds'],
+    'relevant_topic_ids': ['topicDetails/relevantTopicIds'],
+    'topic_categories': ['topicDetails/topicCategories'],
+    'recording_date': ['recordingDetails/recordingDate'],
+    'location_latitude': ['recordingDetails/location/latitude'],
+    'location_longitude': ['recordingDetails/location/longitude'],
+    'location_altitude': ['recordingDetails/location/altitude'],
+}
+
+# 수집 로직(채널 조회, 품질 필터)에 항상 필요한 필드
+VIDEO_REQUIRED_FIELDS = [
+    'id', 'snippet/channelId', 'snippet/categoryId',
+    'statistics/viewCount', 'statistics/likeCount', 'statistics/commentCount',
+]
+
+# commentThreads().list 레코드 컬럼 → 댓글 리소스(snippet) 필드 경로
+COMMENT_COLUMN_FIELDS = {
+    'comment_id': ['id'],
+    'author_display_name': ['snippet/authorDisplayName'],
+    'author_profile_image_url': ['snippet/authorProfileImageUrl'],
+    'author_channel_url': ['snippet/authorChannelUrl'],
+    'author_channel_id': ['snippet/authorChannelId'],
+    'comment_text_display': ['snippet/textDisplay'],
+    'comment_text_original': ['snippet/textOriginal'],
+    'comment_text_length': ['snippet/textDisplay'],
+    'like_count': ['snippet/likeCount'],
+    'moderation_status': ['snippet/moderationStatus'],
+    'published_at': ['snippet/publishedAt'],
+    'updated_at': ['snippet/updatedAt'],
+    'viewer_rating': ['snippet/viewerRating'],
+    'can_rate': ['snippet/canRate'],
+}
+
+# search().list: video_id와 다음 페이지 토큰만 사용
+SEARCH_PART = 'id'
+SEARCH_FIELDS = 'nextPageToken,items(id(videoId))'
+
+# videos().list: 통계 스냅샷(refresh_stats.py)은 조회수/좋아요/댓글 수만 사용
+STATISTICS_PART = 'statistics'
+STATISTICS_FIELDS = 'items(id,statistics(viewCount,likeCount,commentCount))'
+
+# channels().list: get_channel_info가 채널 캐시에 저장하는 필드 (캐시를 공유하므로 고정)
+CHANNEL_PART = 'snippet,statistics'
+CHANNEL_FIELDS = ('items(id,snippet(title,description,customUrl,publishedAt,country),'
+                  'statistics(subscriberCount,videoCount,viewCount))')
+
+
+def build_fields_mask(paths, collection='items', extra=None):
+    """
+    필드 경로 목록을 YouTube fields 파라미터 문법으로 변환
+
+    예: ['id', 'snippet/title', 'snippet/thumbnails/default/url']
+        → 'items(id,snippet(title,thumbnails(default(url))))'
+
+    Args:
+        paths (list): 'part/field/...' 형식의 경로 리스트
+        collection (str): 경로를 감쌀 최상위 컬렉션 이름
+        extra (list): 최상위에 추가할 필드 (예: ['nextPageToken'])
+
+    Returns:
+        str: fields 마스크
+    """
+    tree = {}
+    for path in paths:
+        node = tree
+        for name in path.split('/'):
+            node = node.setdefault(name, {})
+
+    def render(node):
+        return ','.join(name if not children else f"{name}({render(children)})"
+                        for name, children in node.items())
+
+    parts = list(extra or [])
+    parts.append(f"{collection}({render(tree)})")
+    return ','.join(parts)
+
+
+class VideoProjection:
+    """videos().list 요청용 part/fields 프로젝션"""
+
+    def __init__(self, columns=None):
+        """
+        Args:
+            columns (list): 필요한 비디오 레코드 컬럼 (None이면 모든 컬럼)
+                            매핑에 없는 컬럼(keyword, channel_* 등)은 API 필드가 필요 없으므로 무시
+        """
+        if columns is None:
+            columns = list(VIDEO_COLUMN_FIELDS)
+
+        paths = list(VIDEO_REQUIRED_FIELDS)
+        for column in columns:
+            for path in VIDEO_COLUMN_FIELDS.get(column, []):
+                if path not in paths:
+                    paths.append(path)
+
+        self.columns = columns
+        self.part = ','.join(dict.fromkeys(path.split('/')[0] for path in paths if path != 'id'))
+        self.fields = build_fields_mask(paths)
+
+
+class CommentProjection:
+    """commentThreads().list (및 답글 확장용 comments().list) 요청용 part/fields 프로젝션"""
+
+    def __init__(self, columns=None):
+        """
+        Args:
+            columns (list): 필요한 댓글 레코드 컬럼 (None이면 모든 컬럼)
+        """
+        if columns is None:
+            columns = list(COMMENT_COLUMN_FIELDS)
+
+        # 댓글 ID(최상위 댓글/답글 연결)와 본문은 항상 필요
+        comment_paths = ['id', 'snippet/textDisplay']
+        for column in columns:
+            for path in COMMENT_COLUMN_FIELDS.get(column, []):
+                if path not in comment_paths:
+                    comment_paths.append(path)
+
+        thread_paths = ['snippet/totalReplyCount']
+        thread_paths += [f"snippet/topLevelComment/{path}" for path in comment_paths]
+        thread_paths += [f"replies/comments/{path}" for path in comment_paths]
+
+        self.columns = columns
+        self.part = 'snippet,replies'
+        self.fields = build_fields_mask(thread_paths, extra=['nextPageToken'])
+
+        # comments().list(parentId=...) 답글 확장용
+        self.reply_part = 'snippet'
+        self.reply_fields = build_fields_mask(comment_paths, extra=['nextPageToken'])
@@ -0,0 +1,346 @@
+"""
+단계별 품질 필터 (filter plan, DataFrame 열 단위 평가)
+
+videos().list 데이터만으로 판단할 수 있는 조건(카테고리, 참여율)을 먼저 평가하고,
+통과한 비디오만 채널 정보를 조회해 채널 조건(국가, 구독자/총 조회수)을 평가합니다.
+탈락한 비디오의 채널은 조회하지 않으므로 channels().list 호출이 줄어듭니다.
+
+조건은 비디오마다 파이썬 루프로 평가하지 않고 배치 전체를 DataFrame 열 연산으로 평가하며,
+탈락 사유 문자열도 탈락한 행에 대해서만 열 단위로 만듭니다.
+기준값은 config.settings.QUALITY_FILTER_THRESHOLDS에서 읽으므로
+수집 중 필터와 youtube_videos_raw 재필터(evaluate)가 같은 기준을 사용합니다.
+
+사용법:
+    plan = build_quality_filter_plan()
+    survivors = plan.run_stage(VIDEO_STAGE, batch_video_data)
+    ...  # survivors의 채널 정보만 조회
+    passed = plan.run_stage(CHANNEL_STAGE, survivors)
+    plan.print_summary()
+
+    # 저장된 raw 데이터 일괄 재필터
+    result_df = plan.evaluate(raw_videos_df)
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import QUALITY_FILTER_THRESHOLDS
+
+VIDEO_STAGE = 'video'
+CHANNEL_STAGE = 'channel'
+
+# 조건 평가에 사용하는 컬럼과 값이 없을 때의 기본값 (None: 문자열 컬럼, 없으면 None 그대로)
+FILTER_COLUMN_DEFAULTS = {
+    'category_id': None,
+    'engagement_rate': 0.0,
+    'channel_country': None,
+    'channel_subscriber_count': 0,
+    'channel_total_view_count': 0,
+}
+
+# 비디오 단계에서 탈락해 채널을 조회하지 않은 행은 채널 단계를 평가할 수 없음
+MISSING_CHANNEL_REASON = '채널 정보 없음 (수집 시 채널 미조회)'
+
+
+def compute_engagement_rates(frame):
+    """
+    참여율(%) = (좋아요 + 댓글) / 조회수 * 100 을 열 단위로 계산 (조회수 0이면 0.0)
+
+    Args:
+        frame (pd.DataFrame): view_count, like_count, comment_count 컬럼을 가진 DataFrame
+
+    Returns:
+        pd.Series: 소수점 4자리로 반올림한 참여율
+    """
+    def column(name):
+        if name not in frame:
+            return pd.Series(0.0, index=frame.index)
+        return pd.to_numeric(frame[name], errors='coerce').fillna(0).astype('float64')
+
+    views = column('view_count')
+    rates = (column('like_count') + column('comment_count')) / views.where(views > 0) * 100
+    return rates.fillna(0.0).round(4)
+
+
+def _prepare_columns(frame):
+    """필터 컬럼을 NumPy 배열로 꺼냄 (없거나 비어 있는 숫자 값은 기본값, 문자열 값은 None)"""
+    columns = {}
+    for name, default in FILTER_COLUMN_DEFAULTS.items():
+        if name not in frame:
+            values = np.full(len(frame), default, dtype=object if default is None else 'float64')
+        elif default is None:
+            values = frame[name].to_numpy(dtype=object, na_value=None)
+        else:
+            values = pd.to_numeric(frame[name], errors='coerce').fillna(default).to_numpy(dtype='float64')
+        columns[name] = values
+    return columns
+
+
+def _has_channel_data(frame):
+    """
+    채널 정보가 있는 행 (채널 컬럼이 모두 비어 있으면 채널을 조회하지 않은 행)
+
+    예전에 저장된 raw 행은 조회하지 않은 채널을 NULL 대신 ''/0으로 저장했으므로 같이 취급합니다.
+    """
+    def missing(name, empty):
+        if name not in frame:
+            return pd.Series(True, index=frame.index)
+        return frame[name].isna() | (frame[name] == empty)
+
+    return ~(missing('channel_country', '')
+             & missing('channel_subscriber_count', 0)
+             & missing('channel_total_view_count', 0))
+
+
+class _RowSubset(dict):
+    """탈락 행의 컬럼 배열 (조건이 실제로 사용하는 컬럼만 잘라냄)"""
+
+    def __init__(self, columns, positions):
+        super().__init__()
+        self._columns = columns
+        self._positions = positions
+
+    def __missing__(self, name):
+        values = self[name] = self._columns[name][self._positions]
+        return values
+
+
+def format_values(values, template):
+    """
+    values의 각 값을 template.format(value)로 변환 (서로 다른 값마다 한 번만 포맷)
+
+    Args:
+        values (np.ndarray): 값 배열
+        template (str): 예: '{:.2f}'
+
+    Returns:
+        np.ndarray: 문자열(object) 배열 (None 값은 template.format(None))
+    """
+    codes, uniques = pd.factorize(values)
+    missing = [template.format(None)] if (codes < 0).any() else ['']
+    formatted = np.array([template.format(value) for value in uniques] + missing, dtype=object)
+    return formatted[codes]
+
+
+def _join_reasons(failures, size):
+    """조건별 (탈락 행 위치, 탈락 사유)를 '; '로 이어 붙인 배열 (통과한 행은 None)"""
+    joined = np.full(size, None, dtype=object)
+    for failed_positions, reasons in failures:
+        current = joined[failed_positions]
+        first = pd.isna(current)
+        current[first] = reasons[first]
+        current[~first] = current[~first] + '; ' + reasons[~first]
+        joined[failed_positions] = current
+    return joined
+
+
+class FilterPredicate:
+    """품질 필터 조건 하나"""
+
+    def __init__(self, name, label, mask, reason):
+        """
+        Args:
+            name (str): 카운터 키
+            label (str): 출력용 이름 (예: '카테고리 불일치')
+            mask (callable): {컬럼: 배열} -> bool 배열 (True면 통과)
+            reason (callable): 탈락 행의 {컬럼: 배열} -> str 배열 (탈락 사유)
+        """
+        self.name = name
+        self.label = label
+        self.mask = mask
+        self.reason = reason
+
+
+class QualityFilterPlan:
+    """단계 순서대로 조건을 평가하고 단계별/조건별 통과·탈락 수를 기록"""
+
+    def __init__(self, stages, thresholds=None):
+        """
+        Args:
+            stages (list): [(stage_name, [FilterPredicate, ...]), ...] - 평가 순서대로
+            thresholds (dict): 이 계획이 사용하는 기준값 (출력/리포트용)
+        """
+        self.stages = stages
+        self.thresholds = thresholds or {}
+        self.reset_counters()
+
+    def reset_counters(self):
+        """카운터 초기화 (배치 시작 시 호출)"""
+        self.stage_counts = {stage: {'passed': 0, 'failed': 0} for stage, _ in self.stages}
+        self.predicate_failures = {p.name: 0 for _, predicates in self.stages for p in predicates}
+
+    def evaluate_stage(self, stage, frame):
+        """
+        한 단계의 조건을 DataFrame 열 단위로 평가
+
+        단계 안의 조건은 모두 평가하여 탈락 사유를 빠짐없이 남깁니다.
+
+        Args:
+            stage (str): 단계 이름 (VIDEO_STAGE, CHANNEL_STAGE)
+            frame (pd.DataFrame): 평가할 비디오 (필터 컬럼이 없으면 기본값으로 평가)
+
+        Returns:
+            tuple: (passed: bool Series, fail_reason: 탈락 사유 Series - 통과한 행은 None)
+        """
+        predicates = dict(self.stages)[stage]
+        columns = _prepare_columns(frame)
+        passed = np.ones(len(frame), dtype=bool)
+        failures = []
+
+        for predicate in predicates:
+            predicate_passed = np.asarray(predicate.mask(columns), dtype=bool)
+            failed_positions = np.flatnonzero(~predicate_passed)
+            self.predicate_failures[predicate.name] += len(failed_positions)
+            if len(failed_positions):
+                failed_columns = _RowSubset(columns, failed_positions)
+                failures.append((failed_positions, np.asarray(predicate.reason(failed_columns), dtype=object)))
+            passed &= predicate_passed
+
+        passed_count = int(passed.sum())
+        self.stage_counts[stage]['passed'] += passed_count
+        self.stage_counts[stage]['failed'] += len(frame) - passed_count
+        return (pd.Series(passed, index=frame.index),
+                pd.Series(_join_reasons(failures, len(frame)), index=frame.index, dtype=object))
+
+    def run_stage(self, stage, videos):
+        """
+        비디오 dict 리스트에 한 단계를 적용
+
+        탈락한 비디오는 quality_filter_passed=False와 filter_fail_reason으로 표시합니다.
+
+        Args:
+            stage (str): 단계 이름 (VIDEO_STAGE, CHANNEL_STAGE)
+            videos (list): 비디오 데이터 리스트
+
+        Returns:
+            list: 이 단계를 통과한 비디오 리스트
+        """
+        if not videos:
+            return []
+
+        frame = pd.DataFrame(videos, columns=list(FILTER_COLUMN_DEFAULTS))
+        passed, fail_reason = self.evaluate_stage(stage, frame)
+
+        survivors = []
+        for video, video_passed, reason in zip(videos, passed.tolist(), fail_reason.tolist()):
+            video['quality_filter_passed'] = video_passed
+            video['filter_fail_reason'] = reason
+            if video_passed:
+                survivors.append(video)
+        return survivors
+
+    def evaluate(self, frame, recompute_engagement=True):
+        """
+        DataFrame 전체에 모든 단계를 적용 (youtube_videos_raw 일괄 재필터용)
+
+        수집 시와 같은 순서로, 앞 단계를 통과한 행만 다음 단계 조건을 평가합니다.
+        수집 때 비디오 단계에서 탈락해 채널 정보가 없는 행은 채널 단계를 평가하지 않고
+        quality_filter_passed를 NA, filter_fail_reason을 MISSING_CHANNEL_REASON으로 둡니다.
+
+        Args:
+            frame (pd.DataFrame): 비디오 DataFrame (raw 테이블 컬럼)
+            recompute_engagement (bool): view/like/comment_count로 engagement_rate를 다시 계산
+
+        Returns:
+            pd.DataFrame: engagement_rate, quality_filter_passed(boolean, 판단 불가는 NA),
+                          filter_fail_reason을 채운 복사본
+        """
+        result = frame.copy()
+        if recompute_engagement or 'engagement_rate' not in result:
+            result['engagement_rate'] = compute_engagement_rates(result)
+
+        passed = pd.Series(True, index=result.index, dtype='boolean')
+        fail_reason = pd.Series(None, index=result.index, dtype=object)
+        has_channel_data = _has_channel_data(result)
+
+        for stage, _ in self.stages:
+            if stage == CHANNEL_STAGE:
+                unknown = passed.fillna(False) & ~has_channel_data
+                passed[unknown] = pd.NA
+                fail_reason[unknown] = MISSING_CHANNEL_REASON
+
+            candidates = result[passed.fillna(False).astype(bool)]
+            if candidates.empty:
+                break
+            stage_passed, stage_reason = self.evaluate_stage(stage, candidates)
+            failed_index = stage_passed.index[~stage_passed]
+            fail_reason[failed_index] = stage_reason[failed_index]
+            passed[failed_index] = False
+
+        result['quality_filter_passed'] = passed
+        result['filter_fail_reason'] = fail_reason
+        return result
+
+    def get_counts(self):
+        """
+        단계별/조건별 집계
+
+        Returns:
+            dict: {'stages': {stage: {'passed', 'failed'}}, 'predicates': {name: failed_count}}
+        """
+        return {'stages': self.stage_counts, 'predicates': self.predicate_failures}
+
+    def print_summary(self):
+        """단계별 결과 출력"""
+        for stage, predicates in self.stages:
+            counts = self.stage_counts[stage]
+            print(f"    [{stage} 단계] 통과 {counts['passed']}개 / 탈락 {counts['failed']}개")
+            for predicate in predicates:
+                print(f"      - {predicate.label}: {self.predicate_failures[predicate.name]}개")
+
+
+def build_quality_filter_plan(**overrides):
+    """
+    품질 필터 계획 생성
+
+    Args:
+        **overrides: QUALITY_FILTER_THRESHOLDS 중 바꿀 값
+            target_category (str): 카테고리 ID (28 = Science & Technology)
+            target_channel_country (str): 채널 국가
+            min_subscriber_count (int): 최소 구독자 수
+            min_channel_total_views (int): 최소 채널 총 조회수 (구독자 조건과 OR)
+            min_engagement_rate (float): 최소 참여율 (%)
+
+    Returns:
+        QualityFilterPlan: 비디오 단계 → 채널 단계 순서의 필터 계획
+    """
+    unknown = set(overrides) - set(QUALITY_FILTER_THRESHOLDS)
+    if unknown:
+        raise ValueError(f"알 수 없는 품질 필터 기준: {', '.join(sorted(unknown))}")
+    thresholds = {**QUALITY_FILTER_THRESHOLDS, **overrides}
+
+    video_predicates = [
+        FilterPredicate(
+            'category', '카테고리 불일치',
+            lambda c: c['category_id'] == str(thresholds['target_category']),
+            lambda c: format_values(c['category_id'], '카테고리 불일치 (실제: {})')
+        ),
+        FilterPredicate(
+            'engagement', '참여율 미달',
+            lambda c: c['engagement_rate'] >= thresholds['min_engagement_rate'],
+            lambda c: format_values(c['engagement_rate'], '참여율 미달 ({:.2f}%)')
+        ),
+    ]
+    channel_predicates = [
+        FilterPredicate(
+            'country', '채널 국가 불일치',
+            lambda c: c['channel_country'] == thresholds['target_channel_country'],
+            lambda c: format_values(c['channel_country'], '채널 국가 불일치 (실제: {})')
+        ),
+        FilterPredicate(
+            'channel_size', '채널 규모 미달',
+            lambda c: ((c['channel_subscriber_count'] >= thresholds['min_subscriber_count'])
+                       | (c['channel_total_view_count'] >= thresholds['min_channel_total_views'])),
+            lambda c: (format_values(c['channel_subscriber_count'].astype('int64'), '채널 규모 미달 (구독자: {:,}, ')
+                       + format_values(c['channel_total_view_count'].astype('int64'), '총조회: {:,})'))
+        ),
+    ]
+    return QualityFilterPlan([
+        (VIDEO_STAGE, video_predicates),
+        (CHANNEL_STAGE, channel_predicates),
+    ], thresholds=thresholds)
@@ -0,0 +1,174 @@
+"""
+YouTube search().list 페이지 캐시 (압축 SQLite)
+
+search.list는 페이지당 100 units라서 중단 후 재실행하면 같은 페이지에 할당량을 다시 씁니다.
+(q, regionCode, order, publishedAfter, pageToken) 기준으로 응답을 zlib 압축해 저장하고,
+신선도 유지 시간(TTL) 안의 재실행은 API 대신 캐시에서 응답을 돌려줍니다.
+
+사용법:
+    cache = SearchPageCache(ttl_hours=6)
+    response = cache.get(search_params)
+    if response is None:
+        response = ...  # search().list 호출
+        cache.put(search_params, response)
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import SEARCH_CACHE_TTL_HOURS
+from collectors.key_pool import QUOTA_COSTS
+from common.run_metrics import get_run_metrics
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'data', 'cache', 'youtube_search_pages.sqlite3'
+)
+
+
+class SearchPageCache:
+    """검색 파라미터 기준 search().list 응답 TTL 캐시"""
+
+    def __init__(self, db_path=DEFAULT_CACHE_PATH, ttl_hours=SEARCH_CACHE_TTL_HOURS):
+        """
+        캐시 초기화
+
+        Args:
+            db_path (str): SQLite 파일 경로
+            ttl_hours (float): 캐시 신선도 유지 시간 (0이면 캐시 사용 안 함)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_hours * 3600
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # 같은 호스트의 여러 수집 프로세스(batch_collect.py --queue)가 같은 파일을 공유하므로 WAL + 잠금 대기
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS search_pages (
+                cache_key TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+        self.purge_expired()
+
+    @staticmethod
+    def make_key(search_params):
+        """
+        검색 파라미터로 캐시 키 생성
+
+        기본 90일 검색은 publishedAfter를 자정 단위로 맞추므로 같은 날의 재실행이 같은 키를 갖습니다.
+        증분 수집처럼 시각까지 지정한 검색은 다른 창이므로 값을 그대로 키에 사용합니다.
+        maxResults도 페이지 내용이 달라지므로 키에 포함합니다.
+
+        Args:
+            search_params (dict): search().list 파라미터
+
+        Returns:
+            str: 캐시 키 (sha256)
+        """
+        key_fields = {
+            'q': search_params.get('q'),
+            'regionCode': search_params.get('regionCode'),
+            'order': search_params.get('order'),
+            'publishedAfter': search_params.get('publishedAfter'),
+            'pageToken': search_params.get('pageToken'),
+            'maxResults': search_params.get('maxResults'),
+        }
+        raw = json.dumps(key_fields, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, search_params):
+        """
+        캐시된 검색 응답 조회
+
+        Args:
+            search_params (dict): search().list 파라미터
+
+        Returns:
+            dict: 캐시된 응답 (없거나 오래되었으면 None)
+        """
+        if self.ttl_seconds <= 0:
+            return None
+
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT data FROM search_pages WHERE cache_key = ? AND fetched_at >= ?",
+                (self.make_key(search_params), time.time() - self.ttl_seconds)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                get_run_metrics().increment('cache_misses', cache='search')
+                return None
+
+            self.hits += 1
+            get_run_metrics().increment('cache_hits', cache='search')
+            return json.loads(zlib.decompress(row[0]).decode('utf-8'))
+
+    def put(self, search_params, response):
+        """
+        API 응답 저장
+
+        Args:
+            search_params (dict): search().list 파라미터
+            response (dict): search().list 응답
+        """
+        if self.ttl_seconds <= 0:
+            return
+
+        data = zlib.compress(json.dumps(response, ensure_ascii=False).encode('utf-8'))
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO search_pages (cache_key, data, fetched_at) VALUES (?, ?, ?)",
+                (self.make_key(search_params), data, time.time())
+            )
+            self.conn.commit()
+
+    def purge_expired(self):
+        """
+        TTL이 지난 항목 삭제
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+        with self._lock:
+            cursor = self.conn.execute(
+                "DELETE FROM search_pages WHERE fetched_at < ?",
+                (time.time() - self.ttl_seconds,)
+            )
+            self.conn.commit()
+            return cursor.rowcount
+
+    def get_stats(self):
+        """
+        캐시 적중 통계
+
+        Returns:
+            dict: {'hits', 'misses', 'hit_rate', 'units_saved'}
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total * 100, 1) if total else 0.0,
+            'units_saved': self.hits * QUOTA_COSTS['search.list'],
+        }
+
+    def close(self):
+        """SQLite 연결 종료"""
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,175 @@
+"""
+실행 단위 비디오 상세 정보 캐시
+
+배치 수집에서 겹치는 키워드("samsung qled", "qled tv", "samsung neo qled")는 같은 video_id를
+반복해서 검색합니다. videos().list 응답 항목을 video_id 기준으로 한 번의 실행 동안 보관하여
+각 비디오는 실행당 한 번만 조회되도록 합니다.
+
+메모리 항목 수가 max_memory_items를 넘으면 오래된 항목부터 spill_path의 SQLite 파일로 내보냅니다
+(spill_path가 없으면 메모리에만 보관).
+
+사용법:
+    cache = VideoDetailCache(spill_path='data/cache/video_spill.sqlite3')
+    analyzer = YouTubeAnalyzer(video_cache=cache)
+    ...
+    print(cache.get_stats())
+    cache.close()
+"""
+
+import os
+import sys
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import VIDEO_CACHE_MAX_MEMORY_ITEMS
+from common.run_metrics import get_run_metrics
+
+
+class VideoDetailCache:
+    """video_id 기준 videos().list 응답 항목 캐시 (실행 동안 유지)"""
+
+    def __init__(self, max_memory_items=VIDEO_CACHE_MAX_MEMORY_ITEMS, spill_path=None):
+        """
+        캐시 초기화
+
+        Args:
+            max_memory_items (int): 메모리에 보관할 최대 항목 수 (spill_path가 있을 때만 적용)
+            spill_path (str): 초과 항목을 내보낼 SQLite 파일 경로 (None이면 디스크 사용 안 함)
+        """
+        self.max_memory_items = max_memory_items
+        self.spill_path = spill_path
+        self._items = OrderedDict()  # video_id -> (item, payload_bytes)
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.calls_saved = 0
+        self.bytes_saved = 0
+        self.spilled = 0
+
+        # spill 파일은 처음 한도를 넘을 때 생성
+        self._spill_conn = None
+
+    def _get_spilled(self, video_id):
+        """디스크로 내보낸 항목 조회"""
+        if self._spill_conn is None:
+            return None
+        row = self._spill_conn.execute(
+            "SELECT data FROM videos WHERE video_id = ?", (video_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), len(row[0])
+
+    def _spill_overflow(self):
+        """메모리 한도를 넘은 오래된 항목을 디스크로 이동"""
+        if not self.spill_path or len(self._items) <= self.max_memory_items:
+            return
+
+        if self._spill_conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.spill_path)), exist_ok=True)
+            self._spill_conn = sqlite3.connect(self.spill_path, check_same_thread=False)
+            self._spill_conn.execute(
+                "CREATE TABLE IF NOT EXISTS videos (video_id TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+            self._spill_conn.commit()
+
+        overflow = []
+        while len(self._items) > self.max_memory_items:
+            video_id, (item, _) = self._items.popitem(last=False)
+            overflow.append((video_id, json.dumps(item, ensure_ascii=False)))
+        if overflow:
+            self._spill_conn.executemany(
+                "INSERT OR REPLACE INTO videos (video_id, data) VALUES (?, ?)", overflow
+            )
+            self._spill_conn.commit()
+            self.spilled += len(overflow)
+
+    def get_many(self, video_ids):
+        """
+        캐시에서 비디오 항목 조회
+
+        Args:
+            video_ids (list): 비디오 ID 리스트
+
+        Returns:
+            tuple: (hits, misses)
+                hits (dict): {video_id: videos().list 응답 항목}
+                misses (list): API로 조회해야 하는 비디오 ID 리스트
+        """
+        hits = {}
+        misses = []
+        hit_bytes = 0
+
+        with self._lock:
+            for video_id in dict.fromkeys(video_ids):
+                entry = self._items.get(video_id)
+                if entry is not None:
+                    self._items.move_to_end(video_id)
+                else:
+                    entry = self._get_spilled(video_id)
+
+                if entry is None:
+                    misses.append(video_id)
+                else:
+                    hits[video_id] = entry[0]
+                    hit_bytes += entry[1]
+
+            self.hits += len(hits)
+            self.misses += len(misses)
+            self.bytes_saved += hit_bytes
+            # 50개 단위 videos().list 호출 기준으로 절약된 호출 수
+            self.calls_saved += (len(hits) + len(misses) + 49) // 50 - (len(misses) + 49) // 50
+
+        metrics = get_run_metrics()
+        metrics.increment('cache_hits', len(hits), cache='video_detail')
+        metrics.increment('cache_misses', len(misses), cache='video_detail')
+        return hits, misses
+
+    def put_many(self, items):
+        """
+        API로 조회한 videos().list 응답 항목 저장
+
+        Args:
+            items (list): videos().list 응답의 items
+        """
+        with self._lock:
+            for item in items:
+                payload_bytes = len(json.dumps(item, ensure_ascii=False))
+                self._items[item['id']] = (item, payload_bytes)
+                self._items.move_to_end(item['id'])
+            self._spill_overflow()
+
+    def get_stats(self):
+        """
+        캐시 통계
+
+        Returns:
+            dict: {'hits', 'misses', 'hit_rate', 'calls_saved', 'bytes_saved', 'spilled'}
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total * 100, 1) if total else 0.0,
+            'calls_saved': self.calls_saved,
+            'bytes_saved': self.bytes_saved,
+            'spilled': self.spilled,
+        }
+
+    def close(self):
+        """캐시 비우기 및 spill 파일 삭제"""
+        with self._lock:
+            self._items.clear()
+            if self._spill_conn is not None:
+                self._spill_conn.close()
+                self._spill_conn = None
+                try:
+                    os.remove(self.spill_path)
+                except OSError:
+                    pass
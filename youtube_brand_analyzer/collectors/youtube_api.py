@@ -1,23 +1,70 @@
 import os
 import sys
+import httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import time
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.settings import *
+from collectors.key_pool import YouTubeKeyPool, QUOTA_COSTS
+from collectors.channel_cache import ChannelCache
+from collectors.search_cache import SearchPageCache
+from collectors.quality_filter import (
+    build_quality_filter_plan, compute_engagement_rates, VIDEO_STAGE, CHANNEL_STAGE
+)
+from collectors.video_records import VideoRecordTable
+from collectors.projections import (
+    VideoProjection, CommentProjection, SEARCH_PART, SEARCH_FIELDS, CHANNEL_PART, CHANNEL_FIELDS,
+    STATISTICS_PART, STATISTICS_FIELDS
+)
+from common.http_replay import create_google_http
+from common.run_metrics import get_run_metrics
+
+# channels().list로 채우는 비디오 컬럼
+CHANNEL_INFO_COLUMNS = [
+    'channel_subscriber_count', 'channel_video_count', 'channel_total_view_count', 'channel_description',
+    'channel_country', 'channel_custom_url', 'channel_published_at',
+]
+
+# HttpError 사유(error_details[0]['reason'])별 처리
+# 키의 일일 할당량 소진 - 키를 소진 처리하고 다른 키로 재시도
+QUOTA_ERROR_REASONS = {'quotaExceeded', 'dailyLimitExceeded'}
+# 일시적 호출 제한 (동시 댓글 수집에서 자주 발생) - 백오프 후 재시도
+RATE_LIMIT_ERROR_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+# 요청 자체의 문제 - 재시도해도 같은 결과이므로 바로 실패
+PERMANENT_ERROR_REASONS = {
+    'commentsDisabled', 'forbidden', 'videoNotFound', 'badRequest',
+    'channelNotFound', 'commentNotFound', 'commentThreadNotFound', 'invalidParameter',
+}
+RATE_LIMIT_BACKOFF_SECONDS = 2
+
+
+class QuotaExhaustedError(Exception):
+    """모든 API 키의 할당량이 소진되었을 때 발생"""
+
 
 class YouTubeAnalyzer:
-    def __init__(self, api_keys=None):
+    def __init__(self, api_keys=None, key_pool=None, channel_cache=None, video_cache=None,
+                 search_cache=None, video_columns=None, comment_columns=None, checkpoint=None):
         """
         YouTube API 클라이언트 초기화
 
         Args:
             api_keys (list): API 키 리스트 (None이면 YOUTUBE_API_KEYS 사용)
+            key_pool (YouTubeKeyPool): 공유할 키 풀 (None이면 api_keys로 새로 생성)
+            channel_cache (ChannelCache): 채널 정보 캐시 (None이면 기본 SQLite 캐시 사용)
+            video_cache (VideoDetailCache): 실행 단위 비디오 상세 캐시 (None이면 사용 안 함)
+            search_cache (SearchPageCache): 검색 페이지 캐시 (None이면 기본 SQLite 캐시 사용)
+            video_columns (list): 필요한 비디오 컬럼 - videos().list part/fields 계산용 (None이면 모든 컬럼)
+            comment_columns (list): 필요한 댓글 컬럼 - commentThreads().list part/fields 계산용 (None이면 모든 컬럼)
+            checkpoint (CollectionCheckpoint): 검색 진행 상태 저장소 (None이면 체크포인트 사용 안 함)
         """
         # API 키 리스트 초기화
         if api_keys is None:
@@ -25,76 +72,149 @@ class YouTubeAnalyzer:
         else:
             self.api_keys = api_keys if isinstance(api_keys, list) else [api_keys]
 
-        self.current_key_index = 0
-        self.api_key = self.api_keys[self.current_key_index]
-        self.youtube = build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, developerKey=self.api_key)
+        # 키별 일일 사용량 장부 기반 키 풀
+        self.key_pool = key_pool or YouTubeKeyPool(self.api_keys)
+        self.api_keys = self.key_pool.api_keys
         self.request_count = 0
 
-        print(f"YouTubeAnalyzer 초기화: {len(self.api_keys)}개 API 키 사용 가능")
+        # channel_id 기준 채널 정보 TTL 캐시
+        self.channel_cache = channel_cache or ChannelCache()
+
+        # 배치 실행 동안 여러 키워드가 공유하는 videos().list 응답 캐시
+        self.video_cache = video_cache
+
+        # 검색 파라미터 기준 search().list 응답 캐시 (재실행 시 할당량 절약)
+        self.search_cache = search_cache or SearchPageCache()
+
+        # 소비자가 선언한 컬럼만 요청하는 부분 응답(part=, fields=) 프로젝션
+        self.video_projection = VideoProjection(video_columns)
+        self.comment_projection = CommentProjection(comment_columns)
+
+        # 배치마다 검색 진행 상태를 저장하여 중단된 실행을 이어서 수집
+        self.checkpoint = checkpoint
+
+        # 서비스 객체는 패키지에 포함된 discovery 문서로 한 번만 생성하고, API 키는 요청마다 key=로 전달
+        # (키를 바꿀 때 build()를 다시 호출하지 않음)
+        self.service = build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, static_discovery=True,
+                             http=httplib2.Http(timeout=YOUTUBE_HTTP_TIMEOUT))
 
-    def _rotate_api_key(self):
+        # 스레드 동시 수집용 상태 (httplib2는 스레드 안전하지 않으므로 스레드별 keep-alive 연결 사용)
+        self._local = threading.local()
+        self._count_lock = threading.Lock()
+
+        print(f"YouTubeAnalyzer 초기화: {len(self.api_keys)}개 API 키 사용 가능 "
+              f"(오늘 사용 가능: {self.key_pool.available_key_count()}개)")
+
+    def _http_for_thread(self):
         """
-        다음 API 키로 로테이션
+        현재 스레드의 HTTP 전송 객체 반환 (스레드마다 한 번만 생성, 모든 키와 호출이 연결을 재사용)
 
         Returns:
-            bool: 로테이션 성공 여부 (더 이상 사용 가능한 키가 없으면 False)
+            httplib2.Http (HTTP_REPLAY_MODE가 설정되면 녹화/재생 객체)
         """
-        if self.current_key_index >= len(self.api_keys) - 1:
-            print(f"\n[ERROR] 모든 API 키의 할당량이 소진되었습니다 ({len(self.api_keys)}개 키 모두 사용)")
-            return False
-
-        self.current_key_index += 1
-        self.api_key = self.api_keys[self.current_key_index]
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = create_google_http() or httplib2.Http(timeout=YOUTUBE_HTTP_TIMEOUT)
+        return http
+
+    def _count_request(self):
+        """스레드 안전하게 API 요청 수 증가"""
+        with self._count_lock:
+            self.request_count += 1
+
+    @staticmethod
+    def _error_reason(error):
+        """
+        HttpError의 첫 번째 오류 사유
 
-        # YouTube 클라이언트 재생성
-        self.youtube = build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, developerKey=self.api_key)
+        Args:
+            error (HttpError): API 오류
 
-        print(f"\n[KEY ROTATION] API 키 #{self.current_key_index + 1}로 전환됨 (잔여 키: {len(self.api_keys) - self.current_key_index - 1}개)")
-        return True
+        Returns:
+            str: 사유 (예: 'quotaExceeded', 'commentsDisabled'), 응답에 없으면 None
+        """
+        details = getattr(error, 'error_details', None)
+        if isinstance(details, list) and details and isinstance(details[0], dict):
+            return details[0].get('reason')
+        return None
 
-    def _execute_with_retry(self, api_call_func, max_retries=3):
+    def _execute_with_retry(self, endpoint, params, max_retries=3):
         """
-        API 호출을 실행하고 quota exceeded 에러 시 자동으로 키 로테이션
+        키 풀에서 여유가 가장 많은 키를 골라 API 호출을 실행
+
+        quotaExceeded 응답을 받으면 해당 키를 소진 처리하고 다른 키로 즉시 재시도합니다.
+        오류 사유별로 호출 제한(rateLimitExceeded 등)은 지수 백오프 후 재시도하고,
+        요청 자체의 문제(commentsDisabled, videoNotFound 등)는 재시도 없이 바로 발생시킵니다.
 
         Args:
-            api_call_func: 실행할 API 호출 함수
+            endpoint (str): 엔드포인트 이름 (예: 'search.list', 'videos.list')
+            params (dict): API 요청 파라미터
             max_retries: 최대 재시도 횟수 (다른 에러의 경우)
 
         Returns:
             API 응답 결과
         """
+        resource, method = endpoint.split('.')
+        units = QUOTA_COSTS.get(endpoint, 1)
+
         retries = 0
-        while retries < max_retries:
+        while True:
+            api_key = self.key_pool.acquire(units, endpoint=endpoint)
+            if api_key is None:
+                print(f"\n[ERROR] 모든 API 키의 할당량이 소진되었습니다 ({len(self.api_keys)}개 키 모두 사용)")
+                raise QuotaExhaustedError("모든 API 키의 할당량이 소진되었습니다")
+
+            metrics = get_run_metrics()
+            metrics.increment('api_calls', platform='youtube', endpoint=endpoint)
+            metrics.increment('quota_units', units, platform='youtube', endpoint=endpoint)
             try:
-                return api_call_func()
+                with metrics.span('api.youtube', endpoint=endpoint):
+                    request = getattr(getattr(self.service, resource)(), method)(key=api_key, **params)
+                    response = request.execute(http=self._http_for_thread())
+                self._count_request()
+                return response
             except HttpError as e:
+                self._count_request()
+                metrics.increment('api_errors', platform='youtube', endpoint=endpoint,
+                                  status=getattr(e.resp, 'status', None))
                 error_content = str(e.content) if hasattr(e, 'content') else str(e)
+                reason = self._error_reason(e)
 
-                # Quota exceeded 에러 확인
-                if 'quotaExceeded' in error_content or 'quota' in error_content.lower():
+                # Quota exceeded 에러 확인 (사유가 없는 응답은 본문으로 판단)
+                if reason in QUOTA_ERROR_REASONS or (
+                    reason is None and ('quotaExceeded' in error_content or 'quota' in error_content.lower())
+                ):
                     print(f"\n[QUOTA EXCEEDED] API 할당량 초과 감지")
-                    if self._rotate_api_key():
-                        print(f"[RETRY] 새 API 키로 재시도...")
-                        retries = 0  # 키 로테이션 성공 시 재시도 카운트 리셋
-                        continue
-                    else:
-                        # 모든 키 소진
-                        raise Exception("모든 API 키의 할당량이 소진되었습니다") from e
-                else:
-                    # 다른 에러는 재시도
-                    retries += 1
+                    self.key_pool.mark_exhausted(api_key)
+                    print(f"[RETRY] 다른 API 키로 재시도...")
+                    continue
+
+                # 요청 자체의 문제 (댓글 비활성화, 존재하지 않는 리소스 등)는 재시도해도 같은 결과
+                if reason in PERMANENT_ERROR_REASONS or e.resp.status == 404:
+                    raise
+
+                retries += 1
+                if reason in RATE_LIMIT_ERROR_REASONS:
+                    # 일시적인 호출 제한은 잠시 기다리면 풀리므로 점점 길게 기다렸다가 재시도
                     if retries < max_retries:
-                        print(f"\n[API ERROR] 에러 발생, 재시도 중... ({retries}/{max_retries})")
-                        time.sleep(2)
+                        delay = RATE_LIMIT_BACKOFF_SECONDS * 2 ** (retries - 1)
+                        print(f"\n[RATE LIMIT] {reason}, {delay}초 후 재시도... ({retries}/{max_retries})")
+                        time.sleep(delay)
                         continue
-                    else:
-                        raise
+                    raise
+
+                # 다른 에러는 재시도
+                if retries < max_retries:
+                    print(f"\n[API ERROR] 에러 발생, 재시도 중... ({retries}/{max_retries})")
+                    time.sleep(2)
+                    continue
+                raise
 
     def get_comprehensive_video_data(self, keyword, region_code="US", max_results=MAX_RESULTS_PER_SEARCH,
                                    published_after=None, order="viewCount",
                                    apply_quality_filter=True):
         """
-        키워드로 비디오 검색 후 모든 정보를 한번에 수집
+        키워드로 비디오 검색 후 모든 정보를 한번에 수집 (iter_video_batches의 리스트 반환 래퍼)
 
         Args:
             keyword: 검색 키워드
@@ -105,21 +225,79 @@ class YouTubeAnalyzer:
             apply_quality_filter: True면 품질 필터 적용 (카테고리, 구독자, 참여율)
 
         Returns:
-            (video_data, video_ids): 비디오 데이터 리스트와 비디오 ID 리스트
+            (video_data, video_ids, raw_video_data):
+                video_data (VideoRecordView): 필터 통과 비디오 (to_dataframe()으로 변환)
+                video_ids (list): 필터 통과 비디오 ID 리스트
+                raw_video_data (VideoRecordView): 필터링 전 모든 비디오 (video_data와 같은 테이블 공유,
+                                                  체크포인트에서 복원한 비디오는 제외)
         """
+        video_data = None
+        raw_video_data = None
+
         try:
-            # 품질 필터 기준
-            TARGET_CATEGORY = "28"  # Science & Technology
-            TARGET_CHANNEL_COUNTRY = "US"  # US 채널만
-            MIN_SUBSCRIBER_COUNT = 10000
-            MIN_CHANNEL_TOTAL_VIEWS = 100000000  # 100M
-            MIN_ENGAGEMENT_RATE = 2.0  # 2%
+            for batch_videos, batch_raw_videos in self.iter_video_batches(
+                keyword, region_code=region_code, max_results=max_results,
+                published_after=published_after, order=order,
+                apply_quality_filter=apply_quality_filter
+            ):
+                if video_data is None:
+                    video_data = batch_videos.table.view([])
+                    raw_video_data = batch_videos.table.view([])
+                video_data.extend(batch_videos)
+                raw_video_data.extend(batch_raw_videos)
+        except HttpError:
+            video_data = None
+
+        if video_data is None:
+            empty_view = VideoRecordTable().view()
+            return empty_view, [], empty_view
+
+        return video_data, video_data.column('video_id'), raw_video_data
+
+    def iter_video_batches(self, keyword, region_code="US", max_results=MAX_RESULTS_PER_SEARCH,
+                           published_after=None, order="viewCount", apply_quality_filter=True):
+        """
+        키워드로 비디오를 검색하고 배치(50개)마다 필터 결과를 바로 내보내는 제너레이터
+
+        배치가 필터를 통과하는 즉시 반환하므로, 소비자는 검색이 계속되는 동안
+        이미 받은 비디오의 분석/DB 저장을 시작할 수 있습니다.
+        필터 통과 비디오가 max_results개가 되면 종료합니다 (마지막 배치는 잘라서 반환).
+
+        체크포인트가 설정되어 있으면 배치를 내보낸 뒤 진행 상태를 저장하고, 저장된 상태가 있으면
+        이전에 통과한 비디오를 첫 배치로 내보낸 뒤 저장된 페이지 토큰부터 검색을 이어갑니다.
+        복원한 첫 배치의 batch_raw_videos는 비어 있습니다 (raw 행은 이전 실행에서 이미 내보냄).
+
+        Args:
+            keyword: 검색 키워드
+            region_code: 지역 코드
+            max_results: 필터링 후 원하는 최대 비디오 수
+            published_after: 게시 날짜 필터
+            order: 정렬 순서 (viewCount, relevance, date 등)
+            apply_quality_filter: True면 품질 필터 적용 (카테고리, 구독자, 참여율)
+
+        Yields:
+            (batch_videos, batch_raw_videos):
+                batch_videos (VideoRecordView): 이번 배치에서 필터를 통과한 비디오 (비어 있을 수 있음)
+                batch_raw_videos (VideoRecordView): 이번 배치에서 수집한 모든 비디오
+                두 뷰는 같은 VideoRecordTable(batch_videos.table)을 공유합니다.
 
+        Raises:
+            HttpError: 재시도 후에도 실패한 API 오류
+        """
+        try:
+            # 품질 필터 기준
             BATCH_SIZE = 50  # 한번에 50개씩 수집
 
-            filtered_videos = []
+            # 비디오 조건(카테고리, 참여율) → 채널 조건(국가, 규모) 순서로 평가
+            # 기준값은 config.settings.QUALITY_FILTER_THRESHOLDS
+            filter_plan = build_quality_filter_plan()
+            thresholds = filter_plan.thresholds
+
+            # 레코드는 컬럼 테이블에 한 번만 저장하고 raw/필터링 목록은 행 번호만 보관
+            video_table = VideoRecordTable()
+            all_raw_videos = video_table.view()  # 모든 수집 데이터 (필터링 전)
+            filtered_videos = video_table.view([])
             filtered_video_ids = set()  # 중복 방지를 위한 ID 세트
-            all_raw_videos = []  # 모든 수집 데이터 (필터링 전)
             all_collected_video_ids = set()  # 중복 체크를 위해 set으로 변경
             next_page_token = None
             total_api_calls = 0
@@ -127,10 +305,11 @@ class YouTubeAnalyzer:
             print(f"\n{'='*80}")
             if apply_quality_filter:
                 print(f"품질 필터링 모드 활성화:")
-                print(f"  - 채널 국가: {TARGET_CHANNEL_COUNTRY} (US 채널만)")
-                print(f"  - 카테고리: {TARGET_CATEGORY} (Science & Technology)")
-                print(f"  - 최소 구독자: {MIN_SUBSCRIBER_COUNT:,} OR 채널 총 조회수: {MIN_CHANNEL_TOTAL_VIEWS:,}")
-                print(f"  - 최소 참여율: {MIN_ENGAGEMENT_RATE}%")
+                print(f"  - 채널 국가: {thresholds['target_channel_country']}")
+                print(f"  - 카테고리: {thresholds['target_category']}")
+                print(f"  - 최소 구독자: {thresholds['min_subscriber_count']:,} "
+                      f"OR 채널 총 조회수: {thresholds['min_channel_total_views']:,}")
+                print(f"  - 최소 참여율: {thresholds['min_engagement_rate']}%")
                 print(f"  - 목표 비디오 수: {max_results}개")
                 print(f"  - 배치 크기: {BATCH_SIZE}개씩 수집")
             else:
@@ -142,13 +321,51 @@ class YouTubeAnalyzer:
             consecutive_empty_batches = 0  # 연속으로 새 비디오가 없는 배치 수 (중복만 나오는 경우)
             MAX_EMPTY_BATCHES = 3  # 3번 연속 중복만 나오면 중단
 
+            # 게시 날짜 필터 (최근 90일, 날짜 단위로 맞춰 재실행 시 같은 검색 캐시 키 사용)
+            if published_after:
+                if published_after.tzinfo is not None:
+                    published_after = published_after.astimezone(timezone.utc).replace(tzinfo=None)
+                published_after_param = published_after.replace(microsecond=0).isoformat() + 'Z'
+            else:
+                ninety_days_ago = datetime.now() - timedelta(days=90)
+                ninety_days_ago = ninety_days_ago.replace(hour=0, minute=0, second=0, microsecond=0)
+                published_after_param = ninety_days_ago.isoformat() + 'Z'
+
+            # 체크포인트에서 이전 진행 상태 복원 (페이지 토큰과 같은 publishedAfter 사용)
+            search_done = False
+            saved_state = None
+            if self.checkpoint is not None:
+                saved_state = self.checkpoint.load_search(keyword, region_code, order)
+            if saved_state:
+                next_page_token = saved_state['next_page_token']
+                published_after_param = saved_state['published_after']
+                batch_number = saved_state['batch_number']
+                consecutive_empty_batches = saved_state['consecutive_empty_batches']
+                search_done = saved_state['done']
+                all_collected_video_ids.update(saved_state['collected_video_ids'])
+
+                for record in saved_state['passed_records']:
+                    if record['video_id'] not in filtered_video_ids:
+                        filtered_videos.append_row(video_table.append(record))
+                        filtered_video_ids.add(record['video_id'])
+
+                print(f"[RESUME] 체크포인트에서 이어서 수집: 배치 {batch_number}개 완료, "
+                      f"수집 {len(all_collected_video_ids)}개, 통과 {len(filtered_videos)}개"
+                      f"{' (검색 완료)' if search_done else ''}")
+                # 복원한 비디오의 raw 행은 이전 실행에서 이미 내보냈으므로 raw 뷰에서 제외
+                if len(filtered_videos) > 0:
+                    yield filtered_videos[:max_results], video_table.view([])
+
             # 필터링된 비디오가 max_results에 도달할 때까지 반복
-            while len(filtered_videos) < max_results:
+            while len(filtered_videos) < max_results and not search_done:
+
                 batch_number += 1
                 print(f"\n[배치 {batch_number}] {BATCH_SIZE}개 비디오 수집 중...")
 
                 # 배치 시작 전 현재까지 수집된 비디오 ID 개수 기록 (중복 체크용)
                 prev_collected_count = len(all_collected_video_ids)
+                batch_filtered_start = len(filtered_videos)
+                batch_raw_start = len(all_raw_videos)
 
                 # 1단계: 비디오 ID 수집 (한 배치당 200개)
                 batch_video_ids = []
@@ -160,7 +377,8 @@ class YouTubeAnalyzer:
 
                     # 비디오 검색
                     search_params = {
-                        'part': 'snippet',
+                        'part': SEARCH_PART,
+                        'fields': SEARCH_FIELDS,
                         'q': keyword,
                         'type': 'video',
                         'regionCode': region_code,
@@ -169,23 +387,20 @@ class YouTubeAnalyzer:
                         'relevanceLanguage': 'en' if region_code == 'US' else None
                     }
 
-                    # 게시 날짜 필터 (최근 90일)
-                    if published_after:
-                        search_params['publishedAfter'] = published_after.isoformat() + 'Z'
-                    else:
-                        ninety_days_ago = datetime.now() - timedelta(days=90)
-                        search_params['publishedAfter'] = ninety_days_ago.isoformat() + 'Z'
+                    # 게시 날짜 필터
+                    search_params['publishedAfter'] = published_after_param
 
                     # 페이지 토큰 추가
                     if next_page_token:
                         search_params['pageToken'] = next_page_token
 
-                    # API 호출 with automatic key rotation
-                    search_response = self._execute_with_retry(
-                        lambda: self.youtube.search().list(**search_params).execute()
-                    )
-                    self.request_count += 1
-                    total_api_calls += 1
+                    # 신선도 유지 시간 안의 같은 페이지는 캐시에서 재사용
+                    search_response = self.search_cache.get(search_params)
+                    if search_response is None:
+                        # API 호출 with automatic key rotation
+                        search_response = self._execute_with_retry('search.list', search_params)
+                        self.search_cache.put(search_params, search_response)
+                        total_api_calls += 1
 
                     # 비디오 ID 수집 (중복 제거)
                     page_video_ids = [item['id']['videoId'] for item in search_response['items']]
@@ -224,110 +439,118 @@ class YouTubeAnalyzer:
                 # 2단계: 상세 비디오 정보 수집
                 print(f"  비디오 상세 정보 수집 중...")
                 batch_video_data = []
-                channel_ids = set()  # 중복 방지를 위해 set 사용
-
-                for i in range(0, len(batch_video_ids), 50):
-                    batch_ids = batch_video_ids[i:i+50]
-                    ids_string = ','.join(batch_ids)
-
-                    # 모든 video 정보를 한번에 가져오기 with automatic key rotation
-                    video_response = self._execute_with_retry(
-                        lambda ids=ids_string: self.youtube.videos().list(
-                            part='snippet,statistics,contentDetails,status,topicDetails,recordingDetails,localizations',
-                            id=ids
-                        ).execute()
-                    )
-                    self.request_count += 1
-                    total_api_calls += 1
-
-                    for item in video_response['items']:
-                        snippet = item['snippet']
-                        stats = item.get('statistics', {})
-                        content_details = item.get('contentDetails', {})
-                        status = item.get('status', {})
-                        topic_details = item.get('topicDetails', {})
-                        recording_details = item.get('recordingDetails', {})
-
-                        # 지속시간을 초로 변환
-                        duration = self._parse_duration(content_details.get('duration', 'PT0S'))
-
-                        # 채널 ID 수집 (set에 추가하여 자동 중복 제거)
-                        channel_ids.add(snippet['channelId'])
-
-                        batch_video_data.append({
-                            # 검색 관련 정보
-                            'video_id': item['id'],
-                            'search_keyword': keyword,
-                            'search_region': region_code,
-                            'search_order': order,
-                            'created_at': datetime.now().isoformat(),
-
-                            # 기본 정보 (snippet)
-                            'title': snippet.get('title', '').replace('\n', ' ').replace('\r', ' '),
-                            'description': snippet.get('description', '').replace('\n', ' ').replace('\r', ' '),
-                            'channel_id': snippet.get('channelId', ''),
-                            'channel_title': snippet.get('channelTitle', ''),
-                            'published_at': snippet.get('publishedAt', ''),
-                            'category_id': snippet.get('categoryId', ''),
-                            'default_language': snippet.get('defaultLanguage', ''),
-                            'default_audio_language': snippet.get('defaultAudioLanguage', ''),
-                            'live_broadcast_content': snippet.get('liveBroadcastContent', ''),
-                            'tags': ','.join(snippet.get('tags', [])),
-
-                            # 썸네일 정보
-                            'thumbnail_default': snippet.get('thumbnails', {}).get('default', {}).get('url', ''),
-                            'thumbnail_medium': snippet.get('thumbnails', {}).get('medium', {}).get('url', ''),
-                            'thumbnail_high': snippet.get('thumbnails', {}).get('high', {}).get('url', ''),
-                            'thumbnail_standard': snippet.get('thumbnails', {}).get('standard', {}).get('url', ''),
-                            'thumbnail_maxres': snippet.get('thumbnails', {}).get('maxres', {}).get('url', ''),
-
-                            # 통계 정보 (statistics)
-                            'view_count': int(stats.get('viewCount', 0)),
-                            'like_count': int(stats.get('likeCount', 0)),
-                            'dislike_count': int(stats.get('dislikeCount', 0)),
-                            'favorite_count': int(stats.get('favoriteCount', 0)),
-                            'comment_count': int(stats.get('commentCount', 0)),
-
-                            # 콘텐츠 상세 정보 (contentDetails)
-                            'duration_seconds': duration,
-                            'duration_iso': content_details.get('duration', ''),
-                            'dimension': content_details.get('dimension', ''),
-                            'definition': content_details.get('definition', ''),
-                            'caption': content_details.get('caption', ''),
-                            'licensed_content': content_details.get('licensedContent', False),
-                            'content_rating': str(content_details.get('contentRating', {})),
-                            'projection': content_details.get('projection', ''),
-                            'has_custom_thumbnail': content_details.get('hasCustomThumbnail', False),
-
-                            # 상태 정보 (status)
-                            'upload_status': status.get('uploadStatus', ''),
-                            'privacy_status': status.get('privacyStatus', ''),
-                            'license': status.get('license', ''),
-                            'embeddable': status.get('embeddable', False),
-                            'public_stats_viewable': status.get('publicStatsViewable', False),
-                            'made_for_kids': status.get('madeForKids', False),
-                            'self_declared_made_for_kids': status.get('selfDeclaredMadeForKids', False),
-
-                            # 주제 정보 (topicDetails)
-                            'topic_ids': ','.join(topic_details.get('topicIds', [])),
-                            'relevant_topic_ids': ','.join(topic_details.get('relevantTopicIds', [])),
-                            'topic_categories': ','.join(topic_details.get('topicCategories', [])),
-
-                            # 녹화 정보 (recordingDetails)
-                            'recording_date': recording_details.get('recordingDate', ''),
-                            'location_latitude': recording_details.get('location', {}).get('latitude', ''),
-                            'location_longitude': recording_details.get('location', {}).get('longitude', ''),
-                            'location_altitude': recording_details.get('location', {}).get('altitude', ''),
-                        })
-
-                # 3단계: 채널 정보 수집
-                print(f"  채널 정보 수집 중...")
-                batch_channel_data = self.get_channel_info(list(channel_ids))
+
+                # 실행 단위 캐시에 있는 비디오는 API 호출 없이 재사용
+                requests_before = self.request_count
+                video_items = self._fetch_video_items(batch_video_ids)
+                total_api_calls += self.request_count - requests_before
+
+                for item in video_items:
+                    snippet = item['snippet']
+                    stats = item.get('statistics', {})
+                    content_details = item.get('contentDetails', {})
+                    status = item.get('status', {})
+                    topic_details = item.get('topicDetails', {})
+                    recording_details = item.get('recordingDetails', {})
+
+                    # 지속시간을 초로 변환
+                    duration = self._parse_duration(content_details.get('duration', 'PT0S'))
+
+                    batch_video_data.append({
+                        # 검색 관련 정보
+                        'video_id': item['id'],
+                        'search_keyword': keyword,
+                        'search_region': region_code,
+                        'search_order': order,
+                        'created_at': datetime.now().isoformat(),
+
+                        # 기본 정보 (snippet)
+                        'title': snippet.get('title', '').replace('\n', ' ').replace('\r', ' '),
+                        'description': snippet.get('description', '').replace('\n', ' ').replace('\r', ' '),
+                        'channel_id': snippet.get('channelId', ''),
+                        'channel_title': snippet.get('channelTitle', ''),
+                        'published_at': snippet.get('publishedAt', ''),
+                        'category_id': snippet.get('categoryId', ''),
+                        'default_language': snippet.get('defaultLanguage', ''),
+                        'default_audio_language': snippet.get('defaultAudioLanguage', ''),
+                        'live_broadcast_content': snippet.get('liveBroadcastContent', ''),
+                        'tags': ','.join(snippet.get('tags', [])),
+
+                        # 썸네일 정보
+                        'thumbnail_default': snippet.get('thumbnails', {}).get('default', {}).get('url', ''),
+                        'thumbnail_medium': snippet.get('thumbnails', {}).get('medium', {}).get('url', ''),
+                        'thumbnail_high': snippet.get('thumbnails', {}).get('high', {}).get('url', ''),
+                        'thumbnail_standard': snippet.get('thumbnails', {}).get('standard', {}).get('url', ''),
+                        'thumbnail_maxres': snippet.get('thumbnails', {}).get('maxres', {}).get('url', ''),
+
+                        # 통계 정보 (statistics)
+                        'view_count': int(stats.get('viewCount', 0)),
+                        'like_count': int(stats.get('likeCount', 0)),
+                        'dislike_count': int(stats.get('dislikeCount', 0)),
+                        'favorite_count': int(stats.get('favoriteCount', 0)),
+                        'comment_count': int(stats.get('commentCount', 0)),
+
+                        # 콘텐츠 상세 정보 (contentDetails)
+                        'duration_seconds': duration,
+                        'duration_iso': content_details.get('duration', ''),
+                        'dimension': content_details.get('dimension', ''),
+                        'definition': content_details.get('definition', ''),
+                        'caption': content_details.get('caption', ''),
+                        'licensed_content': content_details.get('licensedContent', False),
+                        'content_rating': str(content_details.get('contentRating', {})),
+                        'projection': content_details.get('projection', ''),
+                        'has_custom_thumbnail': content_details.get('hasCustomThumbnail', False),
+
+                        # 상태 정보 (status)
+                        'upload_status': status.get('uploadStatus', ''),
+                        'privacy_status': status.get('privacyStatus', ''),
+                        'license': status.get('license', ''),
+                        'embeddable': status.get('embeddable', False),
+                        'public_stats_viewable': status.get('publicStatsViewable', False),
+                        'made_for_kids': status.get('madeForKids', False),
+                        'self_declared_made_for_kids': status.get('selfDeclaredMadeForKids', False),
+
+                        # 주제 정보 (topicDetails)
+                        'topic_ids': ','.join(topic_details.get('topicIds', [])),
+                        'relevant_topic_ids': ','.join(topic_details.get('relevantTopicIds', [])),
+                        'topic_categories': ','.join(topic_details.get('topicCategories', [])),
+
+                        # 녹화 정보 (recordingDetails)
+                        'recording_date': recording_details.get('recordingDate', ''),
+                        'location_latitude': recording_details.get('location', {}).get('latitude', ''),
+                        'location_longitude': recording_details.get('location', {}).get('longitude', ''),
+                        'location_altitude': recording_details.get('location', {}).get('altitude', ''),
+                    })
+
+                # Engagement rate 계산: (좋아요 + 댓글) / 조회수 * 100 (배치 전체를 열 단위로)
+                if batch_video_data:
+                    engagement_rates = compute_engagement_rates(pd.DataFrame(
+                        batch_video_data, columns=['view_count', 'like_count', 'comment_count']
+                    ))
+                    for video, engagement_rate in zip(batch_video_data, engagement_rates.tolist()):
+                        video['engagement_rate'] = engagement_rate
+
+                # 3단계: 비디오 단계 필터 (videos().list 데이터만 사용, 탈락한 비디오는 채널 조회 생략)
+                if apply_quality_filter:
+                    filter_plan.reset_counters()
+                    channel_lookup_videos = filter_plan.run_stage(VIDEO_STAGE, batch_video_data)
+                else:
+                    channel_lookup_videos = batch_video_data
+
+                # 4단계: 채널 정보 수집 및 비디오 데이터에 추가
+                print(f"  채널 정보 수집 중... (대상 비디오 {len(channel_lookup_videos)}개 / {len(batch_video_data)}개)")
+                channel_ids = {video['channel_id'] for video in channel_lookup_videos}  # 중복 제거
+                requests_before = self.request_count
+                batch_channel_data = self.get_channel_info(list(channel_ids)) if channel_ids else []
                 channel_dict = {ch['channel_id']: ch for ch in batch_channel_data}
-                total_api_calls += (len(channel_ids) + 49) // 50  # 채널 정보 API 호출 추정
+                total_api_calls += self.request_count - requests_before  # 캐시 미스만 API 호출
 
-                # 4단계: 비디오 데이터에 채널 정보 및 engagement_rate 추가
                 for video in batch_video_data:
+                    if apply_quality_filter and not video['quality_filter_passed']:
+                        # 채널을 조회하지 않은 비디오는 채널 컬럼을 NULL로 저장 (''/0은 실제 값으로 오인됨)
+                        video.update(dict.fromkeys(CHANNEL_INFO_COLUMNS))
+                        continue
+
                     channel_info = channel_dict.get(video['channel_id'], {})
                     video.update({
                         'channel_subscriber_count': channel_info.get('subscriber_count', 0),
@@ -339,61 +562,24 @@ class YouTubeAnalyzer:
                         'channel_published_at': channel_info.get('published_at', ''),
                     })
 
-                    # Engagement rate 계산: (좋아요 + 댓글) / 조회수 * 100
-                    view_count = video.get('view_count', 0)
-                    like_count = video.get('like_count', 0)
-                    comment_count = video.get('comment_count', 0)
-                    engagement_rate = ((like_count + comment_count) / view_count * 100) if view_count > 0 else 0.0
-                    video['engagement_rate'] = round(engagement_rate, 4)
-
                 print(f"  비디오 상세 정보 완료: {len(batch_video_data)}개")
 
-                # 5단계: 품질 필터 적용
+                # 5단계: 채널 단계 필터 (비디오 단계를 통과한 비디오만)
                 if apply_quality_filter:
                     print(f"  품질 필터 적용 중...")
                     batch_passed_count = 0
                     batch_new_raw_count = 0  # 새로운 raw 비디오 개수 (중복 제외)
-                    batch_failed_category = 0
-                    batch_failed_channel = 0
-                    batch_failed_engagement = 0
-                    batch_failed_country = 0
 
-                    for video in batch_video_data:
-                        fail_reason = []
-
-                        # 필터 1: 채널 국가 (US만)
-                        if video.get('channel_country') != TARGET_CHANNEL_COUNTRY:
-                            batch_failed_country += 1
-                            fail_reason.append(f"채널 국가 불일치 (실제: {video.get('channel_country')})")
-
-                        # 필터 2: 카테고리
-                        if video.get('category_id') != TARGET_CATEGORY:
-                            batch_failed_category += 1
-                            fail_reason.append(f"카테고리 불일치 (실제: {video.get('category_id')})")
-
-                        # 필터 3: 채널 규모 (구독자 10k+ OR 총 조회수 100M+)
-                        subscriber_count = video.get('channel_subscriber_count', 0)
-                        channel_total_views = video.get('channel_total_view_count', 0)
-                        if subscriber_count < MIN_SUBSCRIBER_COUNT and channel_total_views < MIN_CHANNEL_TOTAL_VIEWS:
-                            batch_failed_channel += 1
-                            fail_reason.append(f"채널 규모 미달 (구독자: {subscriber_count:,}, 총조회: {channel_total_views:,})")
-
-                        # 필터 4: 참여율
-                        if video.get('engagement_rate', 0) < MIN_ENGAGEMENT_RATE:
-                            batch_failed_engagement += 1
-                            fail_reason.append(f"참여율 미달 ({video.get('engagement_rate', 0):.2f}%)")
-
-                        # 필터 결과 기록
-                        video['quality_filter_passed'] = len(fail_reason) == 0
-                        video['filter_fail_reason'] = '; '.join(fail_reason) if fail_reason else None
+                    filter_plan.run_stage(CHANNEL_STAGE, channel_lookup_videos)
 
+                    for video in batch_video_data:
                         # Raw 데이터에 추가 (모든 비디오)
-                        all_raw_videos.append(video.copy())
+                        row = video_table.append(video)
 
                         # 통과한 비디오만 filtered_videos에 추가 (중복 제외)
-                        if len(fail_reason) == 0:
+                        if video['quality_filter_passed']:
                             if video['video_id'] not in filtered_video_ids:
-                                filtered_videos.append(video)
+                                filtered_videos.append_row(row)
                                 filtered_video_ids.add(video['video_id'])
                                 batch_passed_count += 1
 
@@ -401,10 +587,7 @@ class YouTubeAnalyzer:
                     batch_new_raw_count = len(all_collected_video_ids) - prev_collected_count
 
                     print(f"  필터 결과: {batch_passed_count}개 통과 / {len(batch_video_data)}개")
-                    print(f"    - 채널 국가 불일치: {batch_failed_country}개")
-                    print(f"    - 카테고리 불일치: {batch_failed_category}개")
-                    print(f"    - 채널 규모 미달: {batch_failed_channel}개")
-                    print(f"    - 참여율 미달: {batch_failed_engagement}개")
+                    filter_plan.print_summary()
                     print(f"  누적 필터링된 비디오: {len(filtered_videos)}개 / 목표: {max_results}개")
                     print(f"  새로운 raw 비디오: {batch_new_raw_count}개 (중복 제외)")
 
@@ -420,11 +603,11 @@ class YouTubeAnalyzer:
                     for video in batch_video_data:
                         video['quality_filter_passed'] = True
                         video['filter_fail_reason'] = None
-                        all_raw_videos.append(video.copy())
+                        row = video_table.append(video)
 
                         # 중복 체크 후 추가
                         if video['video_id'] not in filtered_video_ids:
-                            filtered_videos.append(video)
+                            filtered_videos.append_row(row)
                             filtered_video_ids.add(video['video_id'])
                             batch_new_count += 1
 
@@ -437,6 +620,24 @@ class YouTubeAnalyzer:
                     else:
                         consecutive_empty_batches = 0  # 새 비디오 있으면 리셋
 
+                # 이번 배치 결과를 바로 내보냄 (목표 수를 넘는 비디오는 제외)
+                yield (filtered_videos[batch_filtered_start:max_results],
+                       all_raw_videos[batch_raw_start:])
+
+                # 배치 진행 상태 저장 (다음 배치는 next_page_token부터)
+                # 소비자가 이 배치를 받아 간 뒤(raw 행 저장 포함)에 저장하므로, 중단 후 이어서 수집할 때
+                # 이 배치의 raw 행을 다시 내보내지 않아도 됩니다.
+                if self.checkpoint is not None:
+                    self.checkpoint.save_search_batch(
+                        keyword, region_code, order,
+                        next_page_token=next_page_token,
+                        published_after=published_after_param,
+                        batch_number=batch_number,
+                        consecutive_empty_batches=consecutive_empty_batches,
+                        collected_video_ids=batch_video_ids,
+                        passed_records=filtered_videos[batch_filtered_start:]
+                    )
+
                 # 목표 달성 확인
                 if len(filtered_videos) >= max_results:
                     print(f"\n[목표 달성] {len(filtered_videos)}개 비디오 수집 완료!")
@@ -452,9 +653,9 @@ class YouTubeAnalyzer:
                 if total_api_calls > 100:
                     print(f"\n  [주의] API 호출 수: {total_api_calls} (할당량: 10,000/day)")
 
-            # 최종 결과 반환
-            final_video_data = filtered_videos[:max_results]  # 정확히 max_results개만 반환
-            final_video_ids = [v['video_id'] for v in final_video_data]
+            # 검색 완료 표시 (--resume 실행 시 검색을 다시 하지 않음)
+            if self.checkpoint is not None:
+                self.checkpoint.finish_search(keyword, region_code, order)
 
             print(f"\n{'='*80}")
             print(f"수집 완료: {keyword} in {region_code}")
@@ -462,22 +663,70 @@ class YouTubeAnalyzer:
             if apply_quality_filter:
                 print(f"  - 필터링 후: {len(filtered_videos)}개")
                 print(f"  - Raw 데이터: {len(all_raw_videos)}개")
-            print(f"  - 최종 반환: {len(final_video_data)}개")
+            print(f"  - 최종 반환: {min(len(filtered_videos), max_results)}개")
             print(f"  - 총 API 호출 수: {total_api_calls}")
+            channel_cache_stats = self.channel_cache.get_stats()
+            print(f"  - 채널 캐시: {channel_cache_stats['hits']}회 적중 / {channel_cache_stats['misses']}회 미스 "
+                  f"(적중률 {channel_cache_stats['hit_rate']}%)")
+            search_cache_stats = self.search_cache.get_stats()
+            print(f"  - 검색 캐시: {search_cache_stats['hits']}회 적중 / {search_cache_stats['misses']}회 미스 "
+                  f"(절약 {search_cache_stats['units_saved']:,} units)")
             print(f"{'='*80}\n")
 
-            return final_video_data, final_video_ids, all_raw_videos
-            
         except HttpError as e:
             print(f"YouTube API 오류: {e}")
-            return [], [], []
+            raise
     
+    def _fetch_video_items(self, video_ids):
+        """
+        videos().list 응답 항목 조회 (비디오 캐시가 있으면 캐시 미스만 API 호출)
+
+        Args:
+            video_ids (list): 비디오 ID 리스트
+
+        Returns:
+            list: videos().list 응답 항목 리스트 (video_ids 순서)
+        """
+        if self.video_cache is not None:
+            cached_items, missing_ids = self.video_cache.get_many(video_ids)
+        else:
+            cached_items, missing_ids = {}, list(dict.fromkeys(video_ids))
+
+        fetched_items = {}
+        for i in range(0, len(missing_ids), 50):
+            ids_string = ','.join(missing_ids[i:i+50])
+
+            # 프로젝션에 포함된 video 정보만 가져오기 with automatic key rotation
+            video_response = self._execute_with_retry('videos.list', {
+                'part': self.video_projection.part,
+                'fields': self.video_projection.fields,
+                'id': ids_string
+            })
+            for item in video_response['items']:
+                fetched_items[item['id']] = item
+
+        if self.video_cache is not None:
+            self.video_cache.put_many(list(fetched_items.values()))
+
+        items = []
+        for video_id in dict.fromkeys(video_ids):
+            item = cached_items.get(video_id) or fetched_items.get(video_id)
+            if item is not None:
+                items.append(item)
+        return items
+
     def get_video_statistics(self, video_ids):
         """비디오 통계 정보 수집"""
         if not video_ids:
             return []
             
         try:
+            # 통계 갱신에 필요한 컬럼만 요청
+            projection = VideoProjection([
+                'view_count', 'like_count', 'comment_count', 'duration_seconds', 'definition',
+                'dimension', 'tags', 'category_id', 'default_language'
+            ])
+
             # 비디오 ID를 50개씩 배치로 처리 (API 제한)
             statistics_data = []
             
@@ -486,13 +735,11 @@ class YouTubeAnalyzer:
                 ids_string = ','.join(batch_ids)
 
                 # API 호출 with automatic key rotation
-                stats_response = self._execute_with_retry(
-                    lambda ids=ids_string: self.youtube.videos().list(
-                        part='statistics,contentDetails,snippet',
-                        id=ids
-                    ).execute()
-                )
-                self.request_count += 1
+                stats_response = self._execute_with_retry('videos.list', {
+                    'part': projection.part,
+                    'fields': projection.fields,
+                    'id': ids_string
+                })
                 
                 for item in stats_response['items']:
                     stats = item['statistics']
@@ -526,34 +773,80 @@ class YouTubeAnalyzer:
             print(f"통계 수집 오류: {e}")
             return []
     
+    def get_video_stat_snapshots(self, video_ids):
+        """
+        비디오 조회수/좋아요/댓글 수 스냅샷 수집 (part=statistics, 50개당 1 unit)
+
+        통계는 매번 새로 받아야 하므로 비디오 상세 캐시를 사용하지 않습니다.
+        할당량이 모두 소진되면 그때까지 수집한 스냅샷만 반환합니다.
+
+        Args:
+            video_ids (list): 비디오 ID 리스트
+
+        Returns:
+            list: [{'video_id', 'view_count', 'like_count', 'comment_count'}, ...]
+                  (삭제/비공개 비디오는 응답에 없으므로 제외)
+        """
+        snapshots = []
+        video_ids = list(dict.fromkeys(video_ids))
+
+        for i in range(0, len(video_ids), 50):
+            try:
+                response = self._execute_with_retry('videos.list', {
+                    'part': STATISTICS_PART,
+                    'fields': STATISTICS_FIELDS,
+                    'id': ','.join(video_ids[i:i+50])
+                })
+            except QuotaExhaustedError:
+                print(f"API 할당량 초과: {len(snapshots)}/{len(video_ids)}개 비디오까지 수집")
+                break
+            except HttpError as e:
+                print(f"통계 스냅샷 수집 오류 (배치 {i // 50 + 1}): {e}")
+                continue
+
+            for item in response.get('items', []):
+                stats = item.get('statistics', {})
+                snapshots.append({
+                    'video_id': item['id'],
+                    'view_count': int(stats.get('viewCount', 0)),
+                    'like_count': int(stats.get('likeCount', 0)),
+                    'comment_count': int(stats.get('commentCount', 0)),
+                })
+
+        print(f"통계 스냅샷 수집 완료: {len(snapshots)}/{len(video_ids)}개 비디오")
+        return snapshots
+
     def get_channel_info(self, channel_ids):
-        """채널 정보 수집"""
+        """
+        채널 정보 수집
+
+        채널 캐시에서 TTL 안의 항목을 먼저 찾고, 캐시에 없는 채널만 channels().list로 조회합니다.
+        """
         if not channel_ids:
             return []
             
         try:
-            # 중복 제거
-            unique_channel_ids = list(set(channel_ids))
-            channel_data = []
+            # 캐시 조회 (중복 제거 포함)
+            cached_channels, missing_channel_ids = self.channel_cache.get_many(channel_ids)
+            channel_data = list(cached_channels.values())
+            fetched_channels = []
             
-            for i in range(0, len(unique_channel_ids), 50):
-                batch_ids = unique_channel_ids[i:i+50]
+            for i in range(0, len(missing_channel_ids), 50):
+                batch_ids = missing_channel_ids[i:i+50]
                 ids_string = ','.join(batch_ids)
 
                 # API 호출 with automatic key rotation
-                channel_response = self._execute_with_retry(
-                    lambda ids=ids_string: self.youtube.channels().list(
-                        part='snippet,statistics,brandingSettings',
-                        id=ids
-                    ).execute()
-                )
-                self.request_count += 1
+                channel_response = self._execute_with_retry('channels.list', {
+                    'part': CHANNEL_PART,
+                    'fields': CHANNEL_FIELDS,
+                    'id': ids_string
+                })
                 
                 for item in channel_response['items']:
                     snippet = item['snippet']
                     stats = item['statistics']
                     
-                    channel_data.append({
+                    fetched_channels.append({
                         'channel_id': item['id'],
                         'channel_title': snippet['title'],
                         'description': snippet['description'][:300],
@@ -566,124 +859,343 @@ class YouTubeAnalyzer:
                         'collected_at': datetime.now().isoformat()
                     })
             
-            print(f"채널 정보 수집 완료: {len(channel_data)}개 채널")
+            self.channel_cache.put_many(fetched_channels)
+            channel_data.extend(fetched_channels)
+
+            print(f"채널 정보 수집 완료: {len(channel_data)}개 채널 "
+                  f"(캐시 {len(cached_channels)}개, API {len(fetched_channels)}개)")
             return channel_data
             
         except HttpError as e:
             print(f"채널 정보 수집 오류: {e}")
             return []
     
-    def get_comprehensive_comments(self, video_ids, max_comments_per_video=MAX_COMMENTS_PER_VIDEO):
-        """비디오 댓글 포괄적 수집 (모든 API 필드 포함)"""
+    def get_comprehensive_comments(self, video_ids, max_comments_per_video=MAX_COMMENTS_PER_VIDEO,
+                                   max_workers=COMMENT_FETCH_WORKERS, expand_replies=EXPAND_COMMENT_REPLIES,
+                                   max_replies_per_video=MAX_EXPANDED_REPLIES_PER_VIDEO,
+                                   reply_workers=REPLY_FETCH_WORKERS):
+        """
+        비디오 댓글 포괄적 수집 (모든 API 필드 포함)
+
+        비디오별 수집을 스레드 풀에서 동시에 실행합니다. 각 비디오는 nextPageToken을 따라
+        max_comments_per_video개의 댓글 스레드를 채울 때까지 페이지를 이어서 수집합니다.
+        expand_replies가 True이면 이어서 답글 확장 단계(_expand_reply_threads)를 실행합니다.
+
+        Args:
+            video_ids (list): 비디오 ID 리스트
+            max_comments_per_video (int): 비디오당 최대 댓글 스레드 수
+            max_workers (int): 동시에 수집할 최대 비디오 수
+            expand_replies (bool): 포함된 답글보다 totalReplyCount가 많은 스레드의 답글을 전부 수집
+            max_replies_per_video (int): 답글 확장으로 비디오당 추가 수집할 최대 답글 수
+            reply_workers (int): 답글 확장을 동시에 수행할 최대 스레드 수
+
+        Returns:
+            list: 댓글 데이터 리스트 (video_ids 순서 유지)
+
+        Raises:
+            QuotaExhaustedError: 수집 중 모든 API 키의 할당량이 소진됨 (일부 댓글만 수집된 상태)
+        """
         if not video_ids:
             return []
-            
+
+        stop_event = threading.Event()
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                executor.submit(self._collect_video_comments, video_id, max_comments_per_video, stop_event)
+                for video_id in video_ids
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException as e:
+                # 모든 키 소진 등 - 남은 워커를 멈추고 다시 발생시켜 키워드가 완료로 기록되지 않게 함
+                if isinstance(e, QuotaExhaustedError):
+                    print(f"API 할당량 초과: 남은 비디오 댓글 수집 중단")
+                stop_event.set()
+                raise
+
+        # 입력 순서대로 결과 병합
         comments_data = []
-        
-        for video_id in video_ids:
+        for future in futures:
+            comments_data.extend(future.result())
+
+        if expand_replies:
+            comments_data = self._expand_reply_threads(comments_data, max_replies_per_video, reply_workers)
+
+        print(f"전체 댓글 수집 완료: {len(comments_data)}개")
+        return comments_data
+
+    def _expand_reply_threads(self, comments_data, max_replies_per_video, max_workers):
+        """
+        답글 확장 단계: commentThreads 응답에 일부만 포함된 답글을 comments().list(parentId=...)로 수집
+
+        reply_count(totalReplyCount)가 포함된 답글 수보다 많은 스레드만 대상으로 하며,
+        비디오별 추가 답글 수는 max_replies_per_video를 넘지 않도록 스레드 순서대로 배분합니다.
+
+        Args:
+            comments_data (list): get_comprehensive_comments가 수집한 댓글 레코드 (비디오/스레드 순서)
+            max_replies_per_video (int): 비디오당 추가 수집할 최대 답글 수
+            max_workers (int): 동시에 확장할 최대 스레드 수
+
+        Returns:
+            list: 추가 답글이 각 스레드의 기존 답글 뒤에 삽입된 댓글 레코드
+
+        Raises:
+            QuotaExhaustedError: 확장 중 모든 API 키의 할당량이 소진됨
+        """
+        known_reply_ids = {}
+        for comment in comments_data:
+            if comment['comment_type'] == 'reply':
+                known_reply_ids.setdefault(comment['parent_comment_id'], set()).add(comment['comment_id'])
+
+        # 확장 대상 스레드와 스레드별 추가 답글 한도 (비디오별 예산에서 차감)
+        remaining_budget = {}
+        tasks = []
+        for comment in comments_data:
+            if comment['comment_type'] != 'top_level':
+                continue
+            known = known_reply_ids.get(comment['comment_id'], set())
+            missing = comment.get('reply_count', 0) - len(known)
+            budget = remaining_budget.setdefault(comment['video_id'], max_replies_per_video)
+            if missing <= 0 or budget <= 0:
+                continue
+            limit = min(missing, budget)
+            remaining_budget[comment['video_id']] = budget - limit
+            tasks.append((comment['video_id'], comment['comment_id'], known, limit))
+
+        if not tasks:
+            return comments_data
+
+        print(f"답글 확장: {len(tasks)}개 스레드 (비디오당 최대 {max_replies_per_video}개 추가)")
+
+        stop_event = threading.Event()
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                executor.submit(self._fetch_thread_replies, video_id, parent_id, known, limit, stop_event): parent_id
+                for video_id, parent_id, known, limit in tasks
+            }
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException as e:
+                if isinstance(e, QuotaExhaustedError):
+                    print(f"API 할당량 초과: 남은 답글 확장 중단")
+                stop_event.set()
+                raise
+
+        extra_replies = {parent_id: future.result() for future, parent_id in futures.items()}
+
+        # 각 스레드의 기존 답글 뒤(다음 최상위 댓글 앞)에 추가 답글 삽입
+        expanded = []
+        current_parent = None
+        for comment in comments_data:
+            if comment['comment_type'] == 'top_level':
+                expanded.extend(extra_replies.get(current_parent, []))
+                current_parent = comment['comment_id']
+            expanded.append(comment)
+        expanded.extend(extra_replies.get(current_parent, []))
+
+        added = len(expanded) - len(comments_data)
+        print(f"답글 확장 완료: {added}개 답글 추가")
+        return expanded
+
+    def _fetch_thread_replies(self, video_id, parent_id, known_reply_ids, limit, stop_event):
+        """
+        스레드 하나의 답글을 comments().list로 페이지 단위 수집 (워커 스레드에서 실행)
+
+        Args:
+            video_id (str): 비디오 ID
+            parent_id (str): 최상위 댓글 ID
+            known_reply_ids (set): 이미 수집된 답글 ID (commentThreads 응답에 포함된 답글)
+            limit (int): 추가 수집할 최대 답글 수
+            stop_event (threading.Event): 설정되면 수집 중단
+
+        Returns:
+            list: 새로 수집한 답글 레코드 리스트
+        """
+        replies = []
+        next_page_token = None
+
+        while len(replies) < limit and not stop_event.is_set():
+            params = {
+                'part': self.comment_projection.reply_part,
+                'fields': self.comment_projection.reply_fields,
+                'parentId': parent_id,
+                'maxResults': 100,
+            }
+            if next_page_token:
+                params['pageToken'] = next_page_token
+
+            try:
+                response = self._execute_with_retry('comments.list', params)
+            except HttpError as e:
+                print(f"답글 수집 오류 {parent_id}: {e}")
+                break
+
+            items = response.get('items', [])
+            for reply in items:
+                if reply['id'] not in known_reply_ids and len(replies) < limit:
+                    replies.append(self._parse_reply(reply, video_id, parent_id))
+
+            next_page_token = response.get('nextPageToken')
+            if not next_page_token or not items:
+                break
+
+        return replies
+
+    def _collect_video_comments(self, video_id, max_comments_per_video, stop_event):
+        """
+        단일 비디오의 댓글 스레드를 페이지 단위로 수집 (워커 스레드에서 실행)
+
+        Args:
+            video_id (str): 비디오 ID
+            max_comments_per_video (int): 최대 댓글 스레드 수
+            stop_event (threading.Event): 설정되면 수집 중단
+
+        Returns:
+            list: 해당 비디오의 댓글 데이터 리스트
+        """
+        video_comments = []
+        thread_count = 0
+        next_page_token = None
+
+        while thread_count < max_comments_per_video and not stop_event.is_set():
+            params = {
+                'part': self.comment_projection.part,
+                'fields': self.comment_projection.fields,
+                'videoId': video_id,
+                'maxResults': min(max_comments_per_video - thread_count, 100),
+                'order': 'relevance'
+            }
+            if next_page_token:
+                params['pageToken'] = next_page_token
+
             try:
                 # 댓글 스레드 수집 (최상위 댓글 + 답글) with automatic key rotation
-                comments_response = self._execute_with_retry(
-                    lambda vid=video_id, max_c=max_comments_per_video: self.youtube.commentThreads().list(
-                        part='snippet,replies',
-                        videoId=vid,
-                        maxResults=min(max_c, 100),
-                        order='relevance'
-                    ).execute()
-                )
-                self.request_count += 1
-                
-                for item in comments_response['items']:
-                    # 최상위 댓글
-                    top_comment = item['snippet']['topLevelComment']['snippet']
-                    
-                    comments_data.append({
-                        # 기본 식별 정보
-                        'video_id': video_id,
-                        'comment_id': item['snippet']['topLevelComment']['id'],
-                        'comment_type': 'top_level',
-                        'parent_comment_id': '',
-                        'collected_at': datetime.now().isoformat(),
-                        
-                        # 작성자 정보
-                        'author_display_name': top_comment.get('authorDisplayName', ''),
-                        'author_profile_image_url': top_comment.get('authorProfileImageUrl', ''),
-                        'author_channel_url': top_comment.get('authorChannelUrl', ''),
-                        'author_channel_id': top_comment.get('authorChannelId', {}).get('value', ''),
-                        
-                        # 댓글 내용
-                        'comment_text_display': top_comment.get('textDisplay', ''),
-                        'comment_text_original': top_comment.get('textOriginal', ''),
-                        'comment_text_length': len(top_comment.get('textDisplay', '')),
-                        
-                        # 상호작용 정보
-                        'like_count': int(top_comment.get('likeCount', 0)),
-                        'reply_count': int(item['snippet'].get('totalReplyCount', 0)),
-                        'moderation_status': top_comment.get('moderationStatus', ''),
-                        
-                        # 시간 정보
-                        'published_at': top_comment.get('publishedAt', ''),
-                        'updated_at': top_comment.get('updatedAt', ''),
-                        
-                        # 추가 메타데이터
-                        'viewer_rating': top_comment.get('viewerRating', ''),
-                        'can_rate': top_comment.get('canRate', False),
-                    })
-                    
-                    # 답글이 있는 경우 답글도 수집
-                    if 'replies' in item and 'comments' in item['replies']:
-                        for reply in item['replies']['comments']:
-                            reply_snippet = reply['snippet']
-                            
-                            comments_data.append({
-                                # 기본 식별 정보
-                                'video_id': video_id,
-                                'comment_id': reply['id'],
-                                'comment_type': 'reply',
-                                'parent_comment_id': item['snippet']['topLevelComment']['id'],
-                                'created_at': datetime.now().isoformat(),
-                                
-                                # 작성자 정보
-                                'author_display_name': reply_snippet.get('authorDisplayName', ''),
-                                'author_profile_image_url': reply_snippet.get('authorProfileImageUrl', ''),
-                                'author_channel_url': reply_snippet.get('authorChannelUrl', ''),
-                                'author_channel_id': reply_snippet.get('authorChannelId', {}).get('value', ''),
-                                
-                                # 댓글 내용
-                                'comment_text_display': reply_snippet.get('textDisplay', ''),
-                                'comment_text_original': reply_snippet.get('textOriginal', ''),
-                                'comment_text_length': len(reply_snippet.get('textDisplay', '')),
-                                
-                                # 상호작용 정보
-                                'like_count': int(reply_snippet.get('likeCount', 0)),
-                                'reply_count': 0,  # 답글의 답글은 없음
-                                'moderation_status': reply_snippet.get('moderationStatus', ''),
-                                
-                                # 시간 정보
-                                'published_at': reply_snippet.get('publishedAt', ''),
-                                'updated_at': reply_snippet.get('updatedAt', ''),
-                                
-                                # 추가 메타데이터
-                                'viewer_rating': reply_snippet.get('viewerRating', ''),
-                                'can_rate': reply_snippet.get('canRate', False),
-                            })
-                
-                print(f"댓글 수집: {video_id} - {len(comments_response['items'])}개 스레드")
-                time.sleep(0.1)  # API 제한 방지
-                
+                comments_response = self._execute_with_retry('commentThreads.list', params)
             except HttpError as e:
                 if 'commentsDisabled' in str(e):
                     print(f"댓글 비활성화: {video_id}")
-                elif 'quotaExceeded' in str(e):
-                    print(f"API 할당량 초과: {video_id}")
-                    break
                 else:
                     print(f"댓글 수집 오류 {video_id}: {e}")
-                continue
-        
-        print(f"전체 댓글 수집 완료: {len(comments_data)}개")
-        return comments_data
-    
+                break
+
+            items = comments_response.get('items', [])
+            for item in items:
+                video_comments.extend(self._parse_comment_thread(item, video_id))
+            thread_count += len(items)
+
+            next_page_token = comments_response.get('nextPageToken')
+            if not next_page_token or not items:
+                break
+
+        print(f"댓글 수집: {video_id} - {thread_count}개 스레드")
+        return video_comments
+
+    def _parse_comment_thread(self, item, video_id):
+        """
+        commentThreads 응답 항목을 댓글 레코드 리스트로 변환 (최상위 댓글 + 포함된 답글)
+
+        Args:
+            item (dict): commentThread 리소스
+            video_id (str): 비디오 ID
+
+        Returns:
+            list: 댓글 레코드 리스트
+        """
+        records = []
+
+        # 최상위 댓글
+        top_comment = item['snippet']['topLevelComment']['snippet']
+
+        records.append({
+            # 기본 식별 정보
+            'video_id': video_id,
+            'comment_id': item['snippet']['topLevelComment']['id'],
+            'comment_type': 'top_level',
+            'parent_comment_id': '',
+            'collected_at': datetime.now().isoformat(),
+
+            # 작성자 정보
+            'author_display_name': top_comment.get('authorDisplayName', ''),
+            'author_profile_image_url': top_comment.get('authorProfileImageUrl', ''),
+            'author_channel_url': top_comment.get('authorChannelUrl', ''),
+            'author_channel_id': top_comment.get('authorChannelId', {}).get('value', ''),
+
+            # 댓글 내용
+            'comment_text_display': top_comment.get('textDisplay', ''),
+            'comment_text_original': top_comment.get('textOriginal', ''),
+            'comment_text_length': len(top_comment.get('textDisplay', '')),
+
+            # 상호작용 정보
+            'like_count': int(top_comment.get('likeCount', 0)),
+            'reply_count': int(item['snippet'].get('totalReplyCount', 0)),
+            'moderation_status': top_comment.get('moderationStatus', ''),
+
+            # 시간 정보
+            'published_at': top_comment.get('publishedAt', ''),
+            'updated_at': top_comment.get('updatedAt', ''),
+
+            # 추가 메타데이터
+            'viewer_rating': top_comment.get('viewerRating', ''),
+            'can_rate': top_comment.get('canRate', False),
+        })
+
+        # 답글이 있는 경우 답글도 수집
+        if 'replies' in item and 'comments' in item['replies']:
+            for reply in item['replies']['comments']:
+                records.append(self._parse_reply(reply, video_id, item['snippet']['topLevelComment']['id']))
+
+        return records
+
+    def _parse_reply(self, reply, video_id, parent_comment_id):
+        """
+        답글(comment 리소스)을 댓글 레코드로 변환
+
+        Args:
+            reply (dict): comment 리소스
+            video_id (str): 비디오 ID
+            parent_comment_id (str): 최상위 댓글 ID
+
+        Returns:
+            dict: 댓글 레코드
+        """
+        reply_snippet = reply['snippet']
+
+        return {
+            # 기본 식별 정보
+            'video_id': video_id,
+            'comment_id': reply['id'],
+            'comment_type': 'reply',
+            'parent_comment_id': parent_comment_id,
+            'created_at': datetime.now().isoformat(),
+
+            # 작성자 정보
+            'author_display_name': reply_snippet.get('authorDisplayName', ''),
+            'author_profile_image_url': reply_snippet.get('authorProfileImageUrl', ''),
+            'author_channel_url': reply_snippet.get('authorChannelUrl', ''),
+            'author_channel_id': reply_snippet.get('authorChannelId', {}).get('value', ''),
+
+            # 댓글 내용
+            'comment_text_display': reply_snippet.get('textDisplay', ''),
+            'comment_text_original': reply_snippet.get('textOriginal', ''),
+            'comment_text_length': len(reply_snippet.get('textDisplay', '')),
+
+            # 상호작용 정보
+            'like_count': int(reply_snippet.get('likeCount', 0)),
+            'reply_count': 0,  # 답글의 답글은 없음
+            'moderation_status': reply_snippet.get('moderationStatus', ''),
+
+            # 시간 정보
+            'published_at': reply_snippet.get('publishedAt', ''),
+            'updated_at': reply_snippet.get('updatedAt', ''),
+
+            # 추가 메타데이터
+            'viewer_rating': reply_snippet.get('viewerRating', ''),
+            'can_rate': reply_snippet.get('canRate', False),
+        }
+
     def _parse_duration(self, duration_str):
         """YouTube 지속시간 형식을 초로 변환"""
         # PT4M13S -> 253초
@@ -698,5 +1210,10 @@ class YouTubeAnalyzer:
         return 0
     
     def get_quota_usage(self):
-        """현재 API 사용량 반환"""
-        return self.request_count
\ No newline at end of file
+        """
+        키별 오늘(태평양 시간 기준) 실제 할당량 사용량 반환
+
+        Returns:
+            dict: {'#1 (...abcd)': {'used_units', 'remaining_units', 'exhausted', 'calls'}, ...}
+        """
+        return self.key_pool.get_usage()
@@ -0,0 +1,468 @@
+"""
+Keyword Job Queue (PostgreSQL)
+
+Shares keyword collection work between any number of collector processes, on one
+machine or several. Each active keyword of youtube_keywords becomes one job per run
+(youtube_keyword_jobs, unique per run_id + keyword). Workers claim jobs with
+SELECT ... FOR UPDATE SKIP LOCKED, so two workers never claim the same job. A
+claimed job has a lease that a heartbeat thread keeps extending. If a worker dies,
+its lease expires and another worker reclaims the job, up to max_attempts.
+
+Workers are started with batch_collect.py --queue; every worker enqueues the active
+keywords of the run first (idempotent), so no separate scheduling step is required.
+
+Usage:
+    python keyword_queue.py enqueue                   # Enqueue active keywords for today's run
+    python keyword_queue.py status                    # Show job counts and running jobs for today's run
+    python keyword_queue.py status --run-id 2024-06-01
+    python batch_collect.py --queue --workers 2       # Start a worker process (run on as many hosts as needed)
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(1, os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import socket
+import threading
+from datetime import datetime
+from psycopg2 import extras
+from config.secrets import POSTGRES_HOST, POSTGRES_PORT, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_DB
+from config.settings import KEYWORD_JOB_LEASE_SECONDS, KEYWORD_JOB_MAX_ATTEMPTS
+from common.db_pool import get_connection, release_connection, is_schema_created, mark_schema_created
+from collectors.key_pool import QUOTA_TIMEZONE
+
+JOB_COLUMNS = "id, keyword, max_videos, max_comments_per_video, region_code, category, attempts, max_attempts"
+
+
+def default_run_id():
+    """
+    Run id shared by all workers started on the same day (YYYY-MM-DD)
+
+    The date is taken in Pacific time, the zone the key pool dates its quota records in, so
+    workers on hosts with different local time zones or local midnights get the same run id.
+    """
+    return datetime.now(QUOTA_TIMEZONE).strftime('%Y-%m-%d')
+
+
+def default_worker_id():
+    """Worker id recorded on claimed jobs (host:pid)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class KeywordJobQueue:
+    """Lease-based keyword job queue stored in youtube_keyword_jobs"""
+
+    def __init__(self, run_id=None, worker_id=None, lease_seconds=KEYWORD_JOB_LEASE_SECONDS,
+                 max_attempts=KEYWORD_JOB_MAX_ATTEMPTS):
+        """
+        Initialize job queue
+
+        Args:
+            run_id (str): Run the jobs belong to (default: today's date in Pacific time, shared by every worker started today)
+            worker_id (str): Identifier of this worker process (default: host:pid)
+            lease_seconds (int): How long a claimed job stays reserved without a heartbeat
+            max_attempts (int): Claims per job before it is marked failed
+        """
+        self.connection_params = {
+            'host': POSTGRES_HOST,
+            'port': POSTGRES_PORT,
+            'user': POSTGRES_USER,
+            'password': POSTGRES_PASSWORD,
+            'dbname': POSTGRES_DB
+        }
+        self.run_id = run_id or default_run_id()
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.conn = None
+        self.cursor = None
+
+        # Jobs held by this worker, kept alive by the heartbeat thread
+        self._held_jobs = set()
+        self._lost_jobs = set()
+        self._held_lock = threading.Lock()
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread = None
+
+    def connect(self):
+        """Connect to database"""
+        try:
+            self.conn = get_connection(self.connection_params)
+            self.cursor = self.conn.cursor(cursor_factory=extras.RealDictCursor)
+            return True
+        except Exception as e:
+            print(f"Error connecting to database: {e}")
+            return False
+
+    def disconnect(self):
+        """Stop the heartbeat and return the connection to the shared pool"""
+        self.stop_heartbeat()
+        if self.cursor:
+            self.cursor.close()
+            self.cursor = None
+        if self.conn:
+            release_connection(self.connection_params, self.conn)
+            self.conn = None
+
+    def create_tables(self):
+        """Create the job table if it doesn't exist"""
+        if is_schema_created('youtube_keyword_jobs'):
+            return True
+
+        try:
+            self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS youtube_keyword_jobs (
+                id SERIAL PRIMARY KEY,
+                run_id VARCHAR(50) NOT NULL,
+                keyword VARCHAR(255) NOT NULL,
+                max_videos INTEGER,
+                max_comments_per_video INTEGER,
+                region_code VARCHAR(10),
+                category VARCHAR(50),
+                status VARCHAR(20) NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                worker_id VARCHAR(255),
+                lease_expires_at TIMESTAMP,
+                heartbeat_at TIMESTAMP,
+                last_error TEXT,
+                videos_collected INTEGER,
+                comments_collected INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                started_at TIMESTAMP,
+                finished_at TIMESTAMP,
+                UNIQUE (run_id, keyword)
+            );
+            CREATE INDEX IF NOT EXISTS idx_keyword_jobs_claim
+                ON youtube_keyword_jobs(run_id, status, lease_expires_at);
+            """)
+            self.conn.commit()
+            mark_schema_created('youtube_keyword_jobs')
+            return True
+        except Exception as e:
+            print(f"Error creating job table: {e}")
+            self.conn.rollback()
+            return False
+
+    def enqueue_active_keywords(self):
+        """
+        Add one pending job per active keyword to this run (keywords already in the run are kept as they are)
+
+        Returns:
+            int: Number of newly enqueued jobs
+        """
+        try:
+            self.cursor.execute("""
+            INSERT INTO youtube_keyword_jobs
+                (run_id, keyword, max_videos, max_comments_per_video, region_code, category, max_attempts)
+            SELECT %s, keyword, max_videos, max_comments_per_video, region_code, category, %s
+            FROM youtube_keywords
+            WHERE status = 'active'
+            ORDER BY last_collected_at ASC NULLS FIRST, id
+            ON CONFLICT (run_id, keyword) DO NOTHING
+            """, (self.run_id, self.max_attempts))
+            inserted = self.cursor.rowcount
+            self.conn.commit()
+            return inserted
+        except Exception as e:
+            print(f"Error enqueuing keywords: {e}")
+            self.conn.rollback()
+            return 0
+
+    def claim(self, exclude_ids=None):
+        """
+        Claim the next pending job, or a running job whose lease has expired (its worker died)
+
+        Expired jobs that already used all attempts are marked failed instead of reclaimed.
+
+        Args:
+            exclude_ids (list): Job ids not to claim now (e.g. jobs this worker just failed)
+
+        Returns:
+            dict: Job (id, keyword, max_videos, max_comments_per_video, region_code, category,
+                  attempts, max_attempts), or None when no job is available
+        """
+        try:
+            self.cursor.execute("""
+            UPDATE youtube_keyword_jobs
+            SET status = 'failed', worker_id = NULL, lease_expires_at = NULL, finished_at = NOW(),
+                last_error = COALESCE(last_error || '; ', '') || 'lease expired on the last attempt'
+            WHERE run_id = %s AND status = 'running' AND lease_expires_at < NOW() AND attempts >= max_attempts
+            """, (self.run_id,))
+
+            self.cursor.execute(f"""
+            UPDATE youtube_keyword_jobs
+            SET status = 'running',
+                worker_id = %s,
+                attempts = attempts + 1,
+                lease_expires_at = NOW() + (%s * INTERVAL '1 second'),
+                heartbeat_at = NOW(),
+                started_at = NOW(),
+                finished_at = NULL
+            WHERE id = (
+                SELECT id FROM youtube_keyword_jobs
+                WHERE run_id = %s
+                  AND attempts < max_attempts
+                  AND (status = 'pending' OR (status = 'running' AND lease_expires_at < NOW()))
+                  AND NOT (id = ANY(%s::int[]))
+                ORDER BY id
+                LIMIT 1
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING {JOB_COLUMNS}
+            """, (self.worker_id, self.lease_seconds, self.run_id, list(exclude_ids or [])))
+            row = self.cursor.fetchone()
+            self.conn.commit()
+        except Exception as e:
+            print(f"Error claiming job: {e}")
+            self.conn.rollback()
+            return None
+
+        if row is None:
+            return None
+        job = dict(row)
+        with self._held_lock:
+            self._held_jobs.add(job['id'])
+            self._lost_jobs.discard(job['id'])
+        return job
+
+    def complete(self, job_id, videos_count=0, comments_count=0):
+        """
+        Mark a claimed job done
+
+        Returns:
+            bool: False if the lease was lost (the job was reclaimed by another worker)
+        """
+        self._release(job_id)
+        try:
+            self.cursor.execute("""
+            UPDATE youtube_keyword_jobs
+            SET status = 'done', lease_expires_at = NULL, finished_at = NOW(), last_error = NULL,
+                videos_collected = %s, comments_collected = %s
+            WHERE id = %s AND worker_id = %s AND status = 'running'
+            """, (videos_count, comments_count, job_id, self.worker_id))
+            updated = self.cursor.rowcount
+            self.conn.commit()
+            return updated == 1
+        except Exception as e:
+            print(f"Error completing job {job_id}: {e}")
+            self.conn.rollback()
+            return False
+
+    def fail(self, job_id, error, retry=True):
+        """
+        Record a failed attempt; the job goes back to pending while attempts remain
+
+        Args:
+            job_id (int): Claimed job id
+            error (str): Failure reason
+            retry (bool): If False, mark the job failed without further attempts (e.g. no data returned)
+
+        Returns:
+            str: New job status ('pending' or 'failed'), or None if the lease was lost
+        """
+        self._release(job_id)
+        try:
+            self.cursor.execute("""
+            UPDATE youtube_keyword_jobs
+            SET status = CASE WHEN %s AND attempts < max_attempts THEN 'pending' ELSE 'failed' END,
+                worker_id = NULL,
+                lease_expires_at = NULL,
+                last_error = %s,
+                finished_at = CASE WHEN %s AND attempts < max_attempts THEN NULL ELSE NOW() END
+            WHERE id = %s AND worker_id = %s AND status = 'running'
+            RETURNING status
+            """, (retry, error, retry, job_id, self.worker_id))
+            row = self.cursor.fetchone()
+            self.conn.commit()
+            return row['status'] if row else None
+        except Exception as e:
+            print(f"Error failing job {job_id}: {e}")
+            self.conn.rollback()
+            return None
+
+    def release(self, job_id, error=None):
+        """
+        Return a claimed job to pending without using up an attempt
+
+        For failures that say nothing about the keyword itself (e.g. the API quota ran out);
+        the job is collected again by the next worker that still has quota.
+
+        Args:
+            job_id (int): Claimed job id
+            error (str): Reason recorded in last_error
+
+        Returns:
+            bool: False if the lease was lost (the job was reclaimed by another worker)
+        """
+        self._release(job_id)
+        try:
+            self.cursor.execute("""
+            UPDATE youtube_keyword_jobs
+            SET status = 'pending',
+                attempts = GREATEST(attempts - 1, 0),
+                worker_id = NULL,
+                lease_expires_at = NULL,
+                last_error = %s
+            WHERE id = %s AND worker_id = %s AND status = 'running'
+            """, (error, job_id, self.worker_id))
+            updated = self.cursor.rowcount
+            self.conn.commit()
+            return updated == 1
+        except Exception as e:
+            print(f"Error releasing job {job_id}: {e}")
+            self.conn.rollback()
+            return False
+
+    def _release(self, job_id):
+        """Stop renewing the lease of a finished job"""
+        with self._held_lock:
+            self._held_jobs.discard(job_id)
+
+    def is_lease_lost(self, job_id):
+        """True if a heartbeat found that another worker took over this job"""
+        with self._held_lock:
+            return job_id in self._lost_jobs
+
+    def start_heartbeat(self):
+        """Start renewing the leases of held jobs every lease_seconds / 3 (own pooled connection)"""
+        if self._heartbeat_thread and self._heartbeat_thread.is_alive():
+            return
+        self._heartbeat_stop.clear()
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop, name='keyword-job-heartbeat', daemon=True
+        )
+        self._heartbeat_thread.start()
+
+    def stop_heartbeat(self):
+        """Stop the heartbeat thread"""
+        self._heartbeat_stop.set()
+        if self._heartbeat_thread:
+            self._heartbeat_thread.join()
+            self._heartbeat_thread = None
+
+    def _heartbeat_loop(self):
+        """Extend leases until stopped; jobs whose lease could not be extended are recorded as lost"""
+        interval = max(1.0, self.lease_seconds / 3)
+        conn = None
+        try:
+            conn = get_connection(self.connection_params)
+            while not self._heartbeat_stop.wait(interval):
+                with self._held_lock:
+                    job_ids = list(self._held_jobs)
+                if not job_ids:
+                    continue
+                try:
+                    with conn.cursor() as cursor:
+                        cursor.execute("""
+                        UPDATE youtube_keyword_jobs
+                        SET lease_expires_at = NOW() + (%s * INTERVAL '1 second'), heartbeat_at = NOW()
+                        WHERE id = ANY(%s) AND worker_id = %s AND status = 'running'
+                        RETURNING id
+                        """, (self.lease_seconds, job_ids, self.worker_id))
+                        renewed = {row[0] for row in cursor.fetchall()}
+                    conn.commit()
+                except Exception as e:
+                    print(f"[WARNING] Job heartbeat failed: {e}")
+                    conn.rollback()
+                    continue
+
+                with self._held_lock:
+                    lost = (set(job_ids) & self._held_jobs) - renewed
+                    self._lost_jobs |= lost
+                for job_id in lost:
+                    print(f"[WARNING] Lost the lease of job {job_id}; another worker may reclaim it")
+        except Exception as e:
+            print(f"[WARNING] Job heartbeat stopped: {e}")
+        finally:
+            if conn is not None:
+                release_connection(self.connection_params, conn)
+
+    def get_status(self):
+        """
+        Job counts per status and the currently running jobs of this run
+
+        Returns:
+            tuple: ({status: count}, [running job dicts])
+        """
+        try:
+            self.cursor.execute("""
+            SELECT status, COUNT(*) AS count FROM youtube_keyword_jobs
+            WHERE run_id = %s GROUP BY status
+            """, (self.run_id,))
+            counts = {row['status']: row['count'] for row in self.cursor.fetchall()}
+
+            self.cursor.execute("""
+            SELECT keyword, worker_id, attempts, max_attempts, started_at, heartbeat_at, lease_expires_at,
+                   lease_expires_at < NOW() AS expired
+            FROM youtube_keyword_jobs
+            WHERE run_id = %s AND status = 'running'
+            ORDER BY id
+            """, (self.run_id,))
+            running = [dict(row) for row in self.cursor.fetchall()]
+            return counts, running
+        except Exception as e:
+            print(f"Error getting job status: {e}")
+            self.conn.rollback()
+            return {}, []
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Manage the shared keyword job queue for batch collection workers',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Enqueue all active keywords for today's run (workers also do this on start)
+  python keyword_queue.py enqueue
+
+  # Show progress of today's run
+  python keyword_queue.py status
+
+  # Start workers (any number of processes, on any host with database access)
+  python batch_collect.py --queue --workers 2
+        """
+    )
+
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+    for name, help_text in [('enqueue', 'Enqueue active keywords for a run'), ('status', 'Show job status of a run')]:
+        command_parser = subparsers.add_parser(name, help=help_text)
+        command_parser.add_argument('--run-id', type=str, default=None, help="Run id (default: today's date in Pacific time)")
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        return
+
+    job_queue = KeywordJobQueue(run_id=args.run_id)
+    if not job_queue.connect():
+        print("Failed to connect to database")
+        return
+
+    try:
+        job_queue.create_tables()
+
+        if args.command == 'enqueue':
+            inserted = job_queue.enqueue_active_keywords()
+            print(f"[OK] Enqueued {inserted} new jobs for run '{job_queue.run_id}'")
+
+        elif args.command == 'status':
+            counts, running = job_queue.get_status()
+            print(f"Run '{job_queue.run_id}': " + (', '.join(
+                f"{status} {counts[status]}" for status in ('pending', 'running', 'done', 'failed') if status in counts
+            ) or 'no jobs'))
+            for job in running:
+                state = 'EXPIRED' if job['expired'] else 'alive'
+                print(f"  - '{job['keyword']}' on {job['worker_id']} "
+                      f"(attempt {job['attempts']}/{job['max_attempts']}, lease {state}, "
+                      f"heartbeat {job['heartbeat_at']:%H:%M:%S})")
+    finally:
+        job_queue.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,7 @@ import argparse
 import psycopg2
 from datetime import datetime
 from config.secrets import POSTGRES_HOST, POSTGRES_PORT, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_DB
+from common.db_pool import get_connection, release_connection
 
 
 class KeywordManager:
@@ -44,7 +45,7 @@ class KeywordManager:
     def connect(self):
         """Connect to database"""
         try:
-            self.conn = psycopg2.connect(**self.connection_params)
+            self.conn = get_connection(self.connection_params)
             self.cursor = self.conn.cursor()
             return True
         except Exception as e:
@@ -52,11 +53,13 @@ class KeywordManager:
             return False
 
     def disconnect(self):
-        """Disconnect from database"""
+        """Return the connection to the shared pool"""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.conn:
-            self.conn.close()
+            release_connection(self.connection_params, self.conn)
+            self.conn = None
 
     def add_keyword(self, keyword, max_videos=50, max_comments_per_video=50, region_code='US'):
         """Add a new keyword"""
@@ -182,18 +185,47 @@ class KeywordManager:
             print(f"Error getting active keywords: {e}")
             return []
 
-    def update_collection_stats(self, keyword, videos_count, comments_count):
-        """Update collection statistics for a keyword"""
+    def get_last_collected_at(self, keyword):
+        """
+        Get the last collection time of a keyword as a timezone-aware datetime (None if never collected)
+
+        last_collected_at is a TIMESTAMP without time zone holding the session's local time,
+        so it is converted explicitly instead of being read as UTC.
+        """
+        try:
+            self.cursor.execute(
+                "SELECT last_collected_at AT TIME ZONE current_setting('TimeZone') "
+                "FROM youtube_keywords WHERE keyword = %s",
+                (keyword,)
+            )
+            row = self.cursor.fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            print(f"Error getting last collection time: {e}")
+            self.conn.rollback()
+            return None
+
+    def update_collection_stats(self, keyword, videos_count, comments_count, collected_at=None):
+        """
+        Update collection statistics for a keyword
+
+        Args:
+            keyword (str): Keyword
+            videos_count (int): Videos collected in this run
+            comments_count (int): Comments collected in this run
+            collected_at (datetime): Timezone-aware time the collection started, used as the next
+                                     incremental window start (default: now)
+        """
         try:
             query = """
             UPDATE youtube_keywords
-            SET last_collected_at = CURRENT_TIMESTAMP,
+            SET last_collected_at = COALESCE(%s::timestamptz, CURRENT_TIMESTAMP),
                 total_videos_collected = total_videos_collected + %s,
                 total_comments_collected = total_comments_collected + %s,
                 updated_at = CURRENT_TIMESTAMP
             WHERE keyword = %s
             """
-            self.cursor.execute(query, (videos_count, comments_count, keyword))
+            self.cursor.execute(query, (collected_at, videos_count, comments_count, keyword))
             self.conn.commit()
             return True
         except Exception as e:
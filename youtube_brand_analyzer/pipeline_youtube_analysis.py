@@ -9,6 +9,11 @@ YouTube 데이터 수집 및 분석 통합 파이프라인
    - videos_final.csv: 영상 정보 + 댓글 요약
    - comments_final.csv: 댓글 정보
 
+1~3단계는 비디오 단위 단계 파이프라인(common/stage_pipeline.py)으로 실행되어
+한 비디오의 댓글을 수집하는 동안 다른 비디오의 분석/요약/DB 저장이 함께 진행됩니다.
+raw 데이터는 검색 배치마다, 비디오는 콘텐츠 분석 직후 바로 DB에 저장되므로
+댓글 단계나 검색이 중간에 실패해도 그때까지 수집한 데이터는 남습니다.
+
 사용법:
     python pipeline_youtube_analysis.py --keyword "Samsung TV" --max-videos 10
 """
@@ -24,19 +29,68 @@ import pandas as pd
 from datetime import datetime
 import time
 import json
+import threading
 
-from collectors.youtube_api import YouTubeAnalyzer
+from collectors.youtube_api import YouTubeAnalyzer, QuotaExhaustedError
 from analyzers.comment_summarizer import CommentSummarizer
 from analyzers.comment_sentiment_analyzer import CommentSentimentAnalyzer
 from analyzers.video_content_analyzer import VideoContentAnalyzer
-from config.db_manager import YouTubeDBManager
+from config.db_manager import YouTubeDBManager, RAW_VIDEO_COLUMNS
+from config.settings import EXPAND_COMMENT_REPLIES, PIPELINE_STAGE_WORKERS, PIPELINE_QUEUE_SIZE
+from common.stage_pipeline import Stage, StagePipeline
+from common.run_metrics import get_run_metrics, default_report_path
+from googleapiclient.errors import HttpError
+
+# videos_final / comments_final: data_structure.txt 기준 컬럼
+VIDEO_COLUMNS = [
+    "video_id",
+    "keyword",
+    "title",
+    "description",
+    "published_at",
+    "channel_country",
+    "channel_custom_url",
+    "channel_subscriber_count",
+    "channel_video_count",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "category_id",
+    "engagement_rate",
+    "reviewed_brand",
+    "reviewed_series",
+    "reviewed_item",
+    "product_sentiment_score",
+    "comment_text_summary",
+]
+
+COMMENT_COLUMNS = [
+    "video_id",
+    "comment_id",
+    "comment_type",
+    "parent_comment_id",
+    "comment_text_display",
+    "like_count",
+    "reply_count",
+    "published_at",
+    "sentiment_score",
+]
 
 
 class YouTubePipeline:
     """YouTube 데이터 수집 및 분석 통합 파이프라인"""
 
     def __init__(
-        self, output_dir="data", use_database=True, save_raw_data=False, save_csv=False
+        self,
+        output_dir="data",
+        use_database=True,
+        save_raw_data=False,
+        save_csv=False,
+        video_cache=None,
+        checkpoint=None,
+        key_pool=None,
+        channel_cache=None,
+        search_cache=None,
     ):
         """
         파이프라인 초기화
@@ -46,6 +100,11 @@ class YouTubePipeline:
             use_database (bool): PostgreSQL 데이터베이스 사용 여부
             save_raw_data (bool): API 원본 데이터 저장 여부
             save_csv (bool): CSV 파일 저장 여부
+            video_cache (VideoDetailCache): 여러 키워드 실행이 공유할 비디오 상세 캐시
+            checkpoint (CollectionCheckpoint): 검색 진행 상태 저장소 (중단된 실행 이어서 수집)
+            key_pool (YouTubeKeyPool): 여러 파이프라인이 공유할 API 키 풀 (None이면 새로 생성)
+            channel_cache (ChannelCache): 공유할 채널 정보 캐시 (None이면 새로 생성)
+            search_cache (SearchPageCache): 공유할 검색 페이지 캐시 (None이면 새로 생성)
         """
         self.output_dir = output_dir
         self.use_database = use_database
@@ -60,7 +119,18 @@ class YouTubePipeline:
         os.makedirs(self.processed_data_dir, exist_ok=True)
 
         # Analyzer 초기화
-        self.youtube_api = YouTubeAnalyzer()
+        # 저장/분석에 쓰는 컬럼만 API에 요청 (raw 아카이브 저장 시에는 모든 필드)
+        video_columns = None if save_raw_data else VIDEO_COLUMNS + RAW_VIDEO_COLUMNS
+        comment_columns = None if save_raw_data else COMMENT_COLUMNS + ["comment_text_original"]
+        self.youtube_api = YouTubeAnalyzer(
+            key_pool=key_pool,
+            channel_cache=channel_cache,
+            search_cache=search_cache,
+            video_cache=video_cache,
+            video_columns=video_columns,
+            comment_columns=comment_columns,
+            checkpoint=checkpoint,
+        )
         self.comment_summarizer = CommentSummarizer()
         self.sentiment_analyzer = CommentSentimentAnalyzer()
         self.video_content_analyzer = VideoContentAnalyzer()
@@ -70,6 +140,227 @@ class YouTubePipeline:
             self.db_manager = YouTubeDBManager()
         else:
             self.db_manager = None
+        # 검색 스레드(raw 저장)와 DB 단계가 같은 연결(커서)을 쓰므로 DB 호출은 이 잠금 안에서
+        self._db_lock = threading.Lock()
+
+    def refresh_known_videos(self, keyword):
+        """
+        DB에 저장된 키워드 비디오의 조회수/좋아요/댓글 수를 videos().list로 갱신
+
+        Args:
+            keyword (str): 검색 키워드
+
+        Returns:
+            int: 갱신된 비디오 수
+        """
+        if not (self.use_database and self.db_manager):
+            print("  Database storage is disabled")
+            return 0
+
+        if not self.db_manager.connect():
+            print("  [WARNING] Failed to connect to database")
+            return 0
+
+        try:
+            video_ids = self.db_manager.get_video_ids(keyword)
+            if not video_ids:
+                print("  No known videos for this keyword")
+                return 0
+
+            statistics = self.youtube_api.get_video_statistics(video_ids)
+            return self.db_manager.update_video_statistics(statistics)
+        finally:
+            self.db_manager.disconnect()
+
+    def _iter_filtered_videos(self, keyword, region_code, max_videos, since, category, raw_holder,
+                              save_raw=False):
+        """
+        품질 필터를 통과한 비디오를 검색 배치 단위로 하나씩 내보내는 단계 파이프라인 입력
+
+        Args:
+            keyword (str): 검색 키워드
+            region_code (str): 지역 코드
+            max_videos (int): 최대 영상 수
+            since (datetime): 증분 수집 기준 시각 (None이면 최근 90일)
+            category (str): 제품 카테고리
+            raw_holder (dict): 'raw_rows'(필터링 전 수집 수), 'raw_saved'(DB 저장 수)를 기록
+            save_raw (bool): 배치마다 필터링 전 모든 비디오를 youtube_videos_raw에 저장
+
+        Yields:
+            dict: {'video': 비디오 레코드, 'comments': []}
+        """
+        batches = self.youtube_api.iter_video_batches(
+            keyword=keyword.lower(),
+            region_code=region_code,
+            max_results=max_videos,
+            published_after=since,
+            apply_quality_filter=True,
+        )
+        try:
+            for batch_videos, batch_raw_videos in batches:
+                raw_holder["raw_rows"] = raw_holder.get("raw_rows", 0) + len(batch_raw_videos)
+                if save_raw and len(batch_raw_videos) > 0:
+                    self._save_raw_batch(batch_raw_videos, keyword, category, raw_holder)
+
+                for video in batch_videos:
+                    video["keyword"] = keyword
+                    if category:
+                        video["category"] = category
+                    yield {"video": video, "comments": []}
+        except HttpError:
+            # 이미 내보낸 비디오는 계속 처리 (오류 내용은 iter_video_batches가 출력)
+            return
+
+    def _save_raw_batch(self, batch_raw_videos, keyword, category, raw_holder):
+        """
+        검색 배치의 필터링 전 모든 비디오를 youtube_videos_raw에 저장 (DB에 저장할 컬럼만)
+
+        Args:
+            batch_raw_videos (VideoRecordView): 이번 배치에서 수집한 모든 비디오
+            keyword (str): 검색 키워드
+            category (str): 제품 카테고리
+            raw_holder (dict): 'raw_saved'에 저장된 행 수를 누적
+        """
+        raw_videos_df = batch_raw_videos.to_dataframe(columns=RAW_VIDEO_COLUMNS)
+        if category:
+            raw_videos_df["category"] = category
+        with get_run_metrics().span("stage.db_write_raw", keyword=keyword), self._db_lock:
+            raw_holder["raw_saved"] = (
+                raw_holder.get("raw_saved", 0) + self.db_manager.insert_raw_videos(raw_videos_df, keyword)
+            )
+
+    def _analyze_video_content(self, item):
+        """
+        단계: 비디오 제목/설명에서 브랜드, 시리즈 추출 및 감성 분석 (OpenAI)
+
+        Args:
+            item (dict): {'video', 'comments'}
+
+        Returns:
+            dict: reviewed_brand/series/item, product_sentiment_score가 추가된 item
+        """
+        video = item["video"]
+        title = video.get("title", "")
+        description = video.get("description", "")
+
+        print(f"  Analyzing video content: {video['video_id'][:20]}...")
+
+        # Extract brand and series (category 전달)
+        brand_info = self.video_content_analyzer.extract_brand_and_series(
+            title, description, category=video.get("category")
+        )
+        video["reviewed_brand"] = brand_info["reviewed_brand"]
+        video["reviewed_series"] = brand_info["reviewed_series"]
+        video["reviewed_item"] = brand_info["reviewed_item"]
+
+        # Analyze sentiment
+        video["product_sentiment_score"] = self.video_content_analyzer.analyze_product_sentiment(
+            title, description,
+            brand_info["reviewed_brand"],
+            brand_info["reviewed_series"]
+        )
+        return item
+
+    def _collect_video_comments(self, item, max_comments_per_video, expand_replies):
+        """
+        단계: 비디오 댓글 수집 (YouTube API)
+
+        Args:
+            item (dict): {'video', 'comments'}
+            max_comments_per_video (int): 영상당 최대 댓글 수
+            expand_replies (bool): 답글 확장 여부
+
+        Returns:
+            dict: comments가 채워진 item
+        """
+        item["comments"] = self.youtube_api.get_comprehensive_comments(
+            video_ids=[item["video"]["video_id"]],
+            max_comments_per_video=max_comments_per_video,
+            max_workers=1,
+            expand_replies=expand_replies,
+        )
+        return item
+
+    def _analyze_video_comments(self, item, summarize_comments, analyze_sentiment):
+        """
+        단계: 댓글 감정 분석(선택) 및 비디오별 댓글 요약 (OpenAI)
+
+        Args:
+            item (dict): {'video', 'comments'}
+            summarize_comments (bool): 댓글 요약 여부
+            analyze_sentiment (bool): 댓글 감정 분석 여부
+
+        Returns:
+            dict: comment_text_summary 등이 추가된 item
+        """
+        video = item["video"]
+        comments = item["comments"]
+        if not comments:
+            return item
+
+        if analyze_sentiment:
+            print(f"  Analyzing sentiment for video: {video['video_id']} ({len(comments)} comments)")
+            item["comments"] = comments = self.sentiment_analyzer.analyze_comments_batch_optimized(
+                comments=comments,
+                text_field="comment_text_display",
+                batch_size=10,
+            )
+
+        if summarize_comments:
+            print(f"  Summarizing comments for video: {video['video_id']} ({len(comments)} comments)")
+            summary = self.comment_summarizer.summarize_comments_for_video(comments)
+            video["comment_text_summary"] = summary.get("summary")
+            video["key_themes"] = summary.get("key_themes")
+            video["sentiment_summary"] = summary.get("sentiment_summary")
+
+        return item
+
+    def _upsert_video(self, video):
+        """
+        비디오 한 건을 youtube_videos에 저장/갱신 (있는 컬럼만)
+
+        Args:
+            video (dict): 비디오 레코드
+        """
+        video_df = pd.DataFrame([video])
+        with self._db_lock:
+            self.db_manager.insert_videos(
+                video_df[[col for col in VIDEO_COLUMNS if col in video_df.columns]]
+            )
+
+    def _save_video(self, item):
+        """
+        단계: 콘텐츠 분석이 끝난 비디오를 댓글 단계 전에 PostgreSQL에 저장
+
+        Args:
+            item (dict): {'video', 'comments'}
+
+        Returns:
+            dict: 저장된 item
+        """
+        self._upsert_video(item["video"])
+        return item
+
+    def _save_comments(self, item):
+        """
+        단계: 댓글을 PostgreSQL에 저장하고 댓글 요약을 비디오에 반영
+
+        Args:
+            item (dict): {'video', 'comments'}
+
+        Returns:
+            dict: 저장된 item
+        """
+        if "comment_text_summary" in item["video"]:
+            self._upsert_video(item["video"])
+
+        if item["comments"]:
+            comments_df = pd.DataFrame(item["comments"])
+            with self._db_lock:
+                self.db_manager.insert_comments(
+                    comments_df[[col for col in COMMENT_COLUMNS if col in comments_df.columns]]
+                )
+        return item
 
     def run(
         self,
@@ -80,6 +371,8 @@ class YouTubePipeline:
         category=None,
         summarize_comments=True,
         analyze_sentiment=False,
+        since=None,
+        expand_replies=EXPAND_COMMENT_REPLIES,
     ):
         """
         전체 파이프라인 실행
@@ -91,6 +384,9 @@ class YouTubePipeline:
             region_code (str): 지역 코드
             summarize_comments (bool): 댓글 요약 여부
             analyze_sentiment (bool): 댓글 감정 분석 여부 (OpenAI 사용, 비용 발생)
+            since (datetime): 증분 수집 기준 시각 - 이후 게시된 비디오만 검색하고,
+                              이미 저장된 비디오는 videos().list로 통계만 갱신 (None이면 최근 90일 전체 검색)
+            expand_replies (bool): 답글이 일부만 포함된 스레드의 답글을 comments().list로 전부 수집
 
         Returns:
             tuple: (videos_df, comments_df)
@@ -106,243 +402,95 @@ class YouTubePipeline:
         print(f"Region: {region_code}")
         print(f"Summarize comments: {summarize_comments}")
         print(f"Analyze sentiment: {analyze_sentiment}")
+        print(f"Incremental since: {since if since else 'off (last 90 days)'}")
         print("=" * 80)
         print()
 
-        # Step 1: 영상 데이터 수집 (필터 적용: US, category 28, engagement >= 2%, subscribers >= 10k)
-        print(
-            f"[Step 1/4] Collecting video data from YouTube API ({max_videos} videos with quality filter)..."
-        )
-        video_data, video_ids, raw_video_data = (
-            self.youtube_api.get_comprehensive_video_data(
-                keyword=keyword.lower(),
-                region_code=region_code,
-                max_results=max_videos,
-                apply_quality_filter=True,
-            )
-        )
-
-        if not video_data:
-            print("No videos found!")
-            return None, None
+        # Step 0: 증분 모드 - 이미 저장된 비디오는 검색 대신 통계만 갱신 (50개당 1 unit)
+        if since:
+            print("[Step 0] Refreshing statistics of known videos...")
+            self.refresh_known_videos(keyword)
+            print()
 
-        videos_df = pd.DataFrame(video_data)
-        raw_videos_df = (
-            pd.DataFrame(raw_video_data) if raw_video_data else pd.DataFrame()
+        # Step 1~3: 비디오 단위 단계 파이프라인
+        # 검색 배치가 필터를 통과하는 즉시 비디오마다 콘텐츠 분석 → 댓글 수집 → 댓글 분석 → DB 저장이
+        # 서로 다른 비디오에서 동시에 진행됩니다 (단계 사이 큐가 가득 차면 앞 단계가 대기).
+        print(
+            f"[Step 1-3/4] Collecting {max_videos} videos with quality filter and processing each video "
+            f"through the stage pipeline..."
         )
 
-        # Add keyword and category to videos_df
-        videos_df["keyword"] = keyword
-        if category:
-            videos_df["category"] = category
-
-        print(f"Collected {len(videos_df)} filtered videos")
-        if len(raw_videos_df) > 0:
-            print(f"Raw data: {len(raw_videos_df)} total videos")
-
-        # Step 1.2: Analyze video content (brand/series extraction + sentiment)
-        print()
-        print("[Step 1.2/5] Analyzing video content (brand, series, sentiment)...")
-
-        for idx, row in videos_df.iterrows():
-            video_id = row['video_id']
-            title = row.get('title', '')
-            description = row.get('description', '')
-            video_category = row.get('category', None)
-
-            print(f"  Analyzing video {idx+1}/{len(videos_df)}: {video_id[:20]}...")
-
-            # Extract brand and series (category 전달)
-            brand_info = self.video_content_analyzer.extract_brand_and_series(
-                title, description, category=video_category
-            )
-            videos_df.at[idx, 'reviewed_brand'] = brand_info['reviewed_brand']
-            videos_df.at[idx, 'reviewed_series'] = brand_info['reviewed_series']
-            videos_df.at[idx, 'reviewed_item'] = brand_info['reviewed_item']
-
-            # Analyze sentiment
-            sentiment_score = self.video_content_analyzer.analyze_product_sentiment(
-                title, description,
-                brand_info['reviewed_brand'],
-                brand_info['reviewed_series']
-            )
-            videos_df.at[idx, 'product_sentiment_score'] = sentiment_score
-
-            # Rate limiting
-            time.sleep(2)
-
-            # Every 10 videos, extra delay
-            if (idx + 1) % 10 == 0:
-                print(f"  >>> Processed {idx+1} videos, waiting 10 seconds...")
-                time.sleep(10)
-
-        print(f"Video content analysis completed for {len(videos_df)} videos")
-
-        # Step 1.5: Raw 데이터 즉시 저장 (댓글 수집 전)
-        print()
-        print("[Step 1.5/5] Saving raw and filtered videos to database...")
-
+        db_connected = False
         if self.use_database and self.db_manager:
-            if self.db_manager.connect():
-                # 테이블 생성
-                self.db_manager.create_tables()
-
-                # videos_final 준비 (댓글 요약 없이)
-                video_columns = [
-                    "video_id",
-                    "keyword",
-                    "title",
-                    "description",
-                    "published_at",
-                    "channel_country",
-                    "channel_custom_url",
-                    "channel_subscriber_count",
-                    "channel_video_count",
-                    "view_count",
-                    "like_count",
-                    "comment_count",
-                    "category_id",
-                    "engagement_rate",
-                    "reviewed_brand",
-                    "reviewed_series",
-                    "reviewed_item",
-                    "product_sentiment_score",
-                ]
-
-                available_video_cols = [
-                    col for col in video_columns if col in videos_df.columns
-                ]
-                videos_final_initial = videos_df[available_video_cols].copy()
-
-                # Raw 데이터 삽입 (필터링 전 모든 데이터)
-                raw_count = 0
-                if len(raw_videos_df) > 0:
-                    # Add category to raw_videos_df
-                    if category:
-                        raw_videos_df['category'] = category
-                    raw_count = self.db_manager.insert_raw_videos(
-                        raw_videos_df, keyword
-                    )
-
-                # 필터링된 영상 데이터 삽입 (댓글 없이)
-                video_count = self.db_manager.insert_videos(videos_final_initial)
-
-                print(f"  [OK] Saved to PostgreSQL:")
-                print(f"    - {raw_count} raw videos (all collected)")
-                print(f"    - {video_count} filtered videos")
-                print(f"  => Videos are now safely stored in database!")
-
-                self.db_manager.disconnect()
-            else:
-                print("  [WARNING] Failed to connect to database")
+            db_connected = self.db_manager.connect()
+            if not db_connected:
+                # DB 없이 계속하면 아무것도 저장되지 않은 키워드가 수집 완료로 기록되므로 실패 처리
+                raise RuntimeError("Failed to connect to database")
         else:
             print("  Database storage is disabled")
 
-        # Step 2: 댓글 데이터 수집
-        print()
-        print("[Step 2/5] Collecting comments from YouTube API...")
-        comments_data = self.youtube_api.get_comprehensive_comments(
-            video_ids=video_ids, max_comments_per_video=max_comments_per_video
-        )
-
-        comments_df = pd.DataFrame(comments_data)
-        print(f"Collected {len(comments_df)} comments")
+        raw_holder = {}
+        try:
+            if db_connected:
+                # 테이블 생성 (프로세스당 한 번만 DDL 실행)
+                self.db_manager.create_tables()
 
-        # Step 2.5: 댓글 감정 분석 (선택적)
-        if analyze_sentiment and len(comments_df) > 0:
-            print()
-            print("[Step 2.5/5] Analyzing sentiment for comments (OpenAI)...")
-            print(
-                f"  WARNING: This will make {len(comments_df)} OpenAI API calls and may incur costs."
-            )
+            stages = [
+                Stage("content_analysis", self._analyze_video_content,
+                      workers=PIPELINE_STAGE_WORKERS.get("content_analysis", 1)),
+            ]
+            if db_connected:
+                # DB 연결(커서) 하나를 공유하므로 저장 단계는 워커 1개
+                stages.append(Stage("db_write_video", self._save_video, workers=1))
+            stages += [
+                Stage("comments",
+                      lambda item: self._collect_video_comments(item, max_comments_per_video, expand_replies),
+                      workers=PIPELINE_STAGE_WORKERS.get("comments", 1)),
+                Stage("comment_analysis",
+                      lambda item: self._analyze_video_comments(item, summarize_comments, analyze_sentiment),
+                      workers=PIPELINE_STAGE_WORKERS.get("comment_analysis", 1)),
+            ]
+            if db_connected:
+                stages.append(Stage("db_write", self._save_comments, workers=1))
 
-            # 감정 분석 (최적화된 배치 방식 사용)
-            comments_with_sentiment = (
-                self.sentiment_analyzer.analyze_comments_batch_optimized(
-                    comments=comments_df.to_dict("records"),
-                    text_field="comment_text_display",
-                    batch_size=10,
-                    rate_limit_delay=2.0,
-                )
+            stage_pipeline = StagePipeline(
+                stages, queue_size=PIPELINE_QUEUE_SIZE, metric_labels={"keyword": keyword}
             )
-
-            # sentiment_score를 comments_df에 추가
-            comments_df = pd.DataFrame(comments_with_sentiment)
-            print(
-                f"Sentiment analysis completed: {comments_df['sentiment_score'].notna().sum()} comments analyzed"
+            items = stage_pipeline.run(
+                self._iter_filtered_videos(keyword, region_code, max_videos, since, category, raw_holder,
+                                           save_raw=db_connected)
             )
-        else:
-            if analyze_sentiment:
-                print()
-                print("[Step 2.5/5] Skipping sentiment analysis (no comments)")
 
-        # Step 3: 댓글 요약 (비디오별)
-        if summarize_comments and len(comments_df) > 0:
             print()
-            print("[Step 3/5] Summarizing comments (per video)...")
-
-            comment_summaries = []
-
-            for video_id in videos_df["video_id"]:
-                video_comments = comments_df[comments_df["video_id"] == video_id]
-
-                if len(video_comments) == 0:
-                    continue
-
-                print(
-                    f"  Summarizing comments for video: {video_id} ({len(video_comments)} comments)"
-                )
-
-                # 댓글을 딕셔너리 리스트로 변환
-                comments_list = video_comments.to_dict("records")
-
-                # 요약 생성
-                summary = self.comment_summarizer.summarize_comments_for_video(
-                    comments_list
-                )
-                summary["video_id"] = video_id
-
-                comment_summaries.append(summary)
-                time.sleep(2)  # OpenAI API rate limit
-
-                # 10개마다 추가 대기
-                if len(comment_summaries) % 10 == 0:
-                    print(
-                        f"  >>> Processed {len(comment_summaries)} videos, waiting 10 seconds..."
-                    )
-                    time.sleep(10)
-
-            # 댓글 요약 데이터프레임
-            comment_summaries_df = pd.DataFrame(comment_summaries)
+            stage_pipeline.print_summary()
+
+            # 댓글 단계에서 할당량이 모두 소진되면 남은 비디오의 댓글이 빠졌으므로 키워드를 실패로 처리
+            # (이미 저장된 비디오/raw 행은 남고, 다음 실행에서 같은 구간을 다시 수집)
+            for stage_name, sequence, error in stage_pipeline.errors:
+                if isinstance(error, QuotaExhaustedError):
+                    raise error
+
+            # Raw 데이터는 검색 배치마다 저장됨 (필터링 전 모든 데이터)
+            if db_connected and raw_holder.get("raw_rows"):
+                print(f"  [OK] Saved {raw_holder.get('raw_saved', 0)} raw videos (all collected) to PostgreSQL")
+        finally:
+            # 검색/단계 예외(예: QuotaExhaustedError)가 나도 풀 연결 반환
+            if db_connected:
+                self.db_manager.disconnect()
 
-            # comment_text_summary 컬럼 생성 (data_structure.txt 기준)
-            comment_summaries_df["comment_text_summary"] = comment_summaries_df[
-                "summary"
-            ]
+        if not items:
+            print("No videos found!")
+            return None, None
 
-            # 영상 데이터와 병합
-            videos_df = videos_df.merge(
-                comment_summaries_df[
-                    [
-                        "video_id",
-                        "comment_text_summary",
-                        "key_themes",
-                        "sentiment_summary",
-                    ]
-                ],
-                on="video_id",
-                how="left",
-                suffixes=("", "_comments"),
-            )
+        videos_df = pd.DataFrame([item["video"] for item in items])
+        comments_data = [comment for item in items for comment in item["comments"]]
+        comments_df = pd.DataFrame(comments_data)
 
-            print(f"Summarized comments for {len(comment_summaries)} videos")
-        else:
-            print()
-            print("[Step 3/5] Skipping comment summarization...")
+        print(f"Processed {len(videos_df)} filtered videos, {len(comments_df)} comments")
 
-        # Step 4: 댓글 데이터 저장 및 영상 업데이트
+        # Step 4: 파일 저장
         print()
-        print("[Step 4/5] Saving comments and updating videos with summaries...")
+        print("[Step 4/4] Saving output files...")
 
         # 4-1: API 원본 데이터 저장 (raw_data)
         if self.save_raw_data:
@@ -355,10 +503,10 @@ class YouTubePipeline:
                 "keyword": keyword,
                 "region_code": region_code,
                 "created_at": timestamp,
-                "videos": video_data,  # API에서 받은 원본 데이터
+                "videos": [item["video"] for item in items],  # API에서 받은 원본 데이터
                 "comments": comments_data,  # API에서 받은 원본 데이터
                 "metadata": {
-                    "total_videos": len(video_data),
+                    "total_videos": len(items),
                     "total_comments": len(comments_data),
                     "max_videos": max_videos,
                     "max_comments_per_video": max_comments_per_video,
@@ -370,51 +518,15 @@ class YouTubePipeline:
 
             print(f"  Raw data saved: {raw_data_file}")
 
-        # videos_final: data_structure.txt 기준 컬럼 선택
-        video_columns = [
-            "video_id",
-            "keyword",
-            "title",
-            "description",
-            "published_at",
-            "channel_country",
-            "channel_custom_url",
-            "channel_subscriber_count",
-            "channel_video_count",
-            "view_count",
-            "like_count",
-            "comment_count",
-            "category_id",
-            "engagement_rate",
-            "reviewed_brand",
-            "reviewed_series",
-            "reviewed_item",
-            "product_sentiment_score",
-            "comment_text_summary",
-        ]
-
-        # 존재하는 컬럼만 선택
+        # videos_final: data_structure.txt 기준 컬럼 선택 (존재하는 컬럼만)
         available_video_cols = [
-            col for col in video_columns if col in videos_df.columns
+            col for col in VIDEO_COLUMNS if col in videos_df.columns
         ]
         videos_final = videos_df[available_video_cols].copy()
 
-        # comments_final: data_structure.txt 기준 컬럼 선택
-        comment_columns = [
-            "video_id",
-            "comment_id",
-            "comment_type",
-            "parent_comment_id",
-            "comment_text_display",
-            "like_count",
-            "reply_count",
-            "published_at",
-            "sentiment_score",
-        ]
-
-        # 존재하는 컬럼만 선택
+        # comments_final: data_structure.txt 기준 컬럼 선택 (존재하는 컬럼만)
         available_comment_cols = [
-            col for col in comment_columns if col in comments_df.columns
+            col for col in COMMENT_COLUMNS if col in comments_df.columns
         ]
         comments_final = comments_df[available_comment_cols].copy()
 
@@ -437,25 +549,6 @@ class YouTubePipeline:
         else:
             print(f"  CSV saving disabled (save_csv=False)")
 
-        # 4-3: PostgreSQL에 저장 (댓글 및 영상 업데이트)
-        if self.use_database and self.db_manager:
-            if self.db_manager.connect():
-                # 댓글 삽입
-                comment_count = self.db_manager.insert_comments(comments_final)
-
-                # 영상 업데이트 (comment_text_summary 포함)
-                video_count = self.db_manager.insert_videos(videos_final)
-
-                print(f"  [OK] Updated PostgreSQL:")
-                print(f"    - {video_count} videos updated (with comment summaries)")
-                print(f"    - {comment_count} comments inserted")
-
-                self.db_manager.disconnect()
-            else:
-                print("  [WARNING] Failed to connect to database")
-        else:
-            print("  Database storage is disabled")
-
         print()
         print("=" * 80)
         print("Pipeline completed successfully!")
@@ -527,6 +620,25 @@ def main():
         help="댓글 감정 분석 수행 (OpenAI 사용, 비용 발생 주의)",
     )
 
+    parser.add_argument(
+        "--expand-replies",
+        action="store_true",
+        help="답글이 많은 댓글 스레드의 답글 전체 수집 (comments.list, 스레드 페이지당 1 unit)",
+    )
+
+    parser.add_argument(
+        "--report",
+        type=str,
+        default=None,
+        help="실행 메트릭 JSON 리포트 경로 (기본: data/run_reports/pipeline_<timestamp>.json)",
+    )
+
+    parser.add_argument(
+        "--metrics-summary",
+        action="store_true",
+        help="실행 메트릭 요약 표 출력 (단계별 시간, API 호출, 토큰, 저장 행 수, 캐시 적중)",
+    )
+
     args = parser.parse_args()
 
     # 파이프라인 실행
@@ -541,8 +653,20 @@ def main():
         region_code=args.region,
         summarize_comments=not args.no_comment_summary,
         analyze_sentiment=args.analyze_sentiment,
+        expand_replies=args.expand_replies,
     )
 
+    # 실행 메트릭 리포트
+    metrics = get_run_metrics()
+    report_path = metrics.write_report(
+        args.report or default_report_path(os.path.dirname(os.path.abspath(__file__)), prefix="pipeline"),
+        extra={"keyword": args.keyword, "max_videos": args.max_videos, "max_comments": args.max_comments},
+    )
+    print(f"Run report saved: {report_path}")
+    if args.metrics_summary:
+        print()
+        metrics.print_summary()
+
 
 if __name__ == "__main__":
     main()
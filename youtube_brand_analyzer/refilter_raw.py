@@ -0,0 +1,165 @@
+"""
+Bulk Re-filter of youtube_videos_raw
+
+Re-evaluates engagement_rate and the quality filter (category, engagement, channel country,
+channel size) for rows already stored in youtube_videos_raw, using the same vectorized
+filter plan as collection. Useful after changing QUALITY_FILTER_THRESHOLDS in config/settings.py
+or to try a different threshold without calling the API.
+
+Only rows whose result changed are written back. Rows that failed the video stage during
+collection have no channel data (their channel was never fetched); they cannot be judged on
+the channel criteria, so they are reported and left unchanged.
+
+Usage:
+    python refilter_raw.py --dry-run                        # Show per-criterion counts only
+    python refilter_raw.py --keyword "Samsung TV"           # Re-filter one keyword's raw rows
+    python refilter_raw.py --min-engagement-rate 1.5 --dry-run
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(1, os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+from datetime import datetime
+from collectors.quality_filter import build_quality_filter_plan
+from config.db_manager import YouTubeDBManager
+
+
+class RawRefilter:
+    """Re-evaluate the quality filter over stored youtube_videos_raw rows"""
+
+    def __init__(self, keyword=None, limit=None, dry_run=False, thresholds=None):
+        """
+        Initialize raw re-filter
+
+        Args:
+            keyword (str): Only re-filter rows of this keyword (None for all keywords)
+            limit (int): Maximum number of rows (most recently stored first)
+            dry_run (bool): If True, only report what would change
+            thresholds (dict): QUALITY_FILTER_THRESHOLDS overrides
+        """
+        self.keyword = keyword
+        self.limit = limit
+        self.dry_run = dry_run
+        self.filter_plan = build_quality_filter_plan(**(thresholds or {}))
+        self.db_manager = YouTubeDBManager()
+
+    @staticmethod
+    def changed_rows(before_df, after_df):
+        """
+        Rows whose engagement_rate, pass/fail or fail reason differ from the stored values
+
+        Args:
+            before_df (pd.DataFrame): Stored rows
+            after_df (pd.DataFrame): Re-evaluated rows (same index)
+
+        Returns:
+            pd.DataFrame: Changed rows of after_df
+        """
+        rate_changed = (before_df['engagement_rate'].fillna(-1).round(4)
+                        != after_df['engagement_rate'].round(4))
+        passed_changed = before_df['quality_filter_passed'].astype('boolean') != after_df['quality_filter_passed']
+        reason_changed = before_df['filter_fail_reason'].fillna('') != after_df['filter_fail_reason'].fillna('')
+        return after_df[rate_changed | passed_changed.fillna(True) | reason_changed]
+
+    def run(self):
+        """Run a bulk re-filter"""
+        print("="*80)
+        print("youtube_videos_raw Quality Re-filter")
+        print("="*80)
+        print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Keyword: {self.keyword or 'all keywords'}")
+        print(f"Limit: {self.limit or 'none'}")
+        print(f"Dry run: {self.dry_run}")
+        print("Thresholds:")
+        for name, value in self.filter_plan.thresholds.items():
+            print(f"  - {name}: {value}")
+        print("="*80)
+        print()
+
+        if not self.db_manager.connect():
+            print("Failed to connect to database")
+            return 0
+
+        try:
+            raw_df = self.db_manager.get_raw_videos(keyword=self.keyword, limit=self.limit)
+            print(f"Loaded {len(raw_df)} raw rows")
+            if raw_df.empty:
+                return 0
+
+            result_df = self.filter_plan.evaluate(raw_df)
+            # NA = passes the video stage now but has no channel data to judge the channel stage
+            unknown = result_df['quality_filter_passed'].isna()
+            changed_df = self.changed_rows(raw_df[~unknown], result_df[~unknown])
+
+            passed = int(result_df['quality_filter_passed'].sum())
+            previously_passed = int(raw_df['quality_filter_passed'].fillna(False).astype(bool).sum())
+
+            print("\nFilter results:")
+            self.filter_plan.print_summary()
+            print(f"  Passed: {passed}/{len(result_df)} (stored: {previously_passed})")
+            print(f"  Rows with a changed result: {len(changed_df)}")
+            if unknown.any():
+                print(f"  Skipped (no channel data, re-collect to evaluate): {int(unknown.sum())}")
+
+            if self.dry_run:
+                print("\n[DRY RUN] Exiting without updating youtube_videos_raw")
+                return 0
+
+            updated = self.db_manager.update_raw_filter_results(changed_df)
+            print(f"\nCompleted at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            return updated
+
+        finally:
+            self.db_manager.disconnect()
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Re-evaluate the quality filter over rows stored in youtube_videos_raw',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Show how the current thresholds classify every stored raw row
+  python refilter_raw.py --dry-run
+
+  # Apply a lower engagement threshold to one keyword and write the results back
+  python refilter_raw.py --keyword "Samsung TV" --min-engagement-rate 1.5
+        """
+    )
+
+    parser.add_argument('--keyword', type=str, default=None, help='Only re-filter rows stored for this keyword')
+    parser.add_argument('--limit', type=int, default=None, help='Maximum number of rows (most recent first)')
+    parser.add_argument('--dry-run', action='store_true', help='Only report counts; do not update the table')
+
+    parser.add_argument('--category', type=str, default=None, help='Override target_category')
+    parser.add_argument('--channel-country', type=str, default=None, help='Override target_channel_country')
+    parser.add_argument('--min-subscriber-count', type=int, default=None, help='Override min_subscriber_count')
+    parser.add_argument('--min-channel-total-views', type=int, default=None,
+                        help='Override min_channel_total_views')
+    parser.add_argument('--min-engagement-rate', type=float, default=None, help='Override min_engagement_rate (%%)')
+
+    args = parser.parse_args()
+
+    overrides = {
+        'target_category': args.category,
+        'target_channel_country': args.channel_country,
+        'min_subscriber_count': args.min_subscriber_count,
+        'min_channel_total_views': args.min_channel_total_views,
+        'min_engagement_rate': args.min_engagement_rate,
+    }
+
+    refilter = RawRefilter(
+        keyword=args.keyword,
+        limit=args.limit,
+        dry_run=args.dry_run,
+        thresholds={name: value for name, value in overrides.items() if value is not None}
+    )
+    refilter.run()
+
+
+if __name__ == "__main__":
+    main()
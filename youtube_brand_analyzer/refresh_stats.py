@@ -0,0 +1,207 @@
+"""
+Stats-only Refresh of Known YouTube Videos
+
+Takes the videos already stored in youtube_videos, fetches their current view/like/comment
+counts with videos().list(part=statistics) (50 videos per call = 1 quota unit) and appends
+one snapshot row per video to youtube_videos_raw. A full search run costs 100 units per
+search page; this tracks thousands of videos per day for a few hundred units.
+
+Usage:
+    python refresh_stats.py                         # Snapshot every stored video
+    python refresh_stats.py --keyword "Samsung TV"  # Only one keyword's videos
+    python refresh_stats.py --max-age-days 90 --limit 5000
+    python refresh_stats.py --dry-run               # Show how many videos/units it would take
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(1, os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import math
+import pandas as pd
+from datetime import datetime
+from collectors.youtube_api import YouTubeAnalyzer
+from config.db_manager import YouTubeDBManager
+from collectors.quality_filter import compute_engagement_rates
+
+
+class StatsRefresher:
+    """Snapshot statistics of stored videos into youtube_videos_raw"""
+
+    def __init__(self, keyword=None, max_age_days=None, limit=None, dry_run=False, update_videos=True):
+        """
+        Initialize stats refresher
+
+        Args:
+            keyword (str): Only refresh videos of this keyword (None for all keywords)
+            max_age_days (int): Only refresh videos published within this many days
+            limit (int): Maximum number of videos to refresh (most recently published first)
+            dry_run (bool): If True, only show what would be refreshed
+            update_videos (bool): Also write the latest counts back to youtube_videos
+        """
+        self.keyword = keyword
+        self.max_age_days = max_age_days
+        self.limit = limit
+        self.dry_run = dry_run
+        self.update_videos = update_videos
+        self.db_manager = YouTubeDBManager()
+
+    def build_snapshots(self, targets, statistics, snapshot_time):
+        """
+        Merge stored video metadata with fresh statistics into youtube_videos_raw rows
+
+        Args:
+            targets (list): Rows from YouTubeDBManager.get_snapshot_targets()
+            statistics (list): Rows from YouTubeAnalyzer.get_video_stat_snapshots()
+            snapshot_time (datetime): created_at shared by every row of this snapshot
+
+        Returns:
+            list: Snapshot rows for YouTubeDBManager.insert_video_snapshots()
+        """
+        targets_by_id = {target['video_id']: target for target in targets}
+        engagement_rates = compute_engagement_rates(pd.DataFrame(statistics)) if statistics else []
+        snapshots = []
+
+        for stats, engagement_rate in zip(statistics, engagement_rates):
+            target = targets_by_id.get(stats['video_id'])
+            if target is None:
+                continue
+
+            snapshots.append({
+                **target,
+                'view_count': stats['view_count'],
+                'like_count': stats['like_count'],
+                'comment_count': stats['comment_count'],
+                'engagement_rate': float(engagement_rate),
+                # youtube_videos only holds videos that passed the quality filter
+                'quality_filter_passed': True,
+                'filter_fail_reason': None,
+                'created_at': snapshot_time,
+            })
+
+        return snapshots
+
+    def run(self):
+        """Run a stats-only refresh"""
+        print("="*80)
+        print("YouTube Statistics Snapshot")
+        print("="*80)
+        print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Keyword: {self.keyword or 'all keywords'}")
+        print(f"Published within: {str(self.max_age_days) + ' days' if self.max_age_days else 'any time'}")
+        print(f"Limit: {self.limit or 'none'}")
+        print(f"Dry run: {self.dry_run}")
+        print("="*80)
+        print()
+
+        if not self.db_manager.connect():
+            print("Failed to connect to database")
+            return 0
+
+        try:
+            targets = self.db_manager.get_snapshot_targets(
+                keyword=self.keyword, max_age_days=self.max_age_days, limit=self.limit
+            )
+            estimated_units = math.ceil(len(targets) / 50)
+            print(f"Found {len(targets)} stored videos (about {estimated_units} quota units)")
+
+            if not targets or self.dry_run:
+                if self.dry_run:
+                    print("\n[DRY RUN] Exiting without calling the API")
+                return 0
+
+            youtube_api = YouTubeAnalyzer()
+            snapshot_time = datetime.now().replace(microsecond=0)
+            statistics = youtube_api.get_video_stat_snapshots([target['video_id'] for target in targets])
+
+            snapshots = self.build_snapshots(targets, statistics, snapshot_time)
+            inserted = self.db_manager.insert_video_snapshots(snapshots)
+
+            if self.update_videos and statistics:
+                self.db_manager.update_video_statistics(statistics)
+
+            missing = len(targets) - len(statistics)
+
+            print("\n" + "="*80)
+            print("Snapshot Summary")
+            print("="*80)
+            print(f"Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"Snapshot time: {snapshot_time}")
+            print(f"Snapshots appended: {inserted}/{len(targets)}")
+            if missing > 0:
+                print(f"Not returned by the API (deleted/private or quota exhausted): {missing}")
+            print(f"API requests: {youtube_api.request_count}")
+            print("="*80)
+            return inserted
+
+        finally:
+            self.db_manager.disconnect()
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Append statistics snapshots of stored YouTube videos to youtube_videos_raw',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Snapshot every stored video (1 quota unit per 50 videos)
+  python refresh_stats.py
+
+  # Only one keyword, only videos from the last 90 days
+  python refresh_stats.py --keyword "Samsung TV" --max-age-days 90
+
+  # Show how many videos and quota units a refresh would take
+  python refresh_stats.py --dry-run
+        """
+    )
+
+    parser.add_argument(
+        '--keyword',
+        type=str,
+        default=None,
+        help='Only refresh videos stored for this keyword'
+    )
+
+    parser.add_argument(
+        '--max-age-days',
+        type=int,
+        default=None,
+        help='Only refresh videos published within this many days'
+    )
+
+    parser.add_argument(
+        '--limit',
+        type=int,
+        default=None,
+        help='Maximum number of videos to refresh (most recently published first)'
+    )
+
+    parser.add_argument(
+        '--no-update-videos',
+        action='store_true',
+        help='Only append snapshots; leave the counts in youtube_videos unchanged'
+    )
+
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Show how many videos would be refreshed without calling the API'
+    )
+
+    args = parser.parse_args()
+
+    refresher = StatsRefresher(
+        keyword=args.keyword,
+        max_age_days=args.max_age_days,
+        limit=args.limit,
+        dry_run=args.dry_run,
+        update_videos=not args.no_update_videos
+    )
+    refresher.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,6 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 import psycopg2
 from config.secrets import POSTGRES_HOST, POSTGRES_PORT, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_DB
 from analyzers.video_content_analyzer import VideoContentAnalyzer
-import time
 
 def update_existing_videos():
     """Update all existing videos with brand/series/sentiment data"""
@@ -93,14 +92,6 @@ def update_existing_videos():
 
             print(f'  [OK] Updated: brand={brand_info["reviewed_brand"]}, series={brand_info["reviewed_series"]}, sentiment={sentiment_score:.2f}')
 
-            # Rate limiting
-            time.sleep(2)
-
-            # Every 10 videos, extra delay
-            if (idx + 1) % 10 == 0:
-                print(f'\n  >>> Processed {idx+1} videos, waiting 10 seconds...')
-                time.sleep(10)
-
         except Exception as e:
             print(f'  [ERROR] {str(e)[:100]}')
             conn.rollback()